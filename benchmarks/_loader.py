@@ -0,0 +1,18 @@
+"""Load pure-Python Warmlink modules without Home Assistant.
+
+The integration package __init__ imports Home Assistant, so benchmarks
+register an empty ``warmlink`` package pointing at the sources and import
+the submodules they need from it.
+"""
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "warmlink"
+
+if "warmlink" not in sys.modules:
+    package = types.ModuleType("warmlink")
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["warmlink"] = package
@@ -0,0 +1,139 @@
+"""Event-loop blocking benchmark for getDataByCode response parsing.
+
+Simulates one poll cycle of N devices (550 codes each, in 100-code chunks)
+and measures how long the event loop is blocked while the responses are
+decoded and parsed:
+
+- before: json.loads + result dict + _parsed_data/_ranges dicts on the loop
+  (previous aiohttp response.json() and coordinator parsing)
+- on-loop store: decoding and parsing into DeviceValueStore on the loop
+- executor: load_data_responses() in the default executor
+
+A heartbeat task ticks every millisecond; its lateness is the blocking time.
+
+Usage: python benchmarks/bench_loop_blocking.py [devices]
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+
+import _loader  # noqa: F401
+from warmlink.const import ALL_PROTOCOL_CODES, DATA_CHUNK_SIZE
+from warmlink.store import DeviceValueStore, json_loads, load_data_responses
+
+TICK = 0.001
+
+
+def build_bodies() -> list[bytes]:
+    """Return raw getDataByCode bodies of one device poll."""
+    bodies = []
+    for start in range(0, len(ALL_PROTOCOL_CODES), DATA_CHUNK_SIZE):
+        items = [
+            {
+                "code": code,
+                "value": f"{(start + index) % 70}.5",
+                "rangeStart": "0",
+                "rangeEnd": "70",
+            }
+            for index, code in enumerate(ALL_PROTOCOL_CODES[start:start + DATA_CHUNK_SIZE])
+        ]
+        bodies.append(
+            json.dumps({"error_msg": "Success", "objectResult": items}).encode()
+        )
+    return bodies
+
+
+def parse_before(bodies: list[bytes]) -> dict:
+    """Previous on-loop decoding and parsing."""
+    result = {}
+    for body in bodies:
+        for item in json.loads(body)["objectResult"]:
+            result[item["code"]] = {
+                "value": item["value"],
+                "range_start": item.get("rangeStart"),
+                "range_end": item.get("rangeEnd"),
+            }
+    parsed, ranges = {}, {}
+    for code, code_data in result.items():
+        try:
+            parsed[code] = float(code_data["value"])
+        except (ValueError, TypeError):
+            parsed[code] = code_data["value"]
+        if code_data["range_start"] and code_data["range_end"]:
+            ranges[code] = {
+                "min": float(code_data["range_start"]),
+                "max": float(code_data["range_end"]),
+            }
+    return {"_data": result, "_parsed_data": parsed, "_ranges": ranges}
+
+
+def parse_store(bodies: list[bytes]) -> DeviceValueStore:
+    """Decode and parse into a value store."""
+    store = DeviceValueStore()
+    chunks = [
+        (key, ALL_PROTOCOL_CODES[key:key + DATA_CHUNK_SIZE], body)
+        for key, body in zip(
+            range(0, len(ALL_PROTOCOL_CODES), DATA_CHUNK_SIZE), bodies, strict=True
+        )
+    ]
+    load_data_responses(store, chunks, "bench")
+    return store
+
+
+async def heartbeat(stop: asyncio.Event, lateness: list[float]) -> None:
+    """Record how late each tick fires."""
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK
+        await asyncio.sleep(TICK)
+        lateness.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run(mode: str, bodies: list[bytes], devices: int) -> tuple[float, float, float]:
+    """Return (wall time, max blocking, total blocking) in ms."""
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    lateness: list[float] = []
+    ticker = asyncio.create_task(heartbeat(stop, lateness))
+    await asyncio.sleep(0.01)
+    lateness.clear()
+
+    start = time.perf_counter()
+    for _ in range(devices):
+        if mode == "before":
+            parse_before(bodies)
+        elif mode == "on-loop store":
+            parse_store(bodies)
+        else:
+            await loop.run_in_executor(None, parse_store, bodies)
+        # Each device's chunks arrive as separate responses
+        await asyncio.sleep(0)
+    wall = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    return wall * 1000, max(lateness, default=0) * 1000, sum(lateness) * 1000
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    devices = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    bodies = build_bodies()
+    print(
+        f"{devices} devices x {len(bodies)} chunks "
+        f"({sum(map(len, bodies)) / 1024:.0f} KiB/device), decoder: {json_loads.__module__}"
+    )
+    # Warm up the executor and caches
+    await run("executor", bodies, 2)
+    for mode in ("before", "on-loop store", "executor"):
+        wall, worst, total = await run(mode, bodies, devices)
+        print(
+            f"{mode:14} wall {wall:7.1f} ms  max block {worst:6.2f} ms  "
+            f"total block {total:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,129 @@
+"""Import-time and memory benchmark of the Modbus parameter table.
+
+Compares loading modbus_params.py in two layouts, both rendered from the
+current table so they hold the same parameters:
+
+- dicts: the previous layout, one dict literal per parameter
+- records: the precompiled record tuples wrapped in ParamTable
+
+Each layout is compiled once and marshalled like a .pyc; a load is
+unmarshal + module body execution. Memory is what the module namespace
+keeps alive (tracemalloc), for records also after the lookup was built by
+a first query.
+
+Finally reports -X importtime of the pure-Python integration modules in a
+fresh interpreter.
+
+Usage: python benchmarks/bench_param_table.py [loads]
+"""
+from __future__ import annotations
+
+import marshal
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import _loader
+from warmlink.params import FIELDS
+
+SOURCE = _loader.PACKAGE_DIR / "modbus_params.py"
+TABLES = ("WRITABLE", "SENSOR", "SWITCH", "SELECT")
+
+
+def render_dicts(namespace: dict) -> str:
+    """Return the previous dict-literal layout of the given tables."""
+    lines = []
+    for table in TABLES:
+        lines.append(f"{table}_PARAMS = {{")
+        for record in namespace[f"{table}_RECORDS"]:
+            parts = [
+                f"{field!r}: {value!r}"
+                for field, value in zip(FIELDS, record[1:], strict=True)
+                if value is not None and value != ""
+            ]
+            lines.append(f"    {record[0]!r}: {{{', '.join(parts)}}},")
+        lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def compiled(source: str) -> bytes:
+    """Return a marshalled code object, as stored in a .pyc."""
+    return marshal.dumps(compile(source, str(SOURCE), "exec"))
+
+
+def load(pyc: bytes) -> dict:
+    """Unmarshal and execute a module body, returning its namespace."""
+    namespace = {"__name__": "warmlink._bench", "__package__": "warmlink"}
+    exec(marshal.loads(pyc), namespace)  # noqa: S102
+    return namespace
+
+
+def load_time(pyc: bytes, loads: int) -> float:
+    """Return average seconds per load."""
+    started = time.perf_counter()
+    for _ in range(loads):
+        load(pyc)
+    return (time.perf_counter() - started) / loads
+
+
+def kept_memory(pyc: bytes, query: bool = False) -> int:
+    """Return bytes kept alive by a loaded module (optionally after a lookup)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    namespace = load(pyc)
+    if query:
+        for table in TABLES:
+            namespace[f"{table}_PARAMS"].get("R01")
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del namespace
+    return after - before
+
+
+def import_times() -> str:
+    """Return -X importtime lines of the integration modules."""
+    code = (
+        f"import sys; sys.path.insert(0, {str(Path(__file__).parent)!r}); "
+        "import _loader; import warmlink.const, warmlink.limits, warmlink.store"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return "\n".join(
+        line for line in result.stderr.splitlines() if "warmlink" in line
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    loads = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    records_source = SOURCE.read_text(encoding="utf-8")
+    records_pyc = compiled(records_source)
+    dicts_pyc = compiled(render_dicts(load(records_pyc)))
+
+    print(f"{loads} loads per layout")
+    dicts_time = load_time(dicts_pyc, loads)
+    records_time = load_time(records_pyc, loads)
+    print(f"dicts:   {dicts_time * 1000:7.3f} ms/load  pyc {len(dicts_pyc) / 1024:6.1f} KiB")
+    print(f"records: {records_time * 1000:7.3f} ms/load  pyc {len(records_pyc) / 1024:6.1f} KiB")
+    print(f"load time ratio: {dicts_time / records_time:.1f}x")
+
+    dicts_memory = kept_memory(dicts_pyc)
+    records_memory = kept_memory(records_pyc)
+    queried_memory = kept_memory(records_pyc, query=True)
+    print(f"dicts:   {dicts_memory / 1024:7.1f} KiB kept")
+    print(f"records: {records_memory / 1024:7.1f} KiB kept "
+          f"({queried_memory / 1024:.1f} KiB after first lookup)")
+    print(f"memory ratio: {dicts_memory / queried_memory:.1f}x")
+
+    print("\nimporttime (us: self | cumulative | module)")
+    print(import_times())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Recorder load model: rows per hour before and after the classification.
+
+Counts the recorder rows the Modbus-table entities of one device produce
+per hour:
+
+- states: one row per state change of an enabled entity. Sensors with a
+  physical unit (temperatures, frequencies, currents, ...) are assumed to
+  change on every poll, other sensors STATIC_CHANGES_PER_HOUR times and
+  controls CONTROL_CHANGES_PER_HOUR times an hour.
+- statistics: 12 five-minute plus 1 hourly row per enabled sensor with a
+  state class, whether its value changes or not.
+
+before: every parameter enabled, every dynamic sensor a measurement and
+the hand-described sensors (SENSOR_DESCRIPTIONS, read from sensor.py
+without importing Home Assistant) as written (previous behaviour); after:
+classification.classify() with the built-in defaults, applied to the
+hand-described sensors of Modbus-table codes as sensor.py does. The
+locally computed sensors (LOCAL_SENSORS) are the same in both.
+
+Usage: python benchmarks/bench_recorder_rows.py [devices] [poll seconds]
+"""
+from __future__ import annotations
+
+import ast
+import sys
+
+import _loader  # noqa: F401
+from warmlink.classification import classify
+from warmlink.const import (
+    ALL_SELECT_PARAMS,
+    ALL_SENSOR_PARAMS,
+    ALL_SWITCH_PARAMS,
+    ALL_WRITABLE_PARAMS,
+)
+
+VOLATILE_UNITS = frozenset({"°C", "Hz", "A", "V", "kW", "bar", "L/min", "rpm", "%"})
+STATIC_CHANGES_PER_HOUR = 0.5
+CONTROL_CHANGES_PER_HOUR = 0.1
+STATISTICS_ROWS_PER_HOUR = 12 + 1
+
+# Locally computed sensors of sensor.py: (entities, changing every poll,
+# with a state class) of derived, energy, cycle and connection sensors,
+# fault log, write latency and poll cache
+LOCAL_SENSORS = (
+    (3, True, 3),
+    (3, True, 3),
+    (10, False, 8),
+    (3, False, 2),
+    (1, False, 0),
+    (1, False, 1),
+    (1, True, 1),
+)
+
+
+def described_sensors() -> dict[str, tuple[bool, bool, bool]]:
+    """Return key -> (state class, measurement, enabled) of SENSOR_DESCRIPTIONS."""
+    path = _loader.PACKAGE_DIR / "sensor.py"
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for node in tree.body:
+        target = getattr(node, "target", None)
+        if isinstance(target, ast.Name) and target.id == "SENSOR_DESCRIPTIONS":
+            break
+    else:
+        raise LookupError("SENSOR_DESCRIPTIONS not found in sensor.py")
+    result = {}
+    for call in node.value.elts:
+        keywords = {keyword.arg: ast.unparse(keyword.value) for keyword in call.keywords}
+        state_class = keywords.get("state_class", "None")
+        result[ast.literal_eval(keywords["key"])] = (
+            state_class != "None",
+            state_class.endswith("MEASUREMENT"),
+            keywords.get("entity_registry_enabled_default") != "False",
+        )
+    return result
+
+
+def sensor_changes(info, polls_per_hour: float) -> float:
+    """Return assumed state changes per hour of a sensor."""
+    if info.get("data_type") == "TEMP" or info.get("unit", "") in VOLATILE_UNITS:
+        return polls_per_hour
+    return STATIC_CHANGES_PER_HOUR
+
+
+def count(polls_per_hour: float, classified: bool) -> dict[str, tuple[int, float, float]]:
+    """Return kind -> (enabled entities, state rows/h, statistics rows/h)."""
+    result = {}
+    enabled = 0
+    states = statistics = 0.0
+    described = described_sensors()
+    for code, (has_state_class, measurement, enabled_default) in described.items():
+        info = ALL_SENSOR_PARAMS.get(code)
+        if info is not None and classified:
+            classification = classify(code, info.get("category", "other"), False)
+            enabled_default = classification.enabled_default
+            has_statistics = has_state_class and classification.statistics
+        else:
+            enabled_default = enabled_default or not classified
+            has_statistics = has_state_class
+        if not enabled_default:
+            continue
+        enabled += 1
+        if info is not None:
+            states += sensor_changes(info, polls_per_hour)
+        else:
+            states += polls_per_hour if measurement else STATIC_CHANGES_PER_HOUR
+        if has_statistics:
+            statistics += STATISTICS_ROWS_PER_HOUR
+    for code, info in ALL_SENSOR_PARAMS.items():
+        if code in described:
+            continue
+        if classified:
+            classification = classify(code, info.get("category", "other"), False)
+            if not classification.enabled_default:
+                continue
+            has_statistics = classification.statistics
+        else:
+            has_statistics = True
+        enabled += 1
+        states += sensor_changes(info, polls_per_hour)
+        if has_statistics:
+            statistics += STATISTICS_ROWS_PER_HOUR
+    result["sensor"] = (enabled, states, statistics)
+    result["local"] = (
+        sum(entities for entities, _, _ in LOCAL_SENSORS),
+        sum(
+            entities * (polls_per_hour if volatile else STATIC_CHANGES_PER_HOUR)
+            for entities, volatile, _ in LOCAL_SENSORS
+        ),
+        sum(with_statistics for _, _, with_statistics in LOCAL_SENSORS) * STATISTICS_ROWS_PER_HOUR,
+    )
+
+    for kind, params in (
+        ("number", ALL_WRITABLE_PARAMS),
+        ("switch", ALL_SWITCH_PARAMS),
+        ("select", ALL_SELECT_PARAMS),
+    ):
+        enabled = sum(
+            1
+            for code, info in params.items()
+            if not classified
+            or classify(code, info.get("category", "other"), True).enabled_default
+        )
+        result[kind] = (enabled, enabled * CONTROL_CHANGES_PER_HOUR, 0.0)
+    return result
+
+
+def report(name: str, counts: dict[str, tuple[int, float, float]], devices: int) -> float:
+    """Print a table and return total rows per hour."""
+    print(f"{name}:")
+    total = 0.0
+    for kind, (enabled, states, statistics) in counts.items():
+        rows = (states + statistics) * devices
+        total += rows
+        print(
+            f"  {kind:7s} {enabled:4d} enabled  "
+            f"{states * devices:9.0f} state + {statistics * devices:7.0f} statistics rows/h"
+        )
+    print(f"  total   {total:9.0f} rows/h ({total * 24 * 30 / 1e6:.1f} M rows/month)")
+    return total
+
+
+def main() -> None:
+    """Run the model."""
+    devices = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    poll_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 60
+    polls_per_hour = 3600 / poll_seconds
+    print(f"{devices} device(s), poll every {poll_seconds:.0f} s")
+    before = report("before", count(polls_per_hour, classified=False), devices)
+    after = report("after", count(polls_per_hour, classified=True), devices)
+    print(f"reduction: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
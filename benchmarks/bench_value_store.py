@@ -0,0 +1,87 @@
+"""Memory benchmark: dict-of-dicts device data vs DeviceValueStore.
+
+Builds a synthetic getDataByCode result covering all protocol codes and
+measures (tracemalloc) what the parsed data of N devices keeps alive:
+
+- dicts: the previous layout, ``_parsed_data`` (code -> float) plus
+  ``_ranges`` (code -> {"min", "max"}) per device
+- store: one DeviceValueStore per device plus its range dict of
+  (min, max) tuples (as held by RangeCache)
+
+Usage: python benchmarks/bench_value_store.py [devices]
+"""
+from __future__ import annotations
+
+import sys
+import tracemalloc
+
+import _loader  # noqa: F401
+from warmlink.const import ALL_PROTOCOL_CODES
+from warmlink.store import DeviceValueStore
+
+
+def build_response() -> dict[str, dict[str, str]]:
+    """Return a result shaped like WarmLinkAPI.get_device_data."""
+    return {
+        code: {
+            "value": f"{index % 70}.5",
+            "range_start": "0" if index % 3 else "",
+            "range_end": "70" if index % 3 else "",
+        }
+        for index, code in enumerate(ALL_PROTOCOL_CODES)
+    }
+
+
+def parse_dicts(data: dict[str, dict[str, str]]) -> dict[str, dict]:
+    """Previous coordinator parsing into nested dicts."""
+    parsed: dict[str, float | str] = {}
+    ranges: dict[str, dict[str, float]] = {}
+    for code, code_data in data.items():
+        value = code_data.get("value")
+        if value is not None:
+            try:
+                parsed[code] = float(value)
+            except (ValueError, TypeError):
+                parsed[code] = value
+        range_start = code_data.get("range_start")
+        range_end = code_data.get("range_end")
+        if range_start and range_end:
+            ranges[code] = {"min": float(range_start), "max": float(range_end)}
+    return {"_parsed_data": parsed, "_ranges": ranges}
+
+
+def parse_store(
+    data: dict[str, dict[str, str]]
+) -> tuple[DeviceValueStore, dict[str, tuple[float, float]]]:
+    """Parse into a value store and a range dict."""
+    store = DeviceValueStore()
+    ranges: dict[str, tuple[float, float]] = {}
+    store.update_from_data(data, ranges)
+    return store, ranges
+
+
+def measure(parse, data, devices: int) -> int:
+    """Return bytes kept alive by parsing data for the given devices."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [parse(data) for _ in range(devices)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main() -> None:
+    """Run the benchmark."""
+    devices = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    data = build_response()
+    print(f"{len(data)} codes per device, {devices} devices")
+    dicts = measure(parse_dicts, data, devices)
+    store = measure(parse_store, data, devices)
+    print(f"dicts: {dicts / 1024:9.1f} KiB ({dicts / devices / 1024:.1f} KiB/device)")
+    print(f"store: {store / 1024:9.1f} KiB ({store / devices / 1024:.1f} KiB/device)")
+    print(f"ratio: {dicts / store:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,57 @@
 """Warmlink Heat Pump integration for Home Assistant."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import timedelta
+from collections.abc import Callable
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN, UPDATE_INTERVAL, CONF_DEVICES
-from .api import WarmLinkAPI
+from .const import (
+    DOMAIN,
+    UPDATE_INTERVAL,
+    BACKFILL_INTERVAL,
+    CONF_BACKFILL_DAYS,
+    CONF_PROBE_MAX_AGE,
+    CONF_CATEGORY_CLASSES,
+    CONF_DEADBAND,
+    CONF_DEVICES,
+    CONF_LANGUAGE,
+    CONF_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_OFFLOAD_PARSING,
+    CONF_REPORT_MIN_INTERVAL,
+    CONF_ROLLING_WINDOWS,
+    DEFAULT_BACKFILL_DAYS,
+    DEFAULT_DEADBAND,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_OFFLOAD_PARSING,
+    DEFAULT_PROBE_MAX_AGE,
+    DEFAULT_REPORT_MIN_INTERVAL,
+    DEFAULT_ROLLING_WINDOWS,
+    DEVICE_LIST_MAX_AGE,
+    STATE_SAVE_DELAY,
+    STATE_STORAGE_KEY,
+    STATE_STORAGE_VERSION,
+    SIGNAL_DEVICES_ADDED,
+    SIGNAL_TOTALS_UPDATED,
+)
+from .api import WarmLinkAPI, WarmLinkAPIError
 from .coordinator import WarmLinkCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,6 +67,47 @@ PLATFORMS: list[Platform] = [
 ]
 
 
+def _get_intervals(entry: ConfigEntry) -> tuple[timedelta, timedelta, timedelta]:
+    """Return (base, min, max) poll intervals from entry options."""
+    options = entry.options
+    return (
+        timedelta(seconds=options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL)),
+        timedelta(seconds=options.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL)),
+        timedelta(seconds=options.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL)),
+    )
+
+
+def _get_offload_parsing(entry: ConfigEntry) -> bool:
+    """Return whether poll responses are parsed in an executor."""
+    return entry.options.get(CONF_OFFLOAD_PARSING, DEFAULT_OFFLOAD_PARSING)
+
+
+def _get_reporting(entry: ConfigEntry) -> tuple[bool, int]:
+    """Return (deadband, minimum report interval) of the sensor filter."""
+    options = entry.options
+    return (
+        options.get(CONF_DEADBAND, DEFAULT_DEADBAND),
+        options.get(CONF_REPORT_MIN_INTERVAL, DEFAULT_REPORT_MIN_INTERVAL),
+    )
+
+
+def _get_rolling_windows(entry: ConfigEntry) -> tuple[int, ...]:
+    """Return the rolling statistics windows in minutes, shortest first."""
+    windows = entry.options.get(CONF_ROLLING_WINDOWS, DEFAULT_ROLLING_WINDOWS)
+    # Stored as selector strings; the config flow validated them
+    return tuple(sorted({int(minutes) for minutes in windows}))
+
+
+def _get_probe_max_age(entry: ConfigEntry) -> int:
+    """Return the maximum age of probe-skipped data in seconds (0 = no probe)."""
+    return entry.options.get(CONF_PROBE_MAX_AGE, DEFAULT_PROBE_MAX_AGE)
+
+
+def _get_backfill_days(entry: ConfigEntry) -> int:
+    """Return the days of cloud history imported as statistics (0 = off)."""
+    return entry.options.get(CONF_BACKFILL_DAYS, DEFAULT_BACKFILL_DAYS)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Warmlink from a config entry."""
     hass.data.setdefault(DOMAIN, {})
@@ -43,32 +125,302 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Failed to login to Warmlink API: %s", ex)
         return False
 
-    # Get selected devices from config
-    selected_devices = entry.data.get(CONF_DEVICES)
+    try:
+        devices = await api.get_devices()
+    except Exception as ex:
+        raise ConfigEntryNotReady(f"Failed to get Warmlink devices: {ex}") from ex
 
-    coordinator = WarmLinkCoordinator(
-        hass,
-        api=api,
-        update_interval=timedelta(seconds=UPDATE_INTERVAL),
-        selected_devices=selected_devices,
-    )
+    state_store = _state_store(hass, entry)
+    stored_state: dict[str, Any] = await state_store.async_load() or {}
 
-    await coordinator.async_config_entry_first_refresh()
+    intervals = _get_intervals(entry)
+    offload_parsing = _get_offload_parsing(entry)
+    reporting = _get_reporting(entry)
+    rolling_windows = _get_rolling_windows(entry)
+    probe_max_age = _get_probe_max_age(entry)
+    coordinators: dict[str, WarmLinkCoordinator] = {}
+    for device_code in _selected_device_codes(entry, devices):
+        coordinators[device_code] = await _async_create_coordinator(
+            hass,
+            api,
+            device_code,
+            intervals,
+            offload_parsing,
+            reporting,
+            rolling_windows,
+            probe_max_age,
+            stored_state.get(device_code),
+        )
+
+    if coordinators and not any(
+        coordinator.last_update_success for coordinator in coordinators.values()
+    ):
+        await api.close()
+        raise ConfigEntryNotReady("No Warmlink device could be updated")
 
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
-        "coordinator": coordinator,
+        "coordinators": coordinators,
+        "language": entry.data.get(CONF_LANGUAGE, "en"),
+        "category_classes": entry.options.get(CONF_CATEGORY_CLASSES, {}),
+        "intervals": intervals,
+        "reporting": reporting,
+        "rolling_windows": rolling_windows,
+        "probe_max_age": probe_max_age,
+        "backfill_days": _get_backfill_days(entry),
+        "state_store": state_store,
     }
+    for coordinator in coordinators.values():
+        _async_track_state(entry, state_store, coordinators, coordinator)
+    hass.data[DOMAIN][entry.entry_id]["backfill"] = _async_setup_backfill(hass, entry)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
     return True
 
 
+def _selected_device_codes(
+    entry: ConfigEntry, devices: dict[str, dict[str, Any]]
+) -> list[str]:
+    """Return codes of the account devices selected in the entry (all if none)."""
+    selected_devices = entry.data.get(CONF_DEVICES)
+    if not selected_devices:
+        return list(devices)
+    return [code for code in devices if code in selected_devices]
+
+
+def _state_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the storage of the persisted device state of an entry."""
+    return Store(hass, STATE_STORAGE_VERSION, STATE_STORAGE_KEY.format(entry.entry_id))
+
+
+def _state_data(coordinators: dict[str, WarmLinkCoordinator]) -> dict[str, Any]:
+    """Return device code -> persisted state of the device."""
+    return {
+        device_code: coordinator.stored_state()
+        for device_code, coordinator in coordinators.items()
+    }
+
+
+def _async_track_state(
+    entry: ConfigEntry,
+    state_store: Store[dict[str, Any]],
+    coordinators: dict[str, WarmLinkCoordinator],
+    coordinator: WarmLinkCoordinator,
+) -> None:
+    """Save the device state (delayed) whenever the device or its totals update."""
+
+    @callback
+    def _async_schedule_save() -> None:
+        state_store.async_delay_save(
+            lambda: _state_data(coordinators), STATE_SAVE_DELAY
+        )
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_schedule_save))
+    # Energy totals change without a coordinator update
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            coordinator.hass,
+            SIGNAL_TOTALS_UPDATED.format(coordinator.device_code),
+            _async_schedule_save,
+        )
+    )
+
+
+@callback
+def _async_setup_backfill(hass: HomeAssistant, entry: ConfigEntry) -> Callable[[], None]:
+    """Import the cloud history as statistics now and every BACKFILL_INTERVAL.
+
+    Returns a callback that starts a run right away. Runs never overlap;
+    each device continues from its persisted checkpoint.
+    """
+    lock = asyncio.Lock()
+
+    async def _async_backfill() -> None:
+        if lock.locked():
+            return
+        async with lock:
+            data = hass.data[DOMAIN].get(entry.entry_id)
+            if data is None or not data["backfill_days"]:
+                return
+            coordinators: dict[str, WarmLinkCoordinator] = data["coordinators"]
+
+            @callback
+            def _async_checkpoint() -> None:
+                data["state_store"].async_delay_save(
+                    lambda: _state_data(coordinators), STATE_SAVE_DELAY
+                )
+
+            for coordinator in list(coordinators.values()):
+                await coordinator.async_backfill_statistics(
+                    data["backfill_days"], _async_checkpoint
+                )
+
+    @callback
+    def _async_start(_now: Any = None) -> None:
+        if "recorder" not in hass.config.components:
+            return
+        entry.async_create_background_task(
+            hass, _async_backfill(), f"{DOMAIN} statistics backfill {entry.entry_id}"
+        )
+
+    entry.async_on_unload(
+        async_track_time_interval(hass, _async_start, timedelta(seconds=BACKFILL_INTERVAL))
+    )
+    _async_start()
+    return _async_start
+
+
+async def _async_create_coordinator(
+    hass: HomeAssistant,
+    api: WarmLinkAPI,
+    device_code: str,
+    intervals: tuple[timedelta, timedelta, timedelta],
+    offload_parsing: bool,
+    reporting: tuple[bool, int],
+    rolling_windows: tuple[int, ...],
+    probe_max_age: int,
+    stored_state: dict[str, Any] | None = None,
+) -> WarmLinkCoordinator:
+    """Create a device coordinator and run its first refresh.
+
+    A failed first refresh does not abort setup - the device's entities
+    are created unavailable and the coordinator keeps retrying.
+    """
+    update_interval, min_update_interval, max_update_interval = intervals
+    deadband, report_min_interval = reporting
+    coordinator = WarmLinkCoordinator(
+        hass,
+        api=api,
+        device_code=device_code,
+        update_interval=update_interval,
+        min_update_interval=min_update_interval,
+        max_update_interval=max_update_interval,
+        offload_parsing=offload_parsing,
+        deadband=deadband,
+        report_min_interval=report_min_interval,
+        stored_state=stored_state,
+        rolling_windows=rolling_windows,
+        probe_max_age=probe_max_age,
+    )
+    await coordinator.async_refresh()
+    return coordinator
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running integration.
+
+    Intervals are changed on the running coordinators and device selection
+    changes only add or remove the affected devices' coordinators and
+    entities. Only language, category class and rolling window changes
+    need a full reload (entity names, categories and the rolling statistics
+    sensors are set at setup).
+    """
+    data = hass.data[DOMAIN][entry.entry_id]
+    api: WarmLinkAPI = data["api"]
+    coordinators: dict[str, WarmLinkCoordinator] = data["coordinators"]
+
+    if entry.data.get(CONF_LANGUAGE, "en") != data["language"]:
+        _LOGGER.info("Language changed, reloading Warmlink entry")
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    if entry.options.get(CONF_CATEGORY_CLASSES, {}) != data["category_classes"]:
+        _LOGGER.info("Category classes changed, reloading Warmlink entry")
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    if _get_rolling_windows(entry) != data["rolling_windows"]:
+        _LOGGER.info("Rolling statistics windows changed, reloading Warmlink entry")
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    intervals = _get_intervals(entry)
+    if intervals != data["intervals"]:
+        data["intervals"] = intervals
+        _LOGGER.info("Update interval changed to %s (min %s, max %s)", *intervals)
+        for coordinator in coordinators.values():
+            coordinator.set_intervals(*intervals)
+            # Reschedule with the new interval right away
+            await coordinator.async_request_refresh()
+
+    offload_parsing = _get_offload_parsing(entry)
+    for coordinator in coordinators.values():
+        coordinator.offload_parsing = offload_parsing
+
+    reporting = _get_reporting(entry)
+    if reporting != data["reporting"]:
+        data["reporting"] = reporting
+        _LOGGER.info("Sensor reporting changed (deadband %s, min interval %s s)", *reporting)
+        for coordinator in coordinators.values():
+            coordinator.set_reporting(*reporting)
+
+    probe_max_age = _get_probe_max_age(entry)
+    if probe_max_age != data["probe_max_age"]:
+        data["probe_max_age"] = probe_max_age
+        _LOGGER.info("Change probe maximum age changed to %s s", probe_max_age)
+        for coordinator in coordinators.values():
+            coordinator.set_probe(probe_max_age)
+
+    backfill_days = _get_backfill_days(entry)
+    if backfill_days != data["backfill_days"]:
+        data["backfill_days"] = backfill_days
+        _LOGGER.info("Statistics backfill changed to %s days", backfill_days)
+        data["backfill"]()
+
+    try:
+        devices = await api.get_devices(max_age=DEVICE_LIST_MAX_AGE)
+    except WarmLinkAPIError as ex:
+        _LOGGER.warning("Could not apply device selection: %s", ex)
+        return
+
+    previous = set(coordinators)
+    current = set(_selected_device_codes(entry, devices))
+
+    if removed := previous - current:
+        device_registry = dr.async_get(hass)
+        for device_code in removed:
+            coordinator = coordinators.pop(device_code)
+            await coordinator.async_shutdown()
+            device = device_registry.async_get_device(identifiers={(DOMAIN, device_code)})
+            if device is not None:
+                # Drops the device and its entities for this entry only
+                device_registry.async_update_device(
+                    device.id, remove_config_entry_id=entry.entry_id
+                )
+        _LOGGER.info("Removed Warmlink devices: %s", ", ".join(sorted(removed)))
+
+    if added := sorted(current - previous):
+        for device_code in added:
+            coordinators[device_code] = await _async_create_coordinator(
+                hass,
+                api,
+                device_code,
+                intervals,
+                offload_parsing,
+                reporting,
+                data["rolling_windows"],
+                probe_max_age,
+            )
+            _async_track_state(
+                entry, data["state_store"], coordinators, coordinators[device_code]
+            )
+        async_dispatcher_send(hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), added)
+        _LOGGER.info("Added Warmlink devices: %s", ", ".join(added))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data["state_store"].async_save(_state_data(data["coordinators"]))
         await data["api"].close()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted device state of a deleted config entry."""
+    await _state_store(hass, entry).async_remove()
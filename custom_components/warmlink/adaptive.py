@@ -0,0 +1,92 @@
+"""Adaptive polling interval for Warmlink heat pumps.
+
+The interval follows the live operating state of the unit:
+- Defrost / DHW disinfection (ModeState 2/3) and compressor start/stop
+  are polled at the minimum interval.
+- Fast-moving key temperatures shorten the interval.
+- Standby (Power off, or compressor idle with stable temperatures) is
+  polled at the maximum interval.
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from datetime import timedelta
+from typing import Any
+
+from .api import is_device_online, parse_temperature
+
+# ModeState values that need high resolution (0=Cool, 1=Heat, 2=Defrost, 3=Disinfect, 4=HW)
+FAST_MODE_STATES = (2, 3)
+
+# Temperatures whose rate of change drives the interval (inlet, outlet, DHW tank)
+RATE_CODES = ("T01", "T02", "T08")
+
+# Rate thresholds in K/min
+RATE_FAST = 1.0  # Poll at minimum interval
+RATE_MODERATE = 0.3  # Poll halfway between minimum and base interval
+RATE_STABLE = 0.05  # Below this an idle unit counts as standby
+
+
+class AdaptiveIntervalPolicy:
+    """Compute the next poll interval of a device from its latest data."""
+
+    def __init__(self, base: timedelta, minimum: timedelta, maximum: timedelta) -> None:
+        """Initialize the policy."""
+        self._base = base.total_seconds()
+        self._min = minimum.total_seconds()
+        self._max = maximum.total_seconds()
+        # (monotonic time, {code: value}, compressor running) of the previous poll
+        self._previous: tuple[float, dict[str, float], bool] | None = None
+
+    def next_interval(self, device_info: Mapping[str, Any]) -> timedelta:
+        """Return the interval for the next poll of the device."""
+        interval = self._device_interval(device_info, time.monotonic())
+        return timedelta(seconds=max(self._min, min(self._max, interval)))
+
+    def _device_interval(self, device_info: Mapping[str, Any], now: float) -> float:
+        """Return the desired interval in seconds."""
+        if not is_device_online(device_info):
+            self._previous = None
+            return self._max
+
+        data = device_info.get("_parsed_data", {})
+
+        temps = {
+            code: value
+            for code in RATE_CODES
+            if (value := parse_temperature(data.get(code))) is not None
+        }
+        compressor_running = (parse_temperature(data.get("T30")) or 0) > 0
+        previous = self._previous
+        self._previous = (now, temps, compressor_running)
+
+        mode_state = parse_temperature(data.get("ModeState"))
+        if mode_state is not None and int(mode_state) in FAST_MODE_STATES:
+            return self._min
+
+        power = parse_temperature(data.get("Power"))
+        if power is not None and power == 0:
+            return self._max
+
+        if previous is None:
+            return self._base
+
+        prev_time, prev_temps, prev_running = previous
+        if compressor_running != prev_running:
+            return self._min  # Compressor start-up or stop
+
+        rate = 0.0
+        minutes = (now - prev_time) / 60
+        if minutes > 0:
+            for code, value in temps.items():
+                if code in prev_temps:
+                    rate = max(rate, abs(value - prev_temps[code]) / minutes)
+
+        if rate >= RATE_FAST:
+            return self._min
+        if rate >= RATE_MODERATE:
+            return (self._min + self._base) / 2
+        if not compressor_running and rate < RATE_STABLE:
+            return self._max  # Idle standby
+        return self._base
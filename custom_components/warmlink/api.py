@@ -4,8 +4,10 @@ VERIFIED API endpoints and parameters via direct testing on 2024-12-29.
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+import time
 from typing import Any
 
 import aiohttp
@@ -14,6 +16,7 @@ from .const import (
     API_BASE_URL,
     API_TIMEOUT,
     APP_ID,
+    DATA_CHUNK_SIZE,
     LOGIN_SOURCE,
     AREA_CODE,
     ENDPOINT_LOGIN,
@@ -23,11 +26,20 @@ from .const import (
     ENDPOINT_DEVICE_CONTROL,
     ENDPOINT_DEVICE_DATA,
     ENDPOINT_DEVICE_FAULT,
+    ENDPOINT_DEVICE_HISTORY,
     ENDPOINT_AUTH_DEVICE_LIST,
     ENDPOINT_AUTH_DEVICE_LIST_ALT,
     PROTOCOL_CODES_STATUS,
     PROTOCOL_CODES_TEMPS,
     PROTOCOL_CODES_SETPOINTS,
+    RANGE_LIMIT_CODES,
+)
+from .scheduler import LatencyStats, RequestPriority, WarmLinkRequestScheduler
+from .store import (
+    ChunkCacheStats,
+    DeviceValueStore,
+    json_loads,
+    load_data_responses,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,6 +57,10 @@ class WarmLinkConnectionError(WarmLinkAPIError):
     """Connection error."""
 
 
+class WarmLinkValidationError(WarmLinkAPIError):
+    """Value rejected locally before it was sent to the cloud."""
+
+
 class WarmLinkAPI:
     """Warmlink API client.
     
@@ -69,6 +85,13 @@ class WarmLinkAPI:
         self._token: str | None = None
         self._user_id: str | None = None
         self._devices: dict[str, dict[str, Any]] = {}
+        self._devices_updated: float | None = None
+        self._devices_lock = asyncio.Lock()
+        self._scheduler = WarmLinkRequestScheduler()
+        self._write_latency: dict[str, LatencyStats] = {}
+        self._chunk_stats: dict[str, ChunkCacheStats] = {}
+        # Devices with a written limit parameter since their last range refresh
+        self._range_refresh: set[str] = set()
         
         self._headers = {
             "Content-Type": "application/json; charset=utf-8",
@@ -81,9 +104,23 @@ class WarmLinkAPI:
 
     @property
     def devices(self) -> dict[str, dict[str, Any]]:
-        """Return discovered devices."""
+        """Return discovered devices.
+        
+        Holds only the device list entries (one per device). Data point
+        values are not cached here - they are parsed straight into the
+        coordinators' value stores.
+        """
         return self._devices
 
+    @property
+    def scheduler(self) -> WarmLinkRequestScheduler:
+        """Return the request scheduler shared by all API calls."""
+        return self._scheduler
+
+    def get_write_latency(self, device_code: str) -> LatencyStats | None:
+        """Return control command latency statistics for a device."""
+        return self._write_latency.get(device_code)
+
     async def login(self) -> bool:
         """Authenticate with the Warmlink API.
         
@@ -101,7 +138,8 @@ class WarmLinkAPI:
         }
         
         try:
-            response = await self._post(ENDPOINT_LOGIN, data)
+            # Login gates every other request, so it uses the fast lane
+            response = await self._post(ENDPOINT_LOGIN, data, RequestPriority.CONTROL)
             
             if response.get("error_msg") == "Success":
                 result = response.get("objectResult", {})
@@ -120,12 +158,30 @@ class WarmLinkAPI:
         except aiohttp.ClientError as ex:
             raise WarmLinkConnectionError(f"Connection error: {ex}") from ex
 
-    async def get_devices(self) -> dict[str, dict[str, Any]]:
+    async def get_devices(self, max_age: float = 0) -> dict[str, dict[str, Any]]:
         """Fetch list of devices (owned + shared/authorized).
         
         VERIFIED: Returns devices with device_code, deviceStatus, productId, custModel, etc.
         Also fetches shared devices from getAuthDeviceList endpoint.
+        
+        Args:
+            max_age: Return the cached list if it is younger than this (seconds).
+                Concurrent callers share a single fetch.
         """
+        async with self._devices_lock:
+            if (
+                max_age
+                and self._devices_updated is not None
+                and time.monotonic() - self._devices_updated < max_age
+            ):
+                return self._devices
+            
+            devices = await self._fetch_devices()
+            self._devices_updated = time.monotonic()
+            return devices
+
+    async def _fetch_devices(self) -> dict[str, dict[str, Any]]:
+        """Fetch owned and shared devices from the cloud."""
         if not self.is_authenticated:
             await self.login()
         
@@ -226,12 +282,7 @@ class WarmLinkAPI:
             response = await self._post(ENDPOINT_DEVICE_STATUS, data)
             
             if response.get("error_msg") == "Success":
-                status = response.get("objectResult", {})
-                
-                if device_code in self._devices:
-                    self._devices[device_code]["_status"] = status
-                
-                return status
+                return response.get("objectResult", {})
             
             return {}
             
@@ -256,17 +307,26 @@ class WarmLinkAPI:
         if protocol_codes is None:
             protocol_codes = PROTOCOL_CODES_STATUS + PROTOCOL_CODES_TEMPS + PROTOCOL_CODES_SETPOINTS
         
-        data = {
-            "deviceCode": device_code,
-            "appId": APP_ID,
-            "protocalCodes": protocol_codes,  # Note: API uses "protocal" (typo)
-        }
+        result = {}
         
         try:
-            response = await self._post(ENDPOINT_DEVICE_DATA, data)
-            
-            if response.get("error_msg") == "Success":
-                result = {}
+            # Fetch in chunks - the scheduler lets control commands run between them
+            for start in range(0, len(protocol_codes), DATA_CHUNK_SIZE):
+                data = {
+                    "deviceCode": device_code,
+                    "appId": APP_ID,
+                    # Note: API uses "protocal" (typo)
+                    "protocalCodes": protocol_codes[start:start + DATA_CHUNK_SIZE],
+                }
+                response = await self._post(ENDPOINT_DEVICE_DATA, data)
+                
+                if response.get("error_msg") != "Success":
+                    _LOGGER.warning(
+                        "getDataByCode chunk %d for %s returned: %s",
+                        start // DATA_CHUNK_SIZE, device_code, response.get("error_msg"),
+                    )
+                    continue
+                
                 for item in response.get("objectResult", []):
                     code = item.get("code")
                     value = item.get("value")
@@ -276,21 +336,107 @@ class WarmLinkAPI:
                             "range_start": item.get("rangeStart"),
                             "range_end": item.get("rangeEnd"),
                         }
-                
-                # Update cached device data
-                if device_code in self._devices:
-                    self._devices[device_code]["_data"] = result
-                
-                return result
             
-            return {}
+            return result
             
         except aiohttp.ClientError as ex:
             _LOGGER.error("Failed to get device data: %s", ex)
             return {}
 
-    async def get_device_faults(self, device_code: str) -> list[dict[str, Any]]:
-        """Get fault history for device."""
+    async def get_device_values(
+        self,
+        device_code: str,
+        protocol_codes: list[str],
+        store: DeviceValueStore,
+        offload: bool = False,
+        ranges: dict[str, tuple[float, float]] | None = None,
+    ) -> tuple[int, int]:
+        """Fetch data points of a device straight into a value store.
+        
+        Unlike get_device_data no intermediate result dict is built - each
+        chunk is parsed into the store as it arrives. The store should hold
+        the previous poll (see DeviceValueStore.copy_from): chunks whose raw
+        body is unchanged are skipped without decoding.
+        
+        Args:
+            offload: Decode/parse changed chunks in an executor instead of
+                on the event loop. The store must not be read by anyone else
+                until this returns.
+            ranges: Collect rangeStart/rangeEnd limits into this dict. All
+                chunks are parsed (no fingerprint skipping) on such polls.
+        
+        Returns (data points received, number of changed chunks).
+        """
+        if not self.is_authenticated:
+            await self.login()
+        
+        stats = self._chunk_stats.setdefault(device_code, ChunkCacheStats())
+        received = 0
+        changed = 0
+        # Changed chunks left for the executor: (key, codes, body)
+        pending: list[tuple[int, list[str], bytes]] = []
+        
+        try:
+            for start in range(0, len(protocol_codes), DATA_CHUNK_SIZE):
+                codes = protocol_codes[start:start + DATA_CHUNK_SIZE]
+                data = {
+                    "deviceCode": device_code,
+                    "appId": APP_ID,
+                    # Note: API uses "protocal" (typo)
+                    "protocalCodes": codes,
+                }
+                body = await self._post_raw(ENDPOINT_DEVICE_DATA, data)
+                
+                stored = None if ranges is not None else store.match_chunk(start, body)
+                if stored is not None:
+                    stats.hits += 1
+                    received += stored
+                    continue
+                
+                stats.misses += 1
+                changed += 1
+                if offload:
+                    pending.append((start, codes, body))
+                else:
+                    received += store.load_chunk(start, codes, body, device_code, ranges)
+            
+        except aiohttp.ClientError as ex:
+            _LOGGER.error("Failed to get device data: %s", ex)
+            return 0, 0
+        except ValueError as ex:
+            raise WarmLinkAPIError(f"Invalid getDataByCode response: {ex}") from ex
+        
+        if pending:
+            try:
+                received += await asyncio.get_running_loop().run_in_executor(
+                    None, load_data_responses, store, pending, device_code, ranges
+                )
+            except ValueError as ex:
+                raise WarmLinkAPIError(f"Invalid getDataByCode response: {ex}") from ex
+        
+        return received, changed
+
+    def consume_range_refresh(self, device_code: str) -> bool:
+        """Return True once if a limit parameter of the device was written."""
+        if device_code in self._range_refresh:
+            self._range_refresh.discard(device_code)
+            return True
+        return False
+
+    def get_chunk_stats(self, device_code: str) -> ChunkCacheStats | None:
+        """Return fingerprint hit/miss counters of a device's polls."""
+        return self._chunk_stats.get(device_code)
+
+    async def get_device_faults(
+        self, device_code: str, start_time: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Get fault history for device.
+
+        start_time ("YYYY-MM-DD HH:MM:SS", local time) asks for records from
+        that time on only. Not every cloud version honours it, so callers
+        filter the result too. Failures raise (WarmLinkAPIError), so an
+        empty result always means no records.
+        """
         if not self.is_authenticated:
             await self.login()
         
@@ -298,29 +444,66 @@ class WarmLinkAPI:
             "deviceCode": device_code,
             "appId": APP_ID,
         }
+        if start_time is not None:
+            data["startTime"] = start_time
         
         try:
             response = await self._post(ENDPOINT_DEVICE_FAULT, data)
-            
-            if response.get("error_msg") == "Success":
-                return response.get("objectResult", [])
-            
-            return []
-            
-        except aiohttp.ClientError as ex:
-            _LOGGER.error("Failed to get device faults: %s", ex)
-            return []
+        except (aiohttp.ClientError, TimeoutError) as ex:
+            raise WarmLinkConnectionError(f"Failed to get device faults: {ex}") from ex
+        
+        if response.get("error_msg") != "Success":
+            raise WarmLinkAPIError(
+                f"getFaultDataByDeviceCode for {device_code} returned: "
+                f"{response.get('error_msg')}"
+            )
+        return response.get("objectResult") or []
+
+    async def get_device_history(
+        self, device_code: str, protocol_codes: list[str], start_time: str, end_time: str
+    ) -> Any:
+        """Get the recorded curves of codes between two local times.
+
+        Times are "YYYY-MM-DD HH:MM:SS". Runs in the backfill lane of the
+        scheduler, behind polls. Unlike the other getters, failures raise
+        (WarmLinkAPIError) so an empty result is never mistaken for a
+        period without data. Returns the raw objectResult.
+        """
+        if not self.is_authenticated:
+            await self.login()
+        
+        data = {
+            "deviceCode": device_code,
+            "appId": APP_ID,
+            # Note: API uses "protocal" (typo)
+            "protocalCodes": protocol_codes,
+            "startTime": start_time,
+            "endTime": end_time,
+        }
+        
+        try:
+            response = await self._post(
+                ENDPOINT_DEVICE_HISTORY, data, RequestPriority.BACKFILL
+            )
+        except (aiohttp.ClientError, TimeoutError) as ex:
+            raise WarmLinkConnectionError(f"Failed to get device history: {ex}") from ex
+        
+        if response.get("error_msg") != "Success":
+            raise WarmLinkAPIError(
+                f"getHistoryTimes for {device_code} returned: {response.get('error_msg')}"
+            )
+        return response.get("objectResult") or []
 
     async def set_power(self, device_code: str, power_on: bool) -> bool:
         """Turn device on or off."""
-        return await self._control_device(device_code, "Power", "1" if power_on else "0")
+        return await self.control_device(device_code, "Power", "1" if power_on else "0")
 
     async def set_mode(self, device_code: str, mode: str) -> bool:
         """Set operation mode.
         
         Modes: 1=heating, 2=cooling, 3=hot_water, 4=heating+hw, 5=cooling+hw
         """
-        return await self._control_device(device_code, "Mode", mode)
+        return await self.control_device(device_code, "Mode", mode)
 
     async def set_temperature(self, device_code: str, param: str, temperature: float) -> bool:
         """Set target temperature.
@@ -330,10 +513,16 @@ class WarmLinkAPI:
             param: Temperature parameter (R01=heating, R02=cooling, R03=room)
             temperature: Target temperature
         """
-        return await self._control_device(device_code, param, str(temperature))
+        return await self.control_device(device_code, param, str(temperature))
 
-    async def _control_device(self, device_code: str, param: str, value: str) -> bool:
-        """Send control command to device."""
+    async def control_device(self, device_code: str, param: str, value: str) -> bool:
+        """Send control command to device.
+        
+        Runs in the control lane of the scheduler, ahead of queued poll chunks.
+        Latency is measured from the call to the cloud acknowledgement.
+        """
+        started = time.monotonic()
+        
         if not self.is_authenticated:
             await self.login()
         
@@ -345,13 +534,20 @@ class WarmLinkAPI:
         }
         
         try:
-            response = await self._post(ENDPOINT_DEVICE_CONTROL, data)
+            response = await self._post(
+                ENDPOINT_DEVICE_CONTROL, data, RequestPriority.CONTROL
+            )
             
             if response.get("error_msg") == "Success":
+                latency = time.monotonic() - started
+                self._write_latency.setdefault(device_code, LatencyStats()).record(latency)
                 _LOGGER.info(
-                    "Control command sent: device=%s, %s=%s", 
-                    device_code, param, value
+                    "Control command sent: device=%s, %s=%s (%.0f ms)", 
+                    device_code, param, value, latency * 1000
                 )
+                if param in RANGE_LIMIT_CODES:
+                    # Cloud-reported ranges of dependent setpoints may change
+                    self._range_refresh.add(device_code)
                 return True
             
             error = response.get("error_msg", "Unknown error")
@@ -362,13 +558,33 @@ class WarmLinkAPI:
             _LOGGER.error("Failed to control device: %s", ex)
             return False
 
-    async def _post(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
-        """Send POST request to API."""
+    async def _post(
+        self,
+        endpoint: str,
+        data: dict[str, Any],
+        priority: RequestPriority = RequestPriority.POLL,
+    ) -> dict[str, Any]:
+        """Send POST request to API through the request scheduler."""
+        body = await self._post_raw(endpoint, data, priority)
+        try:
+            result = json_loads(body)
+        except ValueError as ex:
+            raise WarmLinkAPIError(f"Invalid response from {endpoint}: {ex}") from ex
+        _LOGGER.debug("Response: %s", result)
+        return result
+
+    async def _post_raw(
+        self,
+        endpoint: str,
+        data: dict[str, Any],
+        priority: RequestPriority = RequestPriority.POLL,
+    ) -> bytes:
+        """Send POST request and return the undecoded response body."""
         url = f"{self._base_url}/{endpoint}?lang={AREA_CODE}"
         
         _LOGGER.debug("POST %s: %s", url, data)
         
-        async with self._session.post(
+        async with self._scheduler.slot(priority), self._session.post(
             url,
             json=data,
             headers=self._headers,
@@ -376,15 +592,17 @@ class WarmLinkAPI:
             ssl=False,  # Some API servers have cert issues
         ) as response:
             response.raise_for_status()
-            result = await response.json()
-            _LOGGER.debug("Response: %s", result)
-            return result
+            return await response.read()
 
     async def close(self) -> None:
         """Close the API session."""
         self._token = None
         self._user_id = None
         self._devices.clear()
+        self._devices_updated = None
+        self._write_latency.clear()
+        self._chunk_stats.clear()
+        self._range_refresh.clear()
 
 
 # Helper function to parse temperature from API value
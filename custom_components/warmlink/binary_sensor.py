@@ -10,13 +10,14 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api import is_device_online
-from .const import DOMAIN, ERROR_CODES
+from .const import DOMAIN, ERROR_CODES, SIGNAL_DEVICES_ADDED
 from .coordinator import WarmLinkCoordinator
+from .entity import WarmLinkEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,70 +43,67 @@ async def async_setup_entry(
 ) -> None:
     """Set up Warmlink binary sensor entities."""
     data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: WarmLinkCoordinator = data["coordinator"]
+    coordinators: dict[str, WarmLinkCoordinator] = data["coordinators"]
     
-    entities = []
-    for device_code, device_data in coordinator.data.items():
-        # Add standard binary sensors
-        for description in BINARY_SENSOR_DESCRIPTIONS:
+    @callback
+    def _async_add_devices(device_codes: list[str]) -> None:
+        """Create entities for the given devices."""
+        entities = []
+        for device_code in device_codes:
+            coordinator = coordinators[device_code]
+            # Add standard binary sensors
+            for description in BINARY_SENSOR_DESCRIPTIONS:
+                entities.append(
+                    WarmLinkBinarySensor(
+                        coordinator=coordinator,
+                        device_code=device_code,
+                        description=description,
+                    )
+                )
+        
+            # Add fault sensor with details
             entities.append(
-                WarmLinkBinarySensor(
+                WarmLinkFaultSensor(
                     coordinator=coordinator,
                     device_code=device_code,
-                    device_data=device_data,
-                    description=description,
                 )
             )
-        
-        # Add fault sensor with details
-        entities.append(
-            WarmLinkFaultSensor(
-                coordinator=coordinator,
-                device_code=device_code,
-                device_data=device_data,
-            )
-        )
     
-    async_add_entities(entities)
+        async_add_entities(entities)
 
+    _async_add_devices(list(coordinators))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), _async_add_devices
+        )
+    )
 
-class WarmLinkBinarySensor(CoordinatorEntity[WarmLinkCoordinator], BinarySensorEntity):
+
+class WarmLinkBinarySensor(WarmLinkEntity, BinarySensorEntity):
     """Representation of a Warmlink binary sensor.
     
     VERIFIED: Uses _parsed_data and device status.
     """
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: WarmLinkCoordinator,
         device_code: str,
-        device_data: dict[str, Any],
         description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         
         self.entity_description = description
-        self._device_code = device_code
-        
-        device_name = device_data.get("device_nick_name") or device_data.get("deviceNickName") or device_code
-        model = device_data.get("custModel") or device_data.get("productId") or "Heat Pump"
-        
+
         self._attr_unique_id = f"{DOMAIN}_{device_code}_{description.key}"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_code)},
-            "name": device_name,
-            "manufacturer": "Phinx/Warmlink",
-            "model": model,
-        }
-
-    def _get_parsed_data(self) -> dict[str, Any]:
-        """Get parsed data from coordinator."""
-        device = self.coordinator.data.get(self._device_code, {})
-        return device.get("_parsed_data", {})
+
+    @property
+    def available(self) -> bool:
+        """Return True if available; connectivity also while offline."""
+        if self.entity_description.key == "device_online":
+            return self.coordinator.last_update_success
+        return super().available
 
     @property
     def is_on(self) -> bool | None:
@@ -114,7 +112,7 @@ class WarmLinkBinarySensor(CoordinatorEntity[WarmLinkCoordinator], BinarySensorE
         VERIFIED: Power is in _parsed_data, device_online from deviceStatus.
         """
         if self.entity_description.key == "device_online":
-            device = self.coordinator.data.get(self._device_code, {})
+            device = self._device
             return is_device_online(device)
         
         if self.entity_description.key == "power":
@@ -125,13 +123,12 @@ class WarmLinkBinarySensor(CoordinatorEntity[WarmLinkCoordinator], BinarySensorE
         return None
 
 
-class WarmLinkFaultSensor(CoordinatorEntity[WarmLinkCoordinator], BinarySensorEntity):
+class WarmLinkFaultSensor(WarmLinkEntity, BinarySensorEntity):
     """Sensor to show fault status with error code details.
     
     VERIFIED: Uses isFault field from device info.
     """
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_name = "(Fault) Status awarii"
 
@@ -139,24 +136,16 @@ class WarmLinkFaultSensor(CoordinatorEntity[WarmLinkCoordinator], BinarySensorEn
         self,
         coordinator: WarmLinkCoordinator,
         device_code: str,
-        device_data: dict[str, Any],
     ) -> None:
         """Initialize the fault sensor."""
         super().__init__(coordinator)
-        
-        self._device_code = device_code
-        
-        device_name = device_data.get("device_nick_name") or device_data.get("deviceNickName") or device_code
-        model = device_data.get("custModel") or device_data.get("productId") or "Heat Pump"
-        
+
         self._attr_unique_id = f"{DOMAIN}_{device_code}_fault_status"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_code)},
-            "name": device_name,
-            "manufacturer": "Phinx/Warmlink",
-            "model": model,
-        }
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last update succeeded, also while offline."""
+        return self.coordinator.last_update_success
 
     @property
     def is_on(self) -> bool | None:
@@ -164,7 +153,7 @@ class WarmLinkFaultSensor(CoordinatorEntity[WarmLinkCoordinator], BinarySensorEn
         
         VERIFIED: Check isFault field and device online status.
         """
-        device = self.coordinator.data.get(self._device_code, {})
+        device = self._device
         
         # Check various fault indicators
         is_fault = device.get("isFault") or device.get("is_fault")
@@ -180,7 +169,7 @@ class WarmLinkFaultSensor(CoordinatorEntity[WarmLinkCoordinator], BinarySensorEn
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return fault details."""
-        device = self.coordinator.data.get(self._device_code, {})
+        device = self._device
         
         fault_code = device.get("faultCode") or device.get("fault_code") or device.get("fault")
         
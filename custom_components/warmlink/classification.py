@@ -0,0 +1,120 @@
+"""Recorder classification of Warmlink parameters.
+
+Every parameter of the Modbus table becomes an entity on every device, and
+most of them are static configuration values. Left as enabled measurement
+sensors they would all be recorded and compiled into long-term statistics.
+
+Parameters are classified by their category:
+- telemetry: enabled, sensors keep their state class (statistics)
+- diagnostic: diagnostic entity category, no statistics
+- config: configuration entity category (diagnostic for sensors), no
+  statistics
+- hidden: as diagnostic/config, but disabled by default
+
+Categories can be reclassified per config entry (options flow).
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Final
+
+TELEMETRY: Final = "telemetry"
+DIAGNOSTIC: Final = "diagnostic"
+CONFIG: Final = "config"
+HIDDEN: Final = "hidden"
+ENTITY_CLASSES: Final = (TELEMETRY, DIAGNOSTIC, CONFIG, HIDDEN)
+
+# Default class of read-only parameters by category (others are hidden)
+SENSOR_CLASSES: Final[dict[str, str]] = {
+    "temperatures": TELEMETRY,
+    "compressor": TELEMETRY,
+    "fan": TELEMETRY,
+    "pump": TELEMETRY,
+    "zones": TELEMETRY,
+    "eev": DIAGNOSTIC,
+    "defrost": DIAGNOSTIC,
+    "outputs": DIAGNOSTIC,
+    "status": DIAGNOSTIC,
+    "setpoints": DIAGNOSTIC,
+    "system": DIAGNOSTIC,
+    "protection": DIAGNOSTIC,
+}
+
+# Default class of writable parameters by category (others are hidden)
+CONTROL_CLASSES: Final[dict[str, str]] = {
+    "setpoints": CONFIG,
+    "zones": CONFIG,
+    "disinfection": CONFIG,
+    "system": CONFIG,
+}
+
+# Parameter categories (see get_category in generate_params.py)
+CATEGORIES: Final = (
+    "temperatures",
+    "setpoints",
+    "system",
+    "protection",
+    "fan",
+    "defrost",
+    "disinfection",
+    "compressor",
+    "pump",
+    "eev",
+    "zones",
+    "status",
+    "outputs",
+    "other",
+)
+
+# Power, mode and the main setpoints stay primary controls
+PRIMARY_CODES: Final = frozenset({"Power", "Mode", "R01", "R02", "R03", "R70"})
+
+
+@dataclass(frozen=True, slots=True)
+class EntityClassification:
+    """Recorder-relevant entity settings of a parameter."""
+
+    # "diagnostic", "config" or None
+    entity_category: str | None
+    enabled_default: bool
+    # Sensors keep their state class (long-term statistics)
+    statistics: bool
+
+
+_CLASSIFICATIONS: Final[dict[tuple[str, bool], EntityClassification]] = {
+    (TELEMETRY, False): EntityClassification(None, True, True),
+    (TELEMETRY, True): EntityClassification(None, True, False),
+    (DIAGNOSTIC, False): EntityClassification(DIAGNOSTIC, True, False),
+    (DIAGNOSTIC, True): EntityClassification(DIAGNOSTIC, True, False),
+    # Sensors cannot be configuration entities
+    (CONFIG, False): EntityClassification(DIAGNOSTIC, True, False),
+    (CONFIG, True): EntityClassification(CONFIG, True, False),
+    (HIDDEN, False): EntityClassification(DIAGNOSTIC, False, False),
+    (HIDDEN, True): EntityClassification(CONFIG, False, False),
+}
+
+
+def default_class(category: str, writable: bool) -> str:
+    """Return the built-in class of a parameter category."""
+    classes = CONTROL_CLASSES if writable else SENSOR_CLASSES
+    return classes.get(category, HIDDEN)
+
+
+def classify(
+    code: str,
+    category: str,
+    writable: bool,
+    overrides: Mapping[str, str] | None = None,
+) -> EntityClassification:
+    """Return the classification of a parameter.
+
+    overrides maps category -> class and takes precedence over the defaults.
+    """
+    if code in PRIMARY_CODES:
+        entity_class = TELEMETRY
+    elif overrides and overrides.get(category) in ENTITY_CLASSES:
+        entity_class = overrides[category]
+    else:
+        entity_class = default_class(category, writable)
+    return _CLASSIFICATIONS[(entity_class, writable)]
@@ -11,11 +11,10 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import is_device_online
 from .const import (
     DOMAIN,
     HVAC_MODE_OFF,
@@ -24,8 +23,10 @@ from .const import (
     HVAC_MODE_HOT_WATER,
     HVAC_MODE_HEATING_HOT_WATER,
     HVAC_MODE_COOLING_HOT_WATER,
+    SIGNAL_DEVICES_ADDED,
 )
 from .coordinator import WarmLinkCoordinator
+from .entity import WarmLinkEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,28 +54,37 @@ async def async_setup_entry(
 ) -> None:
     """Set up Warmlink climate entities."""
     data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: WarmLinkCoordinator = data["coordinator"]
+    coordinators: dict[str, WarmLinkCoordinator] = data["coordinators"]
     
-    entities = []
-    for device_code, device_data in coordinator.data.items():
-        entities.append(
-            WarmLinkClimate(
-                coordinator=coordinator,
-                device_code=device_code,
-                device_data=device_data,
+    @callback
+    def _async_add_devices(device_codes: list[str]) -> None:
+        """Create entities for the given devices."""
+        entities = []
+        for device_code in device_codes:
+            coordinator = coordinators[device_code]
+            entities.append(
+                WarmLinkClimate(
+                    coordinator=coordinator,
+                    device_code=device_code,
+                )
             )
-        )
     
-    async_add_entities(entities)
+        async_add_entities(entities)
+
+    _async_add_devices(list(coordinators))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), _async_add_devices
+        )
+    )
 
 
-class WarmLinkClimate(CoordinatorEntity[WarmLinkCoordinator], ClimateEntity):
+class WarmLinkClimate(WarmLinkEntity, ClimateEntity):
     """Representation of a Warmlink heat pump climate entity.
     
     VERIFIED: Uses _parsed_data dict with keys: Power, Mode, T01-T05, R01-R03
     """
 
-    _attr_has_entity_name = True
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL]
     _attr_supported_features = (
@@ -90,39 +100,12 @@ class WarmLinkClimate(CoordinatorEntity[WarmLinkCoordinator], ClimateEntity):
         self,
         coordinator: WarmLinkCoordinator,
         device_code: str,
-        device_data: dict[str, Any],
     ) -> None:
         """Initialize the climate entity."""
         super().__init__(coordinator)
-        
-        self._device_code = device_code
-        self._device_data = device_data
-        
-        # VERIFIED: API returns device_nick_name or deviceNickName
-        device_name = device_data.get("device_nick_name") or device_data.get("deviceNickName") or device_code
-        model = device_data.get("custModel") or device_data.get("productId") or "Heat Pump"
-        
+
         self._attr_unique_id = f"{DOMAIN}_{device_code}_climate"
         self._attr_name = "Pompa ciepła"
-        
-        # Device info for grouping entities
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_code)},
-            "name": device_name,
-            "manufacturer": "Phinx/Warmlink",
-            "model": model,
-        }
-
-    def _get_parsed_data(self) -> dict[str, Any]:
-        """Get parsed data from coordinator."""
-        device = self.coordinator.data.get(self._device_code, {})
-        return device.get("_parsed_data", {})
-
-    @property
-    def available(self) -> bool:
-        """Return True if device is online."""
-        device = self.coordinator.data.get(self._device_code, {})
-        return is_device_online(device) and super().available
 
     @property
     def current_temperature(self) -> float | None:
@@ -179,17 +162,15 @@ class WarmLinkClimate(CoordinatorEntity[WarmLinkCoordinator], ClimateEntity):
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
         if hvac_mode == HVACMode.OFF:
-            await self.coordinator.api.set_power(self._device_code, False)
+            await self._async_write("Power", 0)
         else:
             # Turn on first if off
             if self.hvac_mode == HVACMode.OFF:
-                await self.coordinator.api.set_power(self._device_code, True)
+                await self._async_write("Power", 1)
             
             # Set mode
             warmlink_mode = HA_TO_WARMLINK_HVAC.get(hvac_mode, HVAC_MODE_HEATING)
-            await self.coordinator.api.set_mode(self._device_code, warmlink_mode)
-        
-        await self.coordinator.async_request_refresh()
+            await self._async_write("Mode", warmlink_mode)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set target temperature.
@@ -198,15 +179,12 @@ class WarmLinkClimate(CoordinatorEntity[WarmLinkCoordinator], ClimateEntity):
         """
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
             # Use R01 for main temperature setpoint
-            await self.coordinator.api.set_temperature(self._device_code, "R01", temperature)
-            await self.coordinator.async_request_refresh()
+            await self._async_write("R01", temperature)
 
     async def async_turn_on(self) -> None:
         """Turn the entity on."""
-        await self.coordinator.api.set_power(self._device_code, True)
-        await self.coordinator.async_request_refresh()
+        await self._async_write("Power", 1)
 
     async def async_turn_off(self) -> None:
         """Turn the entity off."""
-        await self.coordinator.api.set_power(self._device_code, False)
-        await self.coordinator.async_request_refresh()
+        await self._async_write("Power", 0)
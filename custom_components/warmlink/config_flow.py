@@ -18,10 +18,50 @@ from homeassistant.helpers.selector import (
 )
 
 from .api import WarmLinkAPI, WarmLinkAuthError, WarmLinkConnectionError
-from .const import DOMAIN, DEFAULT_NAME, CONF_LANGUAGE, CONF_DEVICES, SUPPORTED_LANGUAGES
+from .classification import CATEGORIES, ENTITY_CLASSES
+from .const import (
+    DOMAIN,
+    DEFAULT_NAME,
+    CONF_CATEGORY_CLASSES,
+    CONF_LANGUAGE,
+    CONF_DEVICES,
+    CONF_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_OFFLOAD_PARSING,
+    CONF_DEADBAND,
+    CONF_REPORT_MIN_INTERVAL,
+    CONF_ROLLING_WINDOWS,
+    CONF_BACKFILL_DAYS,
+    CONF_PROBE_MAX_AGE,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_OFFLOAD_PARSING,
+    DEFAULT_DEADBAND,
+    DEFAULT_REPORT_MIN_INTERVAL,
+    DEFAULT_ROLLING_WINDOWS,
+    DEFAULT_BACKFILL_DAYS,
+    DEFAULT_PROBE_MAX_AGE,
+    MAX_ROLLING_WINDOW,
+    SUPPORTED_LANGUAGES,
+    UPDATE_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Category selector value keeping the built-in classification
+CATEGORY_DEFAULT = "default"
+
+# Suggested rolling statistics windows (minutes); other values can be typed
+ROLLING_WINDOW_PRESETS = ["15", "60", "360", "1440"]
+
+
+def _valid_rolling_windows(windows: list[str]) -> bool:
+    """Return True if all windows are whole minutes up to MAX_ROLLING_WINDOW."""
+    return all(
+        window.isdigit() and 0 < int(window) <= MAX_ROLLING_WINDOW for window in windows
+    )
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_USERNAME): str,
@@ -207,6 +247,8 @@ class WarmLinkOptionsFlow(config_entries.OptionsFlow):
         """Initialize options flow."""
         self.config_entry = config_entry
         self._devices: dict[str, dict] = {}
+        self._data: dict[str, Any] = {}
+        self._options: dict[str, Any] = {}
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -214,7 +256,15 @@ class WarmLinkOptionsFlow(config_entries.OptionsFlow):
         """Manage the options."""
         errors: dict[str, str] = {}
         
-        if user_input is not None:
+        if user_input is not None and user_input.get(
+            CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+        ) > user_input.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL):
+            errors["base"] = "invalid_interval_bounds"
+        elif user_input is not None and not _valid_rolling_windows(
+            user_input.get(CONF_ROLLING_WINDOWS, [])
+        ):
+            errors["base"] = "invalid_rolling_windows"
+        elif user_input is not None:
             # Update options
             new_data = {**self.config_entry.data}
             
@@ -223,18 +273,34 @@ class WarmLinkOptionsFlow(config_entries.OptionsFlow):
             if CONF_LANGUAGE in user_input:
                 new_data[CONF_LANGUAGE] = user_input[CONF_LANGUAGE]
             
-            # Update config entry data
-            self.hass.config_entries.async_update_entry(
-                self.config_entry,
-                data=new_data,
-            )
-            
-            return self.async_create_entry(
-                title="",
-                data={
-                    "update_interval": user_input.get("update_interval", 60),
-                },
-            )
+            # Saved together with the options after the categories step
+            self._data = new_data
+            self._options = {
+                CONF_UPDATE_INTERVAL: user_input.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL),
+                CONF_MIN_UPDATE_INTERVAL: user_input.get(
+                    CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+                ),
+                CONF_MAX_UPDATE_INTERVAL: user_input.get(
+                    CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+                ),
+                CONF_OFFLOAD_PARSING: user_input.get(
+                    CONF_OFFLOAD_PARSING, DEFAULT_OFFLOAD_PARSING
+                ),
+                CONF_DEADBAND: user_input.get(CONF_DEADBAND, DEFAULT_DEADBAND),
+                CONF_REPORT_MIN_INTERVAL: user_input.get(
+                    CONF_REPORT_MIN_INTERVAL, DEFAULT_REPORT_MIN_INTERVAL
+                ),
+                CONF_ROLLING_WINDOWS: user_input.get(
+                    CONF_ROLLING_WINDOWS, [str(m) for m in DEFAULT_ROLLING_WINDOWS]
+                ),
+                CONF_PROBE_MAX_AGE: user_input.get(
+                    CONF_PROBE_MAX_AGE, DEFAULT_PROBE_MAX_AGE
+                ),
+                CONF_BACKFILL_DAYS: user_input.get(
+                    CONF_BACKFILL_DAYS, DEFAULT_BACKFILL_DAYS
+                ),
+            }
+            return await self.async_step_categories()
 
         # Fetch current devices
         try:
@@ -275,11 +341,57 @@ class WarmLinkOptionsFlow(config_entries.OptionsFlow):
         # Current selection
         current_devices = self.config_entry.data.get(CONF_DEVICES, list(self._devices.keys()))
 
+        options = self.config_entry.options
         schema_dict = {
             vol.Optional(
-                "update_interval",
-                default=self.config_entry.options.get("update_interval", 60),
+                CONF_UPDATE_INTERVAL,
+                default=options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL),
             ): vol.All(vol.Coerce(int), vol.Range(min=30, max=300)),
+            # Adaptive polling bounds: defrost/start-up vs. standby
+            vol.Optional(
+                CONF_MIN_UPDATE_INTERVAL,
+                default=options.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
+            vol.Optional(
+                CONF_MAX_UPDATE_INTERVAL,
+                default=options.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=30, max=1800)),
+            vol.Optional(
+                CONF_OFFLOAD_PARSING,
+                default=options.get(CONF_OFFLOAD_PARSING, DEFAULT_OFFLOAD_PARSING),
+            ): bool,
+            # Sensor reporting filter: last-digit jitter and report rate
+            vol.Optional(
+                CONF_DEADBAND,
+                default=options.get(CONF_DEADBAND, DEFAULT_DEADBAND),
+            ): bool,
+            vol.Optional(
+                CONF_REPORT_MIN_INTERVAL,
+                default=options.get(CONF_REPORT_MIN_INTERVAL, DEFAULT_REPORT_MIN_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+            # Rolling statistics sensors per window (none = off)
+            vol.Optional(
+                CONF_ROLLING_WINDOWS,
+                default=[
+                    str(minutes)
+                    for minutes in options.get(CONF_ROLLING_WINDOWS, DEFAULT_ROLLING_WINDOWS)
+                ],
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=ROLLING_WINDOW_PRESETS,
+                    mode=SelectSelectorMode.DROPDOWN,
+                    multiple=True,
+                    custom_value=True,
+                )
+            ),
+            vol.Optional(
+                CONF_PROBE_MAX_AGE,
+                default=options.get(CONF_PROBE_MAX_AGE, DEFAULT_PROBE_MAX_AGE),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+            vol.Optional(
+                CONF_BACKFILL_DAYS,
+                default=options.get(CONF_BACKFILL_DAYS, DEFAULT_BACKFILL_DAYS),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=90)),
             vol.Required(
                 CONF_LANGUAGE,
                 default=self.config_entry.data.get(CONF_LANGUAGE, "en"),
@@ -308,3 +420,42 @@ class WarmLinkOptionsFlow(config_entries.OptionsFlow):
             data_schema=vol.Schema(schema_dict),
             errors=errors,
         )
+
+    async def async_step_categories(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Reclassify parameter categories (recorder load, default visibility)."""
+        if user_input is not None:
+            category_classes = {
+                category: entity_class
+                for category, entity_class in user_input.items()
+                if entity_class != CATEGORY_DEFAULT
+            }
+            options = {**self._options, CONF_CATEGORY_CLASSES: category_classes}
+            # Data and options in one update, so the update listener runs
+            # once; finishing the flow with the same options changes nothing
+            self.hass.config_entries.async_update_entry(
+                self.config_entry,
+                data=self._data,
+                options=options,
+            )
+            return self.async_create_entry(title="", data=options)
+
+        current = self.config_entry.options.get(CONF_CATEGORY_CLASSES, {})
+        selector = SelectSelector(
+            SelectSelectorConfig(
+                options=[CATEGORY_DEFAULT, *ENTITY_CLASSES],
+                mode=SelectSelectorMode.DROPDOWN,
+                translation_key="entity_class",
+            )
+        )
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    category, default=current.get(category, CATEGORY_DEFAULT)
+                ): selector
+                for category in CATEGORIES
+            }
+        )
+
+        return self.async_show_form(step_id="categories", data_schema=schema)
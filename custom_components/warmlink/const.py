@@ -7,7 +7,12 @@ from .modbus_params import (
     SENSOR_PARAMS as MODBUS_SENSOR_PARAMS,
     SWITCH_PARAMS as MODBUS_SWITCH_PARAMS,
     SELECT_PARAMS as MODBUS_SELECT_PARAMS,
+    WRITABLE_RECORDS as MODBUS_WRITABLE_RECORDS,
+    SENSOR_RECORDS as MODBUS_SENSOR_RECORDS,
+    SWITCH_RECORDS as MODBUS_SWITCH_RECORDS,
+    SELECT_RECORDS as MODBUS_SELECT_RECORDS,
 )
+from .params import ParamTable
 
 DOMAIN: Final = "warmlink"
 DEFAULT_NAME: Final = "Warmlink"
@@ -15,12 +20,74 @@ DEFAULT_NAME: Final = "Warmlink"
 # Configuration keys
 CONF_LANGUAGE: Final = "language"
 CONF_DEVICES: Final = "devices"
+CONF_UPDATE_INTERVAL: Final = "update_interval"
+CONF_MIN_UPDATE_INTERVAL: Final = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL: Final = "max_update_interval"
+CONF_OFFLOAD_PARSING: Final = "offload_parsing"
+CONF_CATEGORY_CLASSES: Final = "category_classes"
+CONF_DEADBAND: Final = "deadband"
+CONF_REPORT_MIN_INTERVAL: Final = "report_min_interval"
+CONF_ROLLING_WINDOWS: Final = "rolling_windows"
+CONF_BACKFILL_DAYS: Final = "backfill_days"
+CONF_PROBE_MAX_AGE: Final = "probe_max_age"
 SUPPORTED_LANGUAGES: Final = ["en", "pl"]
 
+# Dispatcher signal sent with new device codes after the device selection changes
+# Format with the config entry id
+SIGNAL_DEVICES_ADDED: Final = "warmlink_devices_added_{}"
+# Dispatcher signal sent when the locally integrated totals of a device
+# changed; they are pushed to their sensors instead of the coordinator
+# snapshot, which would change on every poll. Format with the device code
+SIGNAL_TOTALS_UPDATED: Final = "warmlink_totals_updated_{}"
+# Dispatcher signal sent when a fetch added rolling statistics samples of a
+# device (same reason). Format with the device code
+SIGNAL_ROLLING_UPDATED: Final = "warmlink_rolling_updated_{}"
+
+# Event fired on defrost and compressor transitions (cycles.py)
+EVENT_CYCLE: Final = "warmlink_cycle"
+# Event fired for every new fault history record (faults.py)
+EVENT_FAULT: Final = "warmlink_fault"
+
 # API Configuration - VERIFIED via API testing
 API_BASE_URL: Final = "https://cloud.linked-go.com:449/crmservice/api"
 API_TIMEOUT: Final = 30
 UPDATE_INTERVAL: Final = 60  # seconds
+# Bounds for the adaptive poll interval (defrost/start-up vs. standby)
+DEFAULT_MIN_UPDATE_INTERVAL: Final = 15  # seconds
+DEFAULT_MAX_UPDATE_INTERVAL: Final = 300  # seconds
+# getDataByCode is split into chunks so control commands can run in between
+DATA_CHUNK_SIZE: Final = 100  # protocol codes per request
+# Decode and parse getDataByCode responses in an executor (for large fleets)
+DEFAULT_OFFLOAD_PARSING: Final = False
+# Hold sensor changes within their data type resolution (deadband.py)...
+DEFAULT_DEADBAND: Final = True
+# ...and publish each sensor at most this often (0 = on every change)
+DEFAULT_REPORT_MIN_INTERVAL: Final = 0  # seconds
+# Windows of the rolling statistics sensors (rolling.py, none = off)
+DEFAULT_ROLLING_WINDOWS: Final = (60,)  # minutes
+MAX_ROLLING_WINDOW: Final = 1440  # minutes
+# Days of cloud history imported as statistics (history.py, 0 = off). Off by
+# default: the app path of getHistoryTimes is not verified yet
+DEFAULT_BACKFILL_DAYS: Final = 0
+# Probe a few state codes before the full fetch (probe.py); full fetch at
+# least this often (0 = always full fetch)
+DEFAULT_PROBE_MAX_AGE: Final = 0  # seconds
+# Persisted device state (energy totals, cycle counters), one file per config entry
+STATE_STORAGE_KEY: Final = "warmlink.{}.state"  # format with the entry id
+STATE_STORAGE_VERSION: Final = 1
+STATE_SAVE_DELAY: Final = 60  # seconds
+# Device list is shared by the per-device coordinators; refetch at most this often
+DEVICE_LIST_MAX_AGE: Final = 30  # seconds
+# rangeStart/rangeEnd limits are only parsed on this slow tier...
+RANGE_REFRESH_INTERVAL: Final = 1800  # seconds
+# ...or right after one of these limit parameters was written
+RANGE_LIMIT_CODES: Final = ("R08", "R09", "R10", "R11", "R36", "R37")
+# Writes are confirmed by one poll this long after the first write of a sequence
+WRITE_REFRESH_DELAY: Final = 2  # seconds
+# Fault history is synced this often, or when the device list fault flag changes
+FAULT_SYNC_INTERVAL: Final = 3600  # seconds
+# Cloud curve history is imported as hourly statistics this often
+BACKFILL_INTERVAL: Final = 3600  # seconds
 
 # Warmlink specific parameters
 APP_ID: Final = "16"
@@ -35,6 +102,9 @@ ENDPOINT_DEVICE_STATUS: Final = "app/device/getDeviceStatus"
 ENDPOINT_DEVICE_CONTROL: Final = "app/device/control"
 ENDPOINT_DEVICE_DATA: Final = "app/device/getDataByCode"
 ENDPOINT_DEVICE_FAULT: Final = "app/device/getFaultDataByDeviceCode"
+# Curve data by time. UNVERIFIED: endpoints.txt only documents the web path
+# cloudservice/api/device/getHistoryTimes; this app path is by analogy
+ENDPOINT_DEVICE_HISTORY: Final = "app/device/getHistoryTimes"
 # Shared/authorized devices endpoints (for devices shared with user)
 # Try multiple paths as API may use different routes
 ENDPOINT_AUTH_DEVICE_LIST: Final = "app/device/getAuthDeviceList"
@@ -1008,9 +1078,18 @@ def get_entity_name_with_code(code: str, name: str, language: str = "en") -> str
     return f"[{code}] {name}"
 
 # Combined list of all protocol codes to request from API
+# (read from the records, without building the parameter lookups)
 ALL_PROTOCOL_CODES: Final = (
-    list(ALL_WRITABLE_PARAMS.keys()) +
-    list(ALL_SENSOR_PARAMS.keys()) +
-    list(ALL_SWITCH_PARAMS.keys()) +
-    list(ALL_SELECT_PARAMS.keys())
+    ALL_WRITABLE_PARAMS.codes() +
+    ALL_SENSOR_PARAMS.codes() +
+    ALL_SWITCH_PARAMS.codes() +
+    ALL_SELECT_PARAMS.codes()
+)
+
+# Every parameter by code; writable entries win over read-only ones
+ALL_PARAMS: Final = ParamTable(
+    MODBUS_SENSOR_RECORDS,
+    MODBUS_SWITCH_RECORDS,
+    MODBUS_SELECT_RECORDS,
+    MODBUS_WRITABLE_RECORDS,
 )
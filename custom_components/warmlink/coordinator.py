@@ -1,25 +1,154 @@
 """Coordinator for Warmlink integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+import time
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta, tzinfo
+from types import MappingProxyType
 from typing import Any
 
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfEnergy, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .adaptive import AdaptiveIntervalPolicy
 from .api import WarmLinkAPI, WarmLinkAPIError, is_device_online
 from .const import (
     DOMAIN,
     ALL_PROTOCOL_CODES,
+    DEFAULT_DEADBAND,
+    DEFAULT_PROBE_MAX_AGE,
+    DEFAULT_REPORT_MIN_INTERVAL,
+    DEFAULT_ROLLING_WINDOWS,
+    DEVICE_LIST_MAX_AGE,
+    EVENT_CYCLE,
+    EVENT_FAULT,
+    FAULT_SYNC_INTERVAL,
+    RANGE_REFRESH_INTERVAL,
+    SIGNAL_ROLLING_UPDATED,
+    SIGNAL_TOTALS_UPDATED,
+    WRITE_REFRESH_DELAY,
 )
+from .cycles import CycleDetector
+from .deadband import ReportFilter
+from .derived import DerivedMetrics
+from .energy import EnergyIntegrator, power_samples
+from .faults import FaultHistory
+from .history import (
+    BACKFILL_CODES,
+    BACKFILL_COUNTERS,
+    HistoryBackfill,
+    parse_history,
+    statistic_id,
+)
+from .limits import DependentRangeResolver
+from .offline import OfflineWatcher, status_online
+from .probe import PROBE_CODES, ChangeProbe
+from .rolling import RollingStats
+from .store import DeviceValueStore, RangeCache
+from .validation import is_current_value, static_limits, validate_value
+
+try:
+    # Replaces has_mean (Home Assistant 2025.2+)
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # pragma: no cover
+    StatisticMeanType = None
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class WarmLinkCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator to manage fetching Warmlink data.
-    
+def _cloud_time(timestamp: float, zone: tzinfo) -> str:
+    """Return a timestamp as local time text for history requests."""
+    return datetime.fromtimestamp(timestamp, zone).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _snapshot(
+    device_info: Mapping[str, Any],
+    values: Mapping[str, Any] | None = None,
+    range_cache: RangeCache | None = None,
+    derived: DerivedMetrics | None = None,
+    cycles: CycleDetector | None = None,
+    faults: FaultHistory | None = None,
+    offline: OfflineWatcher | None = None,
+) -> Mapping[str, Any]:
+    """Return a read-only copy of a device list entry with store views.
+
+    values is a frozen copy of the device values (DeviceValueStore.frozen).
+    The device list entry itself is owned by WarmLinkAPI and is not modified.
+    """
+    snapshot = dict(device_info)
+    if values is not None:
+        snapshot["_parsed_data"] = values
+    if range_cache is not None:
+        snapshot["_ranges"] = range_cache.ranges
+    if derived is not None:
+        snapshot["_derived"] = derived.values
+    if cycles is not None:
+        snapshot["_cycles"] = cycles.values
+    if faults is not None:
+        snapshot["_faults"] = faults.values
+    if offline is not None:
+        snapshot["_offline"] = offline.values
+    return MappingProxyType(snapshot)
+
+
+class DeviceMetadata:
+    """Name, model and DeviceInfo of a device, shared by all its entities.
+
+    Built once per coordinator. Entities reference device_info instead of
+    building their own dict; it is updated in place from the device list.
+    """
+
+    __slots__ = ("device_code", "name", "model", "online", "device_info")
+
+    def __init__(self, device_code: str, device_data: Mapping[str, Any]) -> None:
+        """Initialize from a device list entry."""
+        self.device_code = device_code
+        self.name = ""
+        self.model = ""
+        self.online = False
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_code)},
+            manufacturer="Phinx/Warmlink",
+        )
+        self.update(device_data)
+
+    def update(self, device_data: Mapping[str, Any]) -> bool:
+        """Refresh from a device list entry; return True if name or model changed."""
+        self.online = is_device_online(device_data)
+        # VERIFIED: API returns device_nick_name or deviceNickName
+        name = (
+            device_data.get("device_nick_name")
+            or device_data.get("deviceNickName")
+            or self.device_code
+        )
+        model = device_data.get("custModel") or device_data.get("productId") or "Heat Pump"
+        if name == self.name and model == self.model:
+            return False
+        self.name = name
+        self.model = model
+        self.device_info["name"] = name
+        self.device_info["model"] = model
+        return True
+
+
+class WarmLinkCoordinator(DataUpdateCoordinator[Mapping[str, Any]]):
+    """Coordinator to manage fetching data of a single Warmlink device.
+
+    Each device has its own coordinator with its own poll interval and
+    error state, so a failing device does not fail the others and a
+    device update only wakes that device's entities. All coordinators of
+    a config entry share one WarmLinkAPI (and its request scheduler).
+
     Uses verified Warmlink API endpoints:
     - Protocol codes: Power, Mode, T01-T05, R01-R03
     - API returns deviceStatus: "ONLINE"/"OFFLINE"
@@ -29,94 +158,523 @@ class WarmLinkCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self,
         hass: HomeAssistant,
         api: WarmLinkAPI,
+        device_code: str,
         update_interval: timedelta,
-        selected_devices: list[str] | None = None,
+        min_update_interval: timedelta | None = None,
+        max_update_interval: timedelta | None = None,
+        offload_parsing: bool = False,
+        deadband: bool = DEFAULT_DEADBAND,
+        report_min_interval: float = DEFAULT_REPORT_MIN_INTERVAL,
+        stored_state: Mapping[str, Any] | None = None,
+        rolling_windows: tuple[int, ...] = DEFAULT_ROLLING_WINDOWS,
+        probe_max_age: int = DEFAULT_PROBE_MAX_AGE,
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator.
+
+        The poll interval adapts between min_update_interval and
+        max_update_interval based on the operating state of the device.
+        Sensor changes within their deadband or report_min_interval are
+        not published (see deadband.py). stored_state restores the persisted
+        device state (see stored_state()). rolling_windows are the
+        windows of the rolling statistics in minutes (none disables them).
+        probe_max_age enables the change probe (see probe.py): the longest
+        time in seconds between two full fetches (0 always fetches all).
+        """
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
+            name=f"{DOMAIN}_{device_code}",
             update_interval=update_interval,
+            # Unchanged polls return an equal snapshot - don't wake entities
+            always_update=False,
         )
         self.api = api
-        self._selected_devices = selected_devices
+        self.device_code = device_code
+        self.last_success_time: datetime | None = None
+        # Decode and parse poll responses in an executor
+        self.offload_parsing = offload_parsing
+        # Current values and the buffer the next poll fills
+        self.store = DeviceValueStore()
+        self._spare_store = DeviceValueStore()
+        # The confirming poll after a write can overlap a scheduled one;
+        # only one run may fill the spare store and swap it in
+        self._fetch_lock = asyncio.Lock()
+        # Frozen copy of the store published with snapshots; unchanged
+        # polls reuse it, so their snapshots compare equal
+        self._published = self.store.frozen()
+        self.range_cache = RangeCache(RANGE_REFRESH_INTERVAL)
+        self.limits = DependentRangeResolver()
+        # Delta T, thermal power and COP computed from the polled values
+        self.derived = DerivedMetrics()
+        # kWh totals integrated from the power values of every poll
+        stored_state = stored_state or {}
+        self.energy = EnergyIntegrator(stored_state.get("energy"))
+        # Defrost and compressor cycle counters
+        self.cycles = CycleDetector(stored_state.get("cycles"))
+        # Cloud fault history, synced incrementally on a slow tier
+        self.faults = FaultHistory(stored_state.get("faults"))
+        self._next_fault_sync = 0.0
+        self._fault_flag: tuple[Any, Any] | None = None
+        # Offline periods, reconnects and the backoff of offline checks
+        self.offline = OfflineWatcher(stored_state.get("offline"))
+        # Checkpoint of the statistics import of the cloud curve history
+        self.backfill = HistoryBackfill(stored_state.get("backfill"))
+        # Confirming poll after writes; a write sequence gets one poll
+        self._write_refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=WRITE_REFRESH_DELAY,
+            immediate=False,
+            function=self.async_refresh,
+        )
+        # Changing the windows reloads the entry (their sensors change)
+        self.rolling: RollingStats | None = (
+            RollingStats(minutes * 60 for minutes in rolling_windows)
+            if rolling_windows
+            else None
+        )
+        self.report_filter: ReportFilter | None = None
+        self.probe: ChangeProbe | None = None
+        self.set_probe(probe_max_age)
+        self.set_reporting(deadband, report_min_interval)
+        self._interval_policy = AdaptiveIntervalPolicy(
+            base=update_interval,
+            minimum=min_update_interval or update_interval,
+            maximum=max_update_interval or update_interval,
+        )
+        # Seed with the device list entry so entities can be created even
+        # if the first data fetch fails
+        device_data = api.devices.get(device_code, {})
+        self.metadata = DeviceMetadata(device_code, device_data)
+        self.data = _snapshot(device_data)
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from API.
-        
-        Uses getDataByCode with protocol codes from Modbus CSV mapping.
-        Returns dict with device_code as key, device data as value.
+    def set_intervals(
+        self,
+        update_interval: timedelta,
+        min_update_interval: timedelta,
+        max_update_interval: timedelta,
+    ) -> None:
+        """Apply new interval settings to the running coordinator."""
+        self._interval_policy = AdaptiveIntervalPolicy(
+            base=update_interval,
+            minimum=min_update_interval,
+            maximum=max_update_interval,
+        )
+        self.update_interval = update_interval
+
+    def set_reporting(self, deadband: bool, min_interval: float) -> None:
+        """Apply new reporting filter settings to the running coordinator."""
+        self.report_filter = (
+            ReportFilter(deadband, min_interval) if deadband or min_interval else None
+        )
+
+    def set_probe(self, max_age: int) -> None:
+        """Enable the change probe with a new maximum age (0 disables it)."""
+        self.probe = ChangeProbe(max_age) if max_age else None
+
+    def stored_state(self) -> dict[str, Any]:
+        """Return the state persisted across restarts (JSON-serializable)."""
+        return {
+            "energy": self.energy.as_dict(),
+            "cycles": self.cycles.as_dict(),
+            "faults": self.faults.as_dict(),
+            "backfill": self.backfill.as_dict(),
+            "offline": self.offline.as_dict(),
+        }
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending confirming poll and shut down."""
+        self._write_refresh.async_cancel()
+        await super().async_shutdown()
+
+    def set_local_value(self, code: str, value: Any) -> None:
+        """Apply a written value locally until the next poll confirms it.
+
+        The current snapshot is replaced, not modified, with one showing
+        the value.
+        """
+        self.store.override(code, value)
+        self.limits.update(self.store.values)
+        self._published = self.store.frozen()
+        if self.data is not None:
+            self.data = MappingProxyType({**self.data, "_parsed_data": self._published})
+
+    def get_limits(self, code: str) -> tuple[float | None, float | None]:
+        """Return current (min, max) of a parameter.
+
+        Limits referencing other parameters (resolved from their current
+        values) take precedence over the cloud-reported range, which takes
+        precedence over the static limits from the Modbus table (see
+        static_limits, also the number entity's fallback range).
+        """
+        low, high = static_limits(code)
+        if (cloud_range := self.range_cache.ranges.get(code)) is not None:
+            low, high = cloud_range
+        ref_low, ref_high = self.limits.get(code)
+        if ref_low is not None:
+            low = ref_low
+        if ref_high is not None:
+            high = ref_high
+        return low, high
+
+    async def async_write(self, code: str, value: Any) -> bool:
+        """Validate and send a write, then apply it locally.
+
+        Raises WarmLinkValidationError for values the device would reject,
+        without a cloud round trip. A value equal to the current one of an
+        online device is not sent, unless the change probe left the values
+        older than a poll interval (the vendor app may have changed it).
+        Returns False if the cloud rejected it.
+        The confirming poll is scheduled, not awaited: it runs
+        WRITE_REFRESH_DELAY after the write and covers every write made
+        in between.
+        """
+        wire_value = validate_value(code, value, self.get_limits(code))
+        if (
+            self.metadata.online
+            and self._values_recent()
+            and is_current_value(self.store.get(code), wire_value)
+        ):
+            _LOGGER.debug(
+                "%s of %s is already %s, skipping write",
+                code, self.device_code, wire_value,
+            )
+            return True
+
+        if not await self.api.control_device(self.device_code, code, wire_value):
+            return False
+
+        # Optimistically show the value until the next poll confirms it
+        self.set_local_value(code, wire_value)
+        if self.probe is not None:
+            self.probe.force()
+        self.async_update_listeners()
+        await self._write_refresh.async_call()
+        return True
+
+    def _values_recent(self) -> bool:
+        """Return True if the values are from a fetch within a poll interval."""
+        if self.probe is None:
+            return True
+        age = self.probe.fetch_age(time.monotonic())
+        return (
+            age is not None
+            and self.update_interval is not None
+            and age <= self.update_interval.total_seconds()
+        )
+
+    def _async_update_device_registry(self) -> None:
+        """Push a changed nickname or model to the device registry."""
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers={(DOMAIN, self.device_code)}
+        )
+        if device is not None:
+            device_registry.async_update_device(
+                device.id, name=self.metadata.name, model=self.metadata.model
+            )
+
+    def _time_zone(self) -> tzinfo:
+        """Return the zone of cloud times without offset (the local zone)."""
+        return dt_util.get_time_zone(self.hass.config.time_zone) or dt_util.UTC
+
+    async def _async_sync_faults(self, device_info: Mapping[str, Any]) -> None:
+        """Fetch fault records newer than the cursor when due.
+
+        Runs every FAULT_SYNC_INTERVAL or when the fault flag of the device
+        list entry changed. The first successful sync only seeds the
+        history; new records of later syncs are fired as events.
+        """
+        fault_flag = (device_info.get("isFault"), device_info.get("faultCode"))
+        if fault_flag == self._fault_flag and time.monotonic() < self._next_fault_sync:
+            return
+        self._fault_flag = fault_flag
+        self._next_fault_sync = time.monotonic() + FAULT_SYNC_INTERVAL
+
+        seeded = self.faults.synced
+        zone = self._time_zone()
+        cursor = self.faults.cursor
+        try:
+            records = await self.api.get_device_faults(
+                self.device_code,
+                start_time=(
+                    None
+                    if cursor is None
+                    else _cloud_time(datetime.fromisoformat(cursor).timestamp(), zone)
+                ),
+            )
+        except WarmLinkAPIError as ex:
+            _LOGGER.debug("Fault history of %s not synced: %s", self.device_code, ex)
+            return
+        new = self.faults.add(records, zone)
+        if new:
+            _LOGGER.debug("%d new fault records of %s", len(new), self.device_code)
+        if not seeded:
+            return
+        for record in new:
+            self.hass.bus.async_fire(
+                EVENT_FAULT, {"device_code": self.device_code, **record}
+            )
+
+    async def async_backfill_statistics(
+        self, days: int, checkpoint: Callable[[], None]
+    ) -> int:
+        """Import the cloud curve history since the checkpoint as statistics.
+
+        Covers at most days back. Chunks are fetched, aggregated and
+        imported one at a time, and checkpoint is called after each, so the
+        persisted state follows the import. The first failed chunk, or a
+        recent one without data yet, ends the run; the next run continues
+        there. Returns the rows imported.
         """
+        zone = self._time_zone()
+        imported = 0
+        now = dt_util.utcnow().timestamp()
+        for start, end in self.backfill.windows(now, days * 86400):
+            try:
+                result = await self.api.get_device_history(
+                    self.device_code,
+                    list(BACKFILL_CODES),
+                    _cloud_time(start, zone),
+                    _cloud_time(end, zone),
+                )
+            except WarmLinkAPIError as ex:
+                _LOGGER.debug(
+                    "History backfill of %s stopped at %s: %s",
+                    self.device_code, dt_util.utc_from_timestamp(start), ex,
+                )
+                break
+            rows = self.backfill.add_chunk(start, end, parse_history(result, zone), now)
+            if self.backfill.end != end:
+                # Recent chunk still empty: the next run asks for it again
+                break
+            for code, code_rows in rows.items():
+                self._async_import_statistics(code, code_rows)
+                imported += len(code_rows)
+            checkpoint()
+        if imported:
+            _LOGGER.debug("Imported %d hourly statistics of %s", imported, self.device_code)
+        return imported
+
+    def _async_import_statistics(self, code: str, rows: list[dict[str, float]]) -> None:
+        """Queue hourly rows of a code as external statistics."""
+        counter = code in BACKFILL_COUNTERS
+        metadata = StatisticMetaData(
+            has_mean=not counter,
+            has_sum=counter,
+            name=f"{self.metadata.name} {code}",
+            source=DOMAIN,
+            statistic_id=statistic_id(self.device_code, code),
+            unit_of_measurement=(
+                UnitOfEnergy.KILO_WATT_HOUR if counter else UnitOfTemperature.CELSIUS
+            ),
+        )
+        if StatisticMeanType is not None:
+            metadata["mean_type"] = (
+                StatisticMeanType.NONE if counter else StatisticMeanType.ARITHMETIC
+            )
+        statistics = [
+            StatisticData(
+                start=dt_util.utc_from_timestamp(row["start"]),
+                **{key: value for key, value in row.items() if key != "start"},
+            )
+            for row in rows
+        ]
+        async_add_external_statistics(self.hass, metadata, statistics)
+
+    async def _async_probe_changed(self) -> bool:
+        """Return True if the probe asks for the full fetch (see probe.py)."""
+        if self.probe.due(time.monotonic()) or self.range_cache.needs_refresh:
+            return True
         try:
-            # Get device list - returns objectResult with device_code, deviceStatus, etc.
-            all_devices = await self.api.get_devices()
-            
-            # Filter to selected devices only
-            if self._selected_devices:
-                devices = {
-                    code: info for code, info in all_devices.items()
-                    if code in self._selected_devices
-                }
-            else:
-                devices = all_devices
-            
-            for device_code, device_info in devices.items():
-                # Only fetch data for online devices
-                if not is_device_online(device_info):
-                    _LOGGER.debug("Skipping offline device: %s", device_code)
-                    continue
-                
+            probed = await self.api.get_device_data(self.device_code, list(PROBE_CODES))
+        except WarmLinkAPIError as ex:
+            _LOGGER.debug("Probe of %s failed: %s", self.device_code, ex)
+            return True
+        return self.probe.changed(probed, self.store.values)
+
+    async def _async_fetch_values(self) -> None:
+        """Fetch all values of the device and publish the changed ones.
+
+        Overlapping runs (a confirming poll after a write next to a
+        scheduled one) are serialized: both would fill the same spare store.
+        """
+        device_code = self.device_code
+        async with self._fetch_lock:
+            # Parse into the spare store so entities keep seeing complete data
+            # while the chunks arrive, then swap it in. Starting from a copy of
+            # the current store lets unchanged chunks be skipped.
+            store = self._spare_store
+            store.copy_from(self.store)
+            # Limits are only parsed on the slow tier or after a limit write
+            ranges: dict[str, tuple[float, float]] | None = (
+                {} if self.range_cache.needs_refresh else None
+            )
+            try:
                 # Fetch data using ALL protocol codes from Modbus CSV
                 # This includes all 550+ parameters for comprehensive monitoring
-                data = await self.api.get_device_data(device_code, ALL_PROTOCOL_CODES)
-                
-                # Parse data into device info
-                # API returns: {"code": "T01", "value": "27.0", "rangeStart": "0", "rangeEnd": "70"}
-                device_info["_parsed_data"] = {}
-                device_info["_ranges"] = {}
-                
-                for code, code_data in data.items():
-                    value = code_data.get("value")
-                    if value is not None:
-                        try:
-                            # Convert to float
-                            float_value = float(value)
-                            device_info["_parsed_data"][code] = float_value
-                        except (ValueError, TypeError):
-                            device_info["_parsed_data"][code] = value
-                    
-                    # Store range info for setpoints
-                    range_start = code_data.get("range_start")
-                    range_end = code_data.get("range_end")
-                    if range_start and range_end:
-                        try:
-                            device_info["_ranges"][code] = {
-                                "min": float(range_start),
-                                "max": float(range_end),
-                            }
-                        except (ValueError, TypeError):
-                            pass
-                
-                # Log energy parameters for debugging
-                energy_codes = ["Power In(Total)", "Capacity Out(Total)", "COP/EER(Total)", 
-                               "Power In(ODU)", "Capacity Out(ODU)"]
-                for ec in energy_codes:
-                    if ec in device_info["_parsed_data"]:
-                        _LOGGER.info("Energy data %s: %s", ec, device_info["_parsed_data"][ec])
-                
-                _LOGGER.debug(
-                    "Device %s: Power=%s, Mode=%s, T01=%.1f, T02=%.1f, T04=%.1f, R01=%.1f", 
+                received, changed = await self.api.get_device_values(
                     device_code,
-                    device_info["_parsed_data"].get("Power"),
-                    device_info["_parsed_data"].get("Mode"),
-                    device_info["_parsed_data"].get("T01", 0),
-                    device_info["_parsed_data"].get("T02", 0),
-                    device_info["_parsed_data"].get("T04", 0),
-                    device_info["_parsed_data"].get("R01", 0),
+                    ALL_PROTOCOL_CODES,
+                    store,
+                    offload=self.offload_parsing,
+                    ranges=ranges,
                 )
-            
-            return devices
-            
+            except WarmLinkAPIError as ex:
+                raise UpdateFailed(f"Error communicating with API: {ex}") from ex
+
+            if not received:
+                raise UpdateFailed(f"No data returned for device {device_code}")
+
+            if changed:
+                # Held values make an unchanged snapshot, entities are not woken
+                if self.report_filter is not None:
+                    held = self.report_filter.apply(store, self.store)
+                    if held:
+                        _LOGGER.debug(
+                            "Held %d insignificant changes of %s", held, device_code
+                        )
+                self._spare_store, self.store = self.store, store
+                self._published = self.store.frozen()
+                self.limits.update(self.store.values)
+                self.derived.update(self.store.values)
+            if ranges is not None and self.range_cache.update(ranges):
+                _LOGGER.debug(
+                    "Ranges of %s changed (%d codes)", device_code, len(ranges)
+                )
+
+    def _offline_snapshot(self, device_info: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Back off the next check of an offline device and return its snapshot."""
+        if self.probe is not None:
+            self.probe.force()
+        delay = self.offline.next_delay()
+        _LOGGER.debug("Device %s offline, next check in %d s", self.device_code, delay)
+        self.update_interval = timedelta(seconds=delay)
+        return _snapshot(device_info, offline=self.offline)
+
+    async def _async_update_data(self) -> Mapping[str, Any]:
+        """Fetch data from API.
+
+        Uses getDataByCode with protocol codes from Modbus CSV mapping.
+        Returns a read-only snapshot of the device list entry with the
+        parsed data attached.
+        """
+        device_code = self.device_code
+
+        # Offline devices cost one getDeviceStatus request per (backed off)
+        # check; None if the status does not tell
+        reconnect: bool | None = None
+        if not self.metadata.online:
+            try:
+                reconnect = status_online(await self.api.get_device_status(device_code))
+            except WarmLinkAPIError as ex:
+                _LOGGER.debug("Status check of %s failed: %s", device_code, ex)
+            # Still offline only if the shared device list (refreshed by the
+            # other coordinators of the account) agrees
+            if reconnect is False and is_device_online(
+                self.api.devices.get(device_code, {})
+            ):
+                reconnect = None
+            if reconnect is False:
+                self.offline.mark_offline(time.time())
+                return self._offline_snapshot(self.api.devices.get(device_code, {}))
+
+        try:
+            # Device list is shared by all coordinators of the account; a
+            # reconnecting device needs its fresh entry
+            all_devices = await self.api.get_devices(
+                max_age=0 if reconnect else DEVICE_LIST_MAX_AGE
+            )
         except WarmLinkAPIError as ex:
             raise UpdateFailed(f"Error communicating with API: {ex}") from ex
+
+        device_info = all_devices.get(device_code)
+        if device_info is None:
+            raise UpdateFailed(f"Device {device_code} not found in device list")
+        if self.metadata.update(device_info):
+            self._async_update_device_registry()
+
+        # Only fetch data for online devices
+        if not self.metadata.online:
+            if self.offline.mark_offline(time.time()):
+                _LOGGER.info("Device %s went offline", device_code)
+            return self._offline_snapshot(device_info)
+        if (offline_time := self.offline.mark_online(time.time())) is not None:
+            _LOGGER.info(
+                "Device %s back online after %d min", device_code, offline_time // 60
+            )
+
+        if self.api.consume_range_refresh(device_code):
+            self.range_cache.invalidate()
+        # With the change probe, unchanged standby polls cost one small request
+        fetched = self.probe is None or await self._async_probe_changed()
+        if fetched:
+            await self._async_fetch_values()
+            if self.probe is not None:
+                self.probe.record_fetch(time.monotonic())
+        else:
+            self.probe.record_skip()
+            _LOGGER.debug("Probe of %s unchanged, full fetch skipped", device_code)
+
+        parsed_data = self.store.values
+        now = dt_util.utcnow()
+        # Every poll is a sample, also when no value changed. The totals
+        # are not in the snapshot: only the energy sensors are woken
+        if self.energy.add_samples(
+            now.timestamp(), power_samples(parsed_data, self.derived.values)
+        ):
+            async_dispatcher_send(
+                self.hass, SIGNAL_TOTALS_UPDATED.format(device_code)
+            )
+        # Probe-only polls would repeat the previous samples
+        if self.rolling is not None and fetched:
+            self.rolling.add_samples(now.timestamp(), parsed_data)
+            async_dispatcher_send(
+                self.hass, SIGNAL_ROLLING_UPDATED.format(device_code)
+            )
+        for transition in self.cycles.update(
+            now.timestamp(), dt_util.as_local(now).date().isoformat(), parsed_data
+        ):
+            self.hass.bus.async_fire(
+                EVENT_CYCLE, {"device_code": device_code, **transition}
+            )
+
+        # Log energy parameters for debugging
+        energy_codes = ["Power In(Total)", "Capacity Out(Total)", "COP/EER(Total)",
+                       "Power In(ODU)", "Capacity Out(ODU)"]
+        for ec in energy_codes:
+            if ec in parsed_data:
+                _LOGGER.info("Energy data %s: %s", ec, parsed_data[ec])
+
+        _LOGGER.debug(
+            "Device %s: Power=%s, Mode=%s, T01=%.1f, T02=%.1f, T04=%.1f, R01=%.1f",
+            device_code,
+            parsed_data.get("Power"),
+            parsed_data.get("Mode"),
+            parsed_data.get("T01", 0),
+            parsed_data.get("T02", 0),
+            parsed_data.get("T04", 0),
+            parsed_data.get("R01", 0),
+        )
+
+        await self._async_sync_faults(device_info)
+
+        snapshot = _snapshot(
+            device_info,
+            self._published,
+            self.range_cache,
+            self.derived,
+            self.cycles,
+            self.faults,
+            self.offline,
+        )
+        next_interval = self._interval_policy.next_interval(snapshot)
+        if next_interval != self.update_interval:
+            _LOGGER.debug(
+                "Adaptive poll interval for %s: %s -> %s",
+                device_code, self.update_interval, next_interval,
+            )
+            self.update_interval = next_interval
+
+        self.last_success_time = now
+        return snapshot
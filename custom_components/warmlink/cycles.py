@@ -0,0 +1,206 @@
+"""Defrost and compressor cycle detection for Warmlink heat pumps.
+
+ModeState (2 = defrost) and the compressor frequency (T30) arrive with
+every poll, but nothing tracked the cycles they describe. CycleDetector is
+a small state machine fed with every successful poll:
+
+- defrost start/end: ModeState enters/leaves 2
+- compressor start/stop: T30 becomes positive/zero
+- short cycle: a compressor run shorter than SHORT_CYCLE_RUN
+
+It keeps total counters, the duration of the last defrost and compressor
+run, and daily totals (reset at local midnight), and returns a transition
+list the coordinator fires as events. Transitions are only detected
+between samples at most MAX_GAP apart; after a longer gap the state is
+taken over without counting. The state is exported with as_dict() and
+restored from it.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
+MODE_STATE_CODE: Final = "ModeState"
+COMPRESSOR_CODE: Final = "T30"
+
+# ModeState value of a running defrost
+DEFROST_MODE_STATE: Final = 2.0
+# Compressor runs shorter than this count as short cycles
+SHORT_CYCLE_RUN: Final = 600  # seconds
+# Longest interval between two samples that counts as continuous
+MAX_GAP: Final = 900  # seconds
+
+# Transition types (event "type")
+DEFROST_STARTED: Final = "defrost_started"
+DEFROST_ENDED: Final = "defrost_ended"
+COMPRESSOR_STARTED: Final = "compressor_started"
+COMPRESSOR_STOPPED: Final = "compressor_stopped"
+
+# Keys of the exported values
+DEFROST_COUNT: Final = "defrost_count"
+DEFROSTS_TODAY: Final = "defrosts_today"
+DEFROST_TIME_TODAY: Final = "defrost_time_today"
+LAST_DEFROST_DURATION: Final = "last_defrost_duration"
+COMPRESSOR_STARTS: Final = "compressor_starts"
+COMPRESSOR_STARTS_TODAY: Final = "compressor_starts_today"
+COMPRESSOR_RUNTIME_TODAY: Final = "compressor_runtime_today"
+LAST_COMPRESSOR_RUN: Final = "last_compressor_run"
+SHORT_CYCLES: Final = "short_cycles"
+SHORT_CYCLES_TODAY: Final = "short_cycles_today"
+
+# Counters kept per day and reset at midnight
+_DAILY: Final = (
+    DEFROSTS_TODAY,
+    DEFROST_TIME_TODAY,
+    COMPRESSOR_STARTS_TODAY,
+    COMPRESSOR_RUNTIME_TODAY,
+    SHORT_CYCLES_TODAY,
+)
+# Counters exported in minutes (stored in seconds)
+_DURATIONS: Final = (
+    DEFROST_TIME_TODAY,
+    LAST_DEFROST_DURATION,
+    COMPRESSOR_RUNTIME_TODAY,
+    LAST_COMPRESSOR_RUN,
+)
+_COUNTERS: Final = (
+    DEFROST_COUNT,
+    DEFROSTS_TODAY,
+    DEFROST_TIME_TODAY,
+    LAST_DEFROST_DURATION,
+    COMPRESSOR_STARTS,
+    COMPRESSOR_STARTS_TODAY,
+    COMPRESSOR_RUNTIME_TODAY,
+    LAST_COMPRESSOR_RUN,
+    SHORT_CYCLES,
+    SHORT_CYCLES_TODAY,
+)
+
+
+class CycleDetector:
+    """Defrost and compressor cycles of one device."""
+
+    __slots__ = (
+        "_counters",
+        "_day",
+        "_last_sample",
+        "_defrost_since",
+        "_running_since",
+        "_values",
+    )
+
+    def __init__(self, state: Mapping[str, Any] | None = None) -> None:
+        """Initialize, restoring the state from as_dict() if given."""
+        state = state or {}
+        stored = state.get("counters", {})
+        self._counters: dict[str, float] = {
+            key: float(stored.get(key, 0)) for key in _COUNTERS
+        }
+        self._day: str | None = state.get("day")
+        self._last_sample: float | None = state.get("last_sample")
+        # Start timestamps of the running defrost / compressor run
+        self._defrost_since: float | None = state.get("defrost_since")
+        self._running_since: float | None = state.get("running_since")
+        self._values = self._exported()
+
+    @property
+    def values(self) -> Mapping[str, float]:
+        """Return read-only mapping of key -> counter (durations in minutes)."""
+        return self._values
+
+    def _exported(self) -> Mapping[str, float]:
+        """Return the counters as exported to entities."""
+        return MappingProxyType(
+            {
+                key: round(value / 60, 1) if key in _DURATIONS else int(value)
+                for key, value in self._counters.items()
+            }
+        )
+
+    def update(
+        self, timestamp: float, day: str, values: Mapping[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Process a poll taken at timestamp on the given local day.
+
+        Returns the transitions detected, each a dict with "type" and
+        details (durations in seconds).
+        """
+        counters = self._counters
+        if day != self._day:
+            self._day = day
+            for key in _DAILY:
+                counters[key] = 0.0
+
+        previous = self._last_sample
+        self._last_sample = timestamp
+        continuous = previous is not None and 0 < timestamp - previous <= MAX_GAP
+        # None while the value is missing: keep the current state
+        mode_state = values.get(MODE_STATE_CODE)
+        defrost = mode_state == DEFROST_MODE_STATE if isinstance(mode_state, float) else None
+        frequency = values.get(COMPRESSOR_CODE)
+        running = frequency > 0 if isinstance(frequency, float) else None
+        transitions: list[dict[str, Any]] = []
+
+        if continuous:
+            elapsed = timestamp - previous
+            if self._defrost_since is not None:
+                counters[DEFROST_TIME_TODAY] += elapsed
+            if self._running_since is not None:
+                counters[COMPRESSOR_RUNTIME_TODAY] += elapsed
+
+        if defrost is not None:
+            was_defrosting = self._defrost_since is not None
+            if defrost and not was_defrosting:
+                self._defrost_since = timestamp
+                if continuous:
+                    counters[DEFROST_COUNT] += 1
+                    counters[DEFROSTS_TODAY] += 1
+                    transitions.append({"type": DEFROST_STARTED})
+            elif not defrost and was_defrosting:
+                duration = timestamp - self._defrost_since
+                self._defrost_since = None
+                if continuous:
+                    counters[LAST_DEFROST_DURATION] = duration
+                    transitions.append({"type": DEFROST_ENDED, "duration": duration})
+
+        if running is not None:
+            was_running = self._running_since is not None
+            if running and not was_running:
+                self._running_since = timestamp
+                if continuous:
+                    counters[COMPRESSOR_STARTS] += 1
+                    counters[COMPRESSOR_STARTS_TODAY] += 1
+                    transitions.append({"type": COMPRESSOR_STARTED})
+            elif not running and was_running:
+                duration = timestamp - self._running_since
+                self._running_since = None
+                if continuous:
+                    short_cycle = duration < SHORT_CYCLE_RUN
+                    counters[LAST_COMPRESSOR_RUN] = duration
+                    if short_cycle:
+                        counters[SHORT_CYCLES] += 1
+                        counters[SHORT_CYCLES_TODAY] += 1
+                    transitions.append(
+                        {
+                            "type": COMPRESSOR_STOPPED,
+                            "duration": duration,
+                            "short_cycle": short_cycle,
+                        }
+                    )
+
+        exported = self._exported()
+        # Unchanged values keep their mapping, so snapshots compare equal
+        if exported != self._values:
+            self._values = exported
+        return transitions
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state as JSON-serializable dict."""
+        return {
+            "counters": dict(self._counters),
+            "day": self._day,
+            "last_sample": self._last_sample,
+            "defrost_since": self._defrost_since,
+            "running_since": self._running_since,
+        }
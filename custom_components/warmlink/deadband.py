@@ -0,0 +1,160 @@
+"""Deadband and minimum-interval reporting filter for Warmlink sensors.
+
+Voltages, currents and temperatures jitter at their last digit from poll to
+poll, so every poll changed a few values and produced state writes and
+recorder rows. Before a poll is published, ReportFilter puts the previously
+reported value back for every read-only sensor whose new value is within
+its deadband of that value, or that was reported less than its minimum
+interval ago. A poll that only changed filtered values then produces an
+equal snapshot and does not wake any entity. The chunk of a held value is
+parsed again on the next poll (DeviceValueStore.hold), so a held value is
+released once its interval has passed even if the cloud body is unchanged.
+
+The default deadband of a parameter is one step of its data type
+resolution (TEMP 0.1 °C, DIGI5 0.1, ...), so a change by a single step is
+held until the value moves further. UNIT_RULES and CODE_RULES refine the
+defaults per unit and per protocol code. Writable parameters and discrete
+values (ENUM, BINARY) are never filtered.
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import Final
+
+from .const import (
+    ALL_SELECT_PARAMS,
+    ALL_SENSOR_PARAMS,
+    ALL_SWITCH_PARAMS,
+    ALL_WRITABLE_PARAMS,
+)
+from .store import DeviceValueStore
+
+_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True, slots=True)
+class DeadbandRule:
+    """Reporting rule of one parameter.
+
+    A new value is reported if it differs from the reported one by more
+    than absolute or relative * |reported|, and the last report is at least
+    min_interval seconds old.
+    """
+
+    absolute: float = 0.0
+    relative: float = 0.0
+    min_interval: float = 0.0
+
+    def holds(self, reported: float, value: float, age: float) -> bool:
+        """Return True if value is not reported yet (reported age seconds ago)."""
+        if age < self.min_interval:
+            return True
+        band = max(self.absolute, self.relative * abs(reported))
+        return abs(value - reported) <= band + _TOLERANCE
+
+
+# Resolution of the Modbus data types (see MODBUS DATA TYPE CONVERSIONS in const.py)
+DATA_TYPE_RESOLUTION: Final[dict[str, float]] = {
+    "TEMP": 0.1,
+    "DIGI1": 1.0,
+    "DIGI2": 0.1,
+    "DIGI3": 0.01,
+    "DIGI5": 0.1,
+    "DIGI6": 0.001,
+    "DIGI9": 0.01,
+}
+
+# Unit class rules, replacing the data type default
+UNIT_RULES: Final[dict[str, DeadbandRule]] = {
+    # Mains voltage wanders by a few volts
+    "V": DeadbandRule(absolute=2.0, min_interval=300),
+    "A": DeadbandRule(absolute=0.2),
+    "rpm": DeadbandRule(relative=0.02),
+    "L/min": DeadbandRule(relative=0.02),
+}
+
+# Per-code rules, replacing unit and data type defaults
+CODE_RULES: Final[dict[str, DeadbandRule]] = {
+    # Compressor start/stop drives cycle detection and the change probe: never held
+    "T30": DeadbandRule(),
+    # Running/driver frequencies move in steps of a few Hz under load
+    "T31": DeadbandRule(absolute=2.0),
+    "T32": DeadbandRule(absolute=2.0),
+    "L43": DeadbandRule(absolute=2.0),
+    # Water pressure creeps with the water temperature
+    "IDU.WaterPressure": DeadbandRule(absolute=0.05, min_interval=300),
+}
+
+_CONTROL_CODES: Final = frozenset(
+    {*ALL_WRITABLE_PARAMS, *ALL_SWITCH_PARAMS, *ALL_SELECT_PARAMS}
+)
+
+
+def default_rules() -> dict[str, DeadbandRule]:
+    """Return code -> rule of every filtered read-only parameter."""
+    rules: dict[str, DeadbandRule] = {}
+    for code, info in ALL_SENSOR_PARAMS.items():
+        if code in _CONTROL_CODES:
+            continue
+        if code in CODE_RULES:
+            rules[code] = CODE_RULES[code]
+        elif (unit_rule := UNIT_RULES.get(info.get("unit", ""))) is not None:
+            rules[code] = unit_rule
+        elif (resolution := DATA_TYPE_RESOLUTION.get(info.get("data_type"))) is not None:
+            rules[code] = DeadbandRule(absolute=resolution)
+    return rules
+
+
+_DEFAULT_RULES: Final = default_rules()
+_NO_FILTER: Final = DeadbandRule()
+
+
+class ReportFilter:
+    """Hold back insignificant changes of one device's sensor values."""
+
+    __slots__ = ("_rules", "_reported")
+
+    def __init__(
+        self, deadband: bool = True, min_interval: float = 0.0
+    ) -> None:
+        """Initialize the filter.
+
+        Without deadband only the minimum intervals apply; min_interval
+        raises the minimum interval of every filtered parameter.
+        """
+        rules: dict[str, DeadbandRule] = {}
+        for code, rule in _DEFAULT_RULES.items():
+            if not deadband:
+                rule = DeadbandRule(min_interval=rule.min_interval)
+            if min_interval > rule.min_interval:
+                rule = replace(rule, min_interval=min_interval)
+            if rule != _NO_FILTER:
+                rules[code] = rule
+        self._rules: Mapping[str, DeadbandRule] = rules
+        # Code -> monotonic time of the last reported change
+        self._reported: dict[str, float] = {}
+
+    def apply(self, store: DeviceValueStore, reported: DeviceValueStore) -> int:
+        """Put reported values back into a freshly polled store where held.
+
+        reported is the store currently visible to entities. Returns the
+        number of values held.
+        """
+        now = time.monotonic()
+        last_reported = self._reported
+        held = 0
+        for code, rule in self._rules.items():
+            value = store.get(code)
+            previous = reported.get(code)
+            if value == previous or not isinstance(value, float):
+                continue
+            if isinstance(previous, float) and rule.holds(
+                previous, value, now - last_reported.get(code, -rule.min_interval)
+            ):
+                store.hold(code, previous)
+                held += 1
+            else:
+                last_reported[code] = now
+        return held
@@ -0,0 +1,109 @@
+"""Locally derived metrics of a Warmlink heat pump.
+
+Units with COP display disabled (H45) report no thermal output or COP, and
+fetching extra cloud codes for them costs requests. Water side delta T,
+thermal power and COP are computed from values every poll already has:
+
+- delta T = outlet (T02) - inlet (T01)
+- thermal power = flow (T39, L/min) * water density * cp * delta T,
+  negative while heat is taken from the water (cooling, defrost)
+- COP = |thermal power| / electric input (Power In(Total)), not while
+  defrosting or when the unit draws (almost) no power
+
+DerivedMetrics remembers its inputs and only recomputes, and replaces its
+read-only result mapping, when one of them changed.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
+# Keys of the derived values
+DELTA_T: Final = "delta_t"
+THERMAL_POWER: Final = "thermal_power"
+COP: Final = "cop"
+
+# Input protocol codes
+INLET_CODE: Final = "T01"
+OUTLET_CODE: Final = "T02"
+FLOW_CODE: Final = "T39"
+POWER_IN_CODE: Final = "Power In(Total)"
+MODE_STATE_CODE: Final = "ModeState"
+INPUT_CODES: Final = (INLET_CODE, OUTLET_CODE, FLOW_CODE, POWER_IN_CODE, MODE_STATE_CODE)
+
+# Water near heating temperatures
+WATER_HEAT_CAPACITY: Final = 4.18  # kJ/(kg*K)
+WATER_DENSITY: Final = 0.99  # kg/L
+
+# ModeState 2 = Defrost
+_DEFROST: Final = 2.0
+# Below this electric input (kW) the unit is idle and COP is meaningless
+MIN_POWER_IN: Final = 0.05
+# COP is clipped to physically plausible values
+MAX_COP: Final = 15.0
+
+_EMPTY: Final[Mapping[str, float]] = MappingProxyType({})
+
+
+def _number(value: Any) -> float | None:
+    """Return a numeric input as float, None if missing or invalid."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def compute(
+    inlet: float | None,
+    outlet: float | None,
+    flow: float | None,
+    power_in: float | None,
+    mode_state: float | None,
+) -> dict[str, float]:
+    """Return the derived values computable from the given inputs."""
+    result: dict[str, float] = {}
+    if inlet is None or outlet is None:
+        return result
+    delta_t = outlet - inlet
+    result[DELTA_T] = round(delta_t, 2)
+    if flow is None:
+        return result
+    thermal_power = flow / 60 * WATER_DENSITY * WATER_HEAT_CAPACITY * delta_t
+    result[THERMAL_POWER] = round(thermal_power, 3)
+    if power_in is not None and power_in >= MIN_POWER_IN and mode_state != _DEFROST:
+        result[COP] = round(min(abs(thermal_power) / power_in, MAX_COP), 2)
+    return result
+
+
+class DerivedMetrics:
+    """Derived metrics of one device, recomputed when their inputs change."""
+
+    __slots__ = ("_inputs", "_values")
+
+    def __init__(self) -> None:
+        """Initialize without values."""
+        self._inputs: tuple[float | None, ...] | None = None
+        self._values: Mapping[str, float] = _EMPTY
+
+    @property
+    def values(self) -> Mapping[str, float]:
+        """Return read-only mapping of key -> derived value."""
+        return self._values
+
+    def update(self, data: Mapping[str, Any]) -> bool:
+        """Recompute from a device's values if an input changed.
+
+        Returns True if the derived values changed.
+        """
+        inputs = tuple(_number(data.get(code)) for code in INPUT_CODES)
+        if inputs == self._inputs:
+            return False
+        self._inputs = inputs
+        values = compute(*inputs)
+        if values == self._values:
+            return False
+        self._values = MappingProxyType(values)
+        return True
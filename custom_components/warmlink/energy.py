@@ -0,0 +1,116 @@
+"""Energy counters integrated from Warmlink power values.
+
+Power In(Total), Capacity Out(Total) and the derived thermal power are
+instantaneous kW values, and the kWh counters of the unit (*(ODU)) are
+coarse or missing on shared devices. EnergyIntegrator turns the power
+values of every successful poll into kWh totals (trapezoidal rule) for
+TOTAL_INCREASING sensors.
+
+- Negative power (heat taken from the water) does not count.
+- Across a gap longer than MAX_GAP (missed polls, offline device, a long
+  restart) nothing is integrated; counting restarts at the next sample.
+- Totals and the last sample are exported with as_dict() and restored from
+  it, so a short restart does not lose the interval in between.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
+from .derived import POWER_IN_CODE, THERMAL_POWER
+
+# Keys of the energy totals
+ELECTRIC_ENERGY: Final = "electric_energy"
+HEAT_ENERGY: Final = "heat_energy"
+THERMAL_ENERGY: Final = "thermal_energy"
+ENERGY_KEYS: Final = (ELECTRIC_ENERGY, HEAT_ENERGY, THERMAL_ENERGY)
+
+# Heat output reported by the unit (electric input and thermal power as in derived.py)
+CAPACITY_OUT_CODE: Final = "Capacity Out(Total)"
+
+# Longest interval between two samples that is integrated
+MAX_GAP: Final = 900  # seconds
+
+# Exported totals are rounded to watt hours
+_DIGITS: Final = 3
+
+
+def power_samples(
+    values: Mapping[str, Any], derived: Mapping[str, float]
+) -> dict[str, float | None]:
+    """Return key -> kW of the power sources of the totals."""
+    electric = values.get(POWER_IN_CODE)
+    heat = values.get(CAPACITY_OUT_CODE)
+    return {
+        ELECTRIC_ENERGY: electric if isinstance(electric, float) else None,
+        HEAT_ENERGY: heat if isinstance(heat, float) else None,
+        THERMAL_ENERGY: derived.get(THERMAL_POWER),
+    }
+
+
+class EnergyIntegrator:
+    """kWh totals of one device integrated from power samples."""
+
+    __slots__ = ("_totals", "_last", "_values")
+
+    def __init__(self, state: Mapping[str, Any] | None = None) -> None:
+        """Initialize, restoring the state from as_dict() if given."""
+        # Key -> kWh
+        self._totals: dict[str, float] = {}
+        # Key -> (timestamp, kW) of the last sample
+        self._last: dict[str, tuple[float, float]] = {}
+        if state:
+            for key, total in state.get("totals", {}).items():
+                if key in ENERGY_KEYS:
+                    self._totals[key] = float(total)
+            for key, (timestamp, power) in state.get("last", {}).items():
+                if key in ENERGY_KEYS:
+                    self._last[key] = (float(timestamp), float(power))
+        self._values: Mapping[str, float] = self._rounded()
+
+    @property
+    def values(self) -> Mapping[str, float]:
+        """Return read-only mapping of key -> kWh (rounded)."""
+        return self._values
+
+    def _rounded(self) -> Mapping[str, float]:
+        """Return the totals as exported to entities."""
+        return MappingProxyType(
+            {key: round(total, _DIGITS) for key, total in self._totals.items()}
+        )
+
+    def add_samples(self, timestamp: float, powers: Mapping[str, float | None]) -> bool:
+        """Integrate power samples (kW) taken at timestamp (seconds).
+
+        Keys without a value keep their total but end their interval.
+        Returns True if an exported total changed.
+        """
+        totals = self._totals
+        last = self._last
+        for key in ENERGY_KEYS:
+            power = powers.get(key)
+            if power is None:
+                last.pop(key, None)
+                continue
+            power = max(power, 0.0)
+            previous = last.get(key)
+            last[key] = (timestamp, power)
+            totals.setdefault(key, 0.0)
+            if previous is None:
+                continue
+            elapsed = timestamp - previous[0]
+            if 0 < elapsed <= MAX_GAP:
+                totals[key] += (previous[1] + power) / 2 * elapsed / 3600
+        values = self._rounded()
+        if values == self._values:
+            return False
+        self._values = values
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state as JSON-serializable dict."""
+        return {
+            "totals": dict(self._totals),
+            "last": {key: list(sample) for key, sample in self._last.items()},
+        }
@@ -0,0 +1,56 @@
+"""Base entity for Warmlink integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.const import EntityCategory
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .api import WarmLinkValidationError
+from .classification import EntityClassification
+from .coordinator import WarmLinkCoordinator
+
+
+class WarmLinkEntity(CoordinatorEntity[WarmLinkCoordinator]):
+    """Entity bound to the coordinator of a single device."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: WarmLinkCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._device_code = coordinator.device_code
+        # Shared by all entities of the device
+        self._attr_device_info = coordinator.metadata.device_info
+
+    @property
+    def _device(self) -> dict[str, Any]:
+        """Return device list entry with parsed data."""
+        return self.coordinator.data or {}
+
+    def _get_parsed_data(self) -> dict[str, Any]:
+        """Get parsed data from coordinator."""
+        return self._device.get("_parsed_data", {})
+
+    def _apply_classification(self, classification: EntityClassification) -> None:
+        """Set entity category and default enablement of a parameter entity."""
+        if classification.entity_category is not None:
+            self._attr_entity_category = EntityCategory(classification.entity_category)
+        self._attr_entity_registry_enabled_default = classification.enabled_default
+
+    @property
+    def available(self) -> bool:
+        """Return True if device is online and its last update succeeded."""
+        return self.coordinator.metadata.online and super().available
+
+    async def _async_write(self, code: str, value: Any) -> bool:
+        """Write a parameter of the device through the coordinator.
+
+        Invalid values are raised as HomeAssistantError before anything is
+        sent. Returns False if the cloud rejected the write.
+        """
+        try:
+            return await self.coordinator.async_write(code, value)
+        except WarmLinkValidationError as ex:
+            raise HomeAssistantError(str(ex)) from ex
@@ -0,0 +1,159 @@
+"""Incremental fault history of a Warmlink device.
+
+The fault sensor only sees the current isFault/faultCode of the device list
+entry; faults that cleared between two polls were never noticed. The
+coordinator now syncs the cloud fault history (getFaultDataByDeviceCode)
+on a slow tier, and FaultHistory keeps what was seen:
+
+- a cursor (time of the newest record) that is sent with the next request
+  and also filters the response locally, so only newer records count
+- the last MAX_RECORDS records, deduplicated by (code, time)
+- export/restore with as_dict(), so a restart neither forgets the history
+  nor reports old records as new
+
+Field names of the records differ between cloud versions; normalize_record
+accepts the known variants.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime, timezone, tzinfo
+from types import MappingProxyType
+from typing import Any, Final
+
+from .const import ERROR_CODES
+
+# Records kept per device
+MAX_RECORDS: Final = 50
+
+_CODE_FIELDS: Final = ("faultCode", "fault_code", "code", "faultNo")
+_NAME_FIELDS: Final = ("faultName", "faultDesc", "description", "name")
+_TIME_FIELDS: Final = ("createTime", "faultTime", "startTime", "time")
+_RECOVER_FIELDS: Final = ("recoverTime", "recoveryTime", "endTime")
+
+
+def _first(raw: Mapping[str, Any], fields: tuple[str, ...]) -> Any:
+    """Return the first non-empty field of a raw record."""
+    for field in fields:
+        value = raw.get(field)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _normalize_time(value: Any, zone: tzinfo) -> str | None:
+    """Return a cloud time as UTC ISO 8601 text.
+
+    Accepts epoch milliseconds or text; text without offset is a time in
+    zone. Times are compared as text, so all of them are written in UTC.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+        moment = datetime.fromtimestamp(int(value) / 1000, timezone.utc)
+    else:
+        try:
+            moment = datetime.fromisoformat(str(value))
+        except ValueError:
+            return None
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=zone)
+    return moment.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def normalize_record(
+    raw: Mapping[str, Any], zone: tzinfo = timezone.utc
+) -> dict[str, Any] | None:
+    """Return a fault record as {code, description, time, recovered}.
+
+    Times are UTC ISO 8601 text (see _normalize_time). Returns None for
+    records without code or time.
+    """
+    code = _first(raw, _CODE_FIELDS)
+    time = _normalize_time(_first(raw, _TIME_FIELDS), zone)
+    if code is None or time is None:
+        return None
+    code = str(code)
+    return {
+        "code": code,
+        "description": _first(raw, _NAME_FIELDS) or ERROR_CODES.get(code, ""),
+        "time": time,
+        "recovered": _normalize_time(_first(raw, _RECOVER_FIELDS), zone),
+    }
+
+
+class FaultHistory:
+    """Last fault records of one device and the sync cursor."""
+
+    __slots__ = ("_records", "_keys", "_cursor", "_synced", "_values")
+
+    def __init__(self, state: Mapping[str, Any] | None = None) -> None:
+        """Initialize, restoring the state from as_dict() if given."""
+        state = state or {}
+        self._records: deque[dict[str, Any]] = deque(
+            state.get("records", []), maxlen=MAX_RECORDS
+        )
+        self._keys = {(record["code"], record["time"]) for record in self._records}
+        # Time of the newest record seen (ISO 8601)
+        self._cursor: str | None = state.get("cursor")
+        # A sync succeeded once; until then records only seed the history
+        self._synced: bool = state.get("synced", self._cursor is not None)
+        self._values: tuple[Mapping[str, Any], ...] = self._exported()
+
+    @property
+    def cursor(self) -> str | None:
+        """Return the time of the newest record seen."""
+        return self._cursor
+
+    @property
+    def synced(self) -> bool:
+        """Return True once a sync succeeded (later records are new faults)."""
+        return self._synced
+
+    @property
+    def values(self) -> tuple[Mapping[str, Any], ...]:
+        """Return the records, newest first (read-only)."""
+        return self._values
+
+    def _exported(self) -> tuple[Mapping[str, Any], ...]:
+        """Return the records as exported to entities."""
+        return tuple(MappingProxyType(record) for record in reversed(self._records))
+
+    def add(
+        self, raw_records: list[Mapping[str, Any]], zone: tzinfo = timezone.utc
+    ) -> list[dict[str, Any]]:
+        """Add records of a successful sync and return the new ones, oldest first.
+
+        Times without offset are times in zone.
+        """
+        self._synced = True
+        new: list[dict[str, Any]] = []
+        for raw in raw_records:
+            record = normalize_record(raw, zone)
+            if record is None:
+                continue
+            key = (record["code"], record["time"])
+            if key in self._keys or (self._cursor is not None and record["time"] < self._cursor):
+                continue
+            self._keys.add(key)
+            new.append(record)
+        if not new:
+            return new
+        new.sort(key=lambda record: record["time"])
+        for record in new:
+            if len(self._records) == MAX_RECORDS:
+                dropped = self._records[0]
+                self._keys.discard((dropped["code"], dropped["time"]))
+            self._records.append(record)
+        self._cursor = max(self._cursor or "", new[-1]["time"])
+        self._values = self._exported()
+        return new
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state as JSON-serializable dict."""
+        return {
+            "records": list(self._records),
+            "cursor": self._cursor,
+            "synced": self._synced,
+        }
@@ -0,0 +1,224 @@
+"""Long-term statistics backfill from the cloud curve history.
+
+While Home Assistant is down (or the cloud is unreachable) nothing is
+recorded, so the graphs have holes although the cloud kept the curves
+(getHistoryTimes). HistoryBackfill turns those curves into hourly rows for
+external statistics (async_add_external_statistics):
+
+- the range is split into CHUNK windows of full hours; each chunk is
+  fetched, aggregated and imported before the next one is requested, so
+  only one chunk is held in memory
+- measurements (BACKFILL_MEASUREMENTS) get mean/min/max per hour
+- counters (BACKFILL_COUNTERS, kWh meter readings) get the last reading
+  per hour and a sum that continues across chunks and counter resets
+- the checkpoint (end of the last imported chunk, last counter readings
+  and sums) is exported with as_dict(), so an interrupted backfill
+  continues where it stopped
+- empty chunks younger than LATE_DATA_GRACE do not move the checkpoint,
+  so curves the cloud publishes late are still imported by a later run
+
+The record layout of getHistoryTimes differs between cloud versions;
+parse_history accepts flat records and per-code point lists.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator, Mapping
+from datetime import datetime, tzinfo
+from typing import Any, Final
+
+from .const import DOMAIN
+
+# Water, ambient and tank temperatures (°C)
+BACKFILL_MEASUREMENTS: Final = ("T01", "T02", "T04", "T08")
+# Energy meter readings of the unit (kWh)
+BACKFILL_COUNTERS: Final = (
+    "Comsuption Power",
+    "Heating Con.(ODU)",
+    "Heating Gen.(ODU)",
+    "Cooling Con.(ODU)",
+    "Cooling Gen.(ODU)",
+    "DHW Con.(ODU)",
+    "DHW Gen.(ODU)",
+)
+BACKFILL_CODES: Final = BACKFILL_MEASUREMENTS + BACKFILL_COUNTERS
+
+HOUR: Final = 3600  # seconds
+# Length of one getHistoryTimes request
+CHUNK: Final = 6 * HOUR
+# Empty chunks are requested again until they ended this long ago
+LATE_DATA_GRACE: Final = 6 * HOUR
+
+_CODE_FIELDS: Final = ("code", "protocalCode", "protocolCode")
+_VALUE_FIELDS: Final = ("value", "val", "data")
+_TIME_FIELDS: Final = ("time", "createTime", "dataTime", "timestamp")
+_POINT_FIELDS: Final = ("list", "data", "values", "points", "dataList")
+
+
+def statistic_id(device_code: str, code: str) -> str:
+    """Return the external statistic id of a code of a device."""
+    slug = re.sub(r"[^a-z0-9]+", "_", f"{device_code}_{code}".lower()).strip("_")
+    return f"{DOMAIN}:{slug}"
+
+
+def _first(raw: Mapping[str, Any], fields: tuple[str, ...]) -> Any:
+    """Return the first non-empty field of a raw record."""
+    for field in fields:
+        value = raw.get(field)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _timestamp(value: Any, zone: tzinfo) -> float | None:
+    """Return a cloud time (epoch milliseconds or text in zone) as timestamp."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+        return int(value) / 1000
+    try:
+        moment = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=zone)
+    return moment.timestamp()
+
+
+def _add_point(
+    samples: dict[str, list[tuple[float, float]]],
+    code: Any,
+    raw: Mapping[str, Any],
+    zone: tzinfo,
+) -> None:
+    """Add one raw point of a code, ignoring unknown codes and bad values."""
+    if code not in BACKFILL_CODES:
+        return
+    timestamp = _timestamp(_first(raw, _TIME_FIELDS), zone)
+    try:
+        value = float(_first(raw, _VALUE_FIELDS))
+    except (TypeError, ValueError):
+        return
+    if timestamp is not None:
+        samples.setdefault(code, []).append((timestamp, value))
+
+
+def parse_history(result: Any, zone: tzinfo) -> dict[str, list[tuple[float, float]]]:
+    """Return code -> [(timestamp, value)] of a getHistoryTimes result.
+
+    Accepts a list of flat records ({code, value, time}), a list of
+    per-code records with a point list, or a code -> point list mapping.
+    Times without offset are taken as times in zone.
+    """
+    samples: dict[str, list[tuple[float, float]]] = {}
+    if isinstance(result, Mapping):
+        result = [{"code": code, "list": points} for code, points in result.items()]
+    if not isinstance(result, list):
+        return samples
+    for record in result:
+        if not isinstance(record, Mapping):
+            continue
+        code = _first(record, _CODE_FIELDS)
+        points = _first(record, _POINT_FIELDS)
+        if isinstance(points, list):
+            for point in points:
+                if isinstance(point, Mapping):
+                    _add_point(samples, code, point, zone)
+        else:
+            _add_point(samples, code, record, zone)
+    for points in samples.values():
+        points.sort()
+    return samples
+
+
+class HistoryBackfill:
+    """Checkpoint and counter sums of the statistics backfill of one device."""
+
+    __slots__ = ("_end", "_readings", "_sums")
+
+    def __init__(self, state: Mapping[str, Any] | None = None) -> None:
+        """Initialize, restoring the state from as_dict() if given."""
+        state = state or {}
+        # Imported up to this timestamp (start of the next chunk)
+        self._end: float | None = state.get("end")
+        # Counter code -> last reading and sum of increases
+        self._readings: dict[str, float] = dict(state.get("readings", {}))
+        self._sums: dict[str, float] = dict(state.get("sums", {}))
+
+    @property
+    def end(self) -> float | None:
+        """Return the timestamp up to which statistics were imported."""
+        return self._end
+
+    def windows(self, now: float, max_age: float) -> Iterator[tuple[float, float]]:
+        """Yield the (start, end) chunks still to import, oldest first.
+
+        Covers the full hours since the checkpoint, at most max_age back.
+        """
+        end = now // HOUR * HOUR
+        start = (end - max_age) // HOUR * HOUR
+        if self._end is not None:
+            start = max(start, self._end)
+        while start < end:
+            yield start, min(start + CHUNK, end)
+            start += CHUNK
+
+    def add_chunk(
+        self,
+        start: float,
+        end: float,
+        samples: Mapping[str, list[tuple[float, float]]],
+        now: float,
+    ) -> dict[str, list[dict[str, float]]]:
+        """Aggregate the samples of a chunk and move the checkpoint to end.
+
+        An empty chunk that ended less than LATE_DATA_GRACE before now
+        leaves the checkpoint, so it is requested again. Returns code ->
+        hourly rows, each with "start" (timestamp) and mean/min/max
+        (measurements) or state/sum (counters).
+        """
+        rows: dict[str, list[dict[str, float]]] = {}
+        for code, points in samples.items():
+            hours: dict[float, list[float]] = {}
+            for timestamp, value in points:
+                if start <= timestamp < end:
+                    hours.setdefault(timestamp // HOUR * HOUR, []).append(value)
+            if not hours:
+                continue
+            if code in BACKFILL_COUNTERS:
+                rows[code] = self._counter_rows(code, hours)
+            else:
+                rows[code] = [
+                    {
+                        "start": hour,
+                        "mean": sum(values) / len(values),
+                        "min": min(values),
+                        "max": max(values),
+                    }
+                    for hour, values in sorted(hours.items())
+                ]
+        if rows or end <= now - LATE_DATA_GRACE:
+            self._end = end
+        return rows
+
+    def _counter_rows(
+        self, code: str, hours: Mapping[float, list[float]]
+    ) -> list[dict[str, float]]:
+        """Return the hourly rows of a counter, continuing its sum."""
+        rows = []
+        reading = self._readings.get(code)
+        total = self._sums.get(code, 0.0)
+        for hour, values in sorted(hours.items()):
+            for value in values:
+                if reading is not None:
+                    # A lower reading is a counter reset: count from zero
+                    total += value - reading if value >= reading else value
+                reading = value
+            rows.append({"start": hour, "state": reading, "sum": total})
+        self._readings[code] = reading
+        self._sums[code] = total
+        return rows
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state as JSON-serializable dict."""
+        return {"end": self._end, "readings": dict(self._readings), "sums": dict(self._sums)}
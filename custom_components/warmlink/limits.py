@@ -0,0 +1,85 @@
+"""Limits of writable Warmlink parameters.
+
+Many setpoint limits are other parameters: R02 (heating target) must lie
+within R10..R11, A04 (antifreeze) starts at A22, and so on. The CSV encodes
+these as register references (``$1164$~$1165$``), which generate_params.py
+emits as ``min_ref``/``max_ref`` codes.
+
+DependentRangeResolver keeps the resolved limits per device and only
+re-resolves the parameters whose referenced values changed since the last
+update.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Final
+
+from .const import ALL_PARAMS
+
+# code -> (min_ref, max_ref) for parameters with referenced limits
+RANGE_DEPENDENCIES: Final[dict[str, tuple[str | None, str | None]]] = {
+    code: (info.get("min_ref"), info.get("max_ref"))
+    for code, info in ALL_PARAMS.items()
+    if info.get("min_ref") or info.get("max_ref")
+}
+
+
+def _build_dependents() -> dict[str, tuple[str, ...]]:
+    """Return referenced code -> codes whose limits depend on it."""
+    dependents: dict[str, list[str]] = {}
+    for code, refs in RANGE_DEPENDENCIES.items():
+        for ref in refs:
+            if ref:
+                dependents.setdefault(ref, []).append(code)
+    return {ref: tuple(codes) for ref, codes in dependents.items()}
+
+
+DEPENDENTS: Final[dict[str, tuple[str, ...]]] = _build_dependents()
+
+
+def _as_float(value: Any) -> float | None:
+    """Return value as float or None."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class DependentRangeResolver:
+    """Resolve referenced min/max limits from a device's current values."""
+
+    def __init__(self) -> None:
+        """Initialize the resolver."""
+        # Last seen value of each referenced code
+        self._inputs: dict[str, float | None] = {}
+        # code -> (min, max); None where the referenced value is unknown
+        self._resolved: dict[str, tuple[float | None, float | None]] = {}
+
+    def update(self, values: Mapping[str, Any]) -> set[str]:
+        """Re-resolve limits affected by changed referenced values.
+
+        Returns the codes whose limits changed.
+        """
+        affected: set[str] = set()
+        for ref, dependents in DEPENDENTS.items():
+            value = _as_float(values.get(ref))
+            if ref in self._inputs and self._inputs[ref] == value:
+                continue
+            self._inputs[ref] = value
+            affected.update(dependents)
+
+        changed = set()
+        for code in affected:
+            min_ref, max_ref = RANGE_DEPENDENCIES[code]
+            resolved = (
+                self._inputs.get(min_ref) if min_ref else None,
+                self._inputs.get(max_ref) if max_ref else None,
+            )
+            if self._resolved.get(code) != resolved:
+                self._resolved[code] = resolved
+                changed.add(code)
+        return changed
+
+    def get(self, code: str) -> tuple[float | None, float | None]:
+        """Return resolved (min, max) of a code; None where not referenced or unknown."""
+        return self._resolved.get(code, (None, None))
@@ -1,568 +1,578 @@
 # Generated from modbus_kaisai_phnix.csv
 # Total: 303 writable, 167 sensors, 46 switches, 34 selects
+#
+# Records: (code, name, address, data_type, category, min, max, min_ref, max_ref, step, unit)
+# Tuples of constants load as one constant from the compiled module;
+# ParamTable builds its code -> record lookup on first use.
+from .params import ParamTable
 
 # WRITABLE PARAMETERS (Number entities)
-WRITABLE_PARAMS = {
-    "C01": {"name": "Manual Comp. Frequency", "address": 1218, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 120.0, "step": 10, "unit": "Hz"},
-    "C02": {"name": "Min. Comp. Frequency", "address": 1219, "data_type": "DIGI1", "category": "compressor", "min": 20.0, "max": 60.0, "step": 5, "unit": "Hz"},
-    "C03": {"name": "Max. Comp. Frequency", "address": 1220, "data_type": "DIGI1", "category": "compressor", "min": 30.0, "max": 120.0, "step": 5, "unit": "Hz"},
-    "C04": {"name": "Model Selection", "address": 1221, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 100.0, "step": 5},
-    "C05": {"name": "Min. Comp. Frequency in Cooling at Low Ambient Temp.", "address": 1222, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 60.0, "step": 5, "unit": "°C"},
-    "C06": {"name": "Frequency Control Mode", "address": 1223, "data_type": "DIGI1", "category": "compressor", "min": 1.0, "max": 120.0, "step": 10, "unit": "Hz"},
-    "C07": {"name": "Resonance Point 1", "address": 1224, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 120.0, "step": 10},
-    "C08": {"name": "Resonance Point 2", "address": 1225, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 120.0, "step": 10},
-    "C09": {"name": "Resonance Point 3", "address": 1226, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 120.0, "step": 10},
-    "C10": {"name": "Min. Comp. Frequency in Heating at Low Ambient Temp.", "address": 1227, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 120.0, "step": 10, "unit": "°C"},
-    "C11": {"name": "Max. Comp. Frequency in Cooling at High Ambient Temp.", "address": 1217, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 120.0, "step": 10, "unit": "°C"},
-    "C12": {"name": "Max. Comp. Frequency in DHW mode", "address": 1347, "data_type": "DIGI1", "category": "compressor", "step": 1, "unit": "Hz"},
-    "C13": {"name": "P of Comp. Frequency PID", "address": 1348, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 10.0, "step": 1, "unit": "Hz"},
-    "C14": {"name": "I of Comp. Frequency PID", "address": 1349, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 10.0, "step": 1, "unit": "Hz"},
-    "C15": {"name": "D of Comp. Frequency PID", "address": 1350, "data_type": "DIGI1", "category": "compressor", "min": 0.0, "max": 10.0, "step": 1, "unit": "Hz"},
-    "compensate_offset": {"name": "compensate offset", "address": 1235, "data_type": "TEMP", "category": "compressor", "min": 0.0, "max": 75.0, "step": 0.5},
-    "compensate_slope": {"name": "compensate slope", "address": 1234, "data_type": "DIGI5", "category": "compressor", "min": 0.0, "max": 3.5, "step": 0.1},
-    "D01": {"name": "Ambient Temp. of Starting Defrosting", "address": 1105, "data_type": "TEMP", "category": "defrost", "min": -37.0, "max": 45.0, "step": 0.5, "unit": "°C"},
-    "D02": {"name": "Heating Operation Time Before Defrosting", "address": 1106, "data_type": "DIGI1", "category": "defrost", "min": 0.0, "max": 120.0, "step": 10, "unit": "min"},
-    "D03": {"name": "Interval Time Between Defrosting Cycles", "address": 1107, "data_type": "DIGI1", "category": "defrost", "min": 10.0, "max": 90.0, "step": 5, "unit": "min"},
-    "D04": {"name": "Exhaust Temp. Correction for Defrosting Cycle", "address": 1108, "data_type": "TEMP", "category": "defrost", "min": 0.0, "max": 150.0, "step": 0.5, "unit": "°C"},
-    "D05-1": {"name": "Defrosting Suction Pressure 1", "address": 1109, "data_type": "DIGI5", "category": "defrost", "min": 0.0, "max": 45.0, "step": 0.1, "unit": "bar"},
-    "D05-2": {"name": "Defrosting Suction Pressure 2", "address": 1110, "data_type": "DIGI5", "category": "defrost", "min": 0.0, "max": 45.0, "step": 0.1, "unit": "bar"},
-    "D06": {"name": "Defrosting Cycle Time Correction", "address": 1111, "data_type": "DIGI1", "category": "defrost", "min": 0.0, "max": 120.0, "step": 10, "unit": "min"},
-    "D07": {"name": "Ambient Temp. of Start Sliding Defrosting", "address": 1112, "data_type": "TEMP", "category": "defrost", "min": -37.0, "max": 45.0, "step": 0.5, "unit": "°C"},
-    "D08": {"name": "Suction Temp. of Start Sliding Defrosting", "address": 1113, "data_type": "TEMP", "category": "defrost", "min": -37.0, "max": 45.0, "step": 0.5, "unit": "°C"},
-    "D09": {"name": "Ambient Temp. of Stop Sliding Defrosting", "address": 1114, "data_type": "TEMP", "category": "defrost", "min": -37.0, "max": 45.0, "step": 0.5, "unit": "°C"},
-    "D10": {"name": "Suction Temp. of Stop Sliding Defrosting", "address": 1115, "data_type": "TEMP", "category": "defrost", "min": -37.0, "max": 45.0, "step": 0.5, "unit": "°C"},
-    "D11": {"name": "Min. Inlet Water Temp. of Defrosting", "address": 1116, "data_type": "TEMP", "category": "defrost", "min": 4.0, "max": 65.0, "step": 0.5, "unit": "°C"},
-    "D12": {"name": "Suction Pressure of Forced Defrosting", "address": 1117, "data_type": "DIGI5", "category": "defrost", "min": 0.0, "max": 45.0, "step": 0.1, "unit": "bar"},
-    "D13": {"name": "Heating Operation Time Before Forced Defrosting", "address": 1118, "data_type": "DIGI1", "category": "defrost", "min": 0.0, "max": 360.0, "step": 10, "unit": "min"},
-    "D14": {"name": "Fan Motor Power Ratio to Extend Defrosting Cycle", "address": 1119, "data_type": "DIGI9", "category": "defrost", "min": 0.0, "max": 5.0, "step": 0.1, "unit": "%"},
-    "D15": {"name": "Fan Motor Power Ratio to Enter Forced Defrosting", "address": 1120, "data_type": "DIGI9", "category": "defrost", "min": 0.0, "max": 5.0, "step": 0.1, "unit": "%"},
-    "D16": {"name": "Max. Fan Motor Power to Enter Forced Defrosting", "address": 1121, "data_type": "DIGI1", "category": "defrost", "min": 50.0, "max": 1000.0, "step": 10},
-    "D17": {"name": "Coil Temp. of Exit Defrosting", "address": 1122, "data_type": "TEMP", "category": "defrost", "min": -37.0, "max": 45.0, "step": 0.5, "unit": "°C"},
-    "D18": {"name": "Distributor Tube Temp. of Exit Defrosting", "address": 1123, "data_type": "TEMP", "category": "defrost", "min": -37.0, "max": 80.0, "step": 0.5, "unit": "°C"},
-    "D19": {"name": "Max. Defrosting Time", "address": 1124, "data_type": "DIGI1", "category": "defrost", "min": 0.0, "max": 20.0, "step": 5, "unit": "min"},
-    "D20": {"name": "Defrosting Frequency", "address": 1125, "data_type": "DIGI1", "category": "defrost", "min": 30.0, "max": 90.0, "step": 5, "unit": "Hz"},
-    "D22": {"name": "Water Flow of Defrosting", "address": 1127, "data_type": "DIGI9", "category": "defrost", "min": 0.0, "max": 50.0, "step": 0.1, "unit": "L/min"},
-    "D23": {"name": "Max. Defrosting Cycle by Fan Motor Power", "address": 1128, "data_type": "DIGI1", "category": "defrost", "min": 0.0, "max": 240.0, "step": 10},
-    "D25": {"name": "Max. Water Temp. Decrease during Defrosting", "address": 1130, "data_type": "TEMP", "category": "defrost", "min": 2.0, "max": 65.0, "step": 0.5, "unit": "°C"},
-    "D29": {"name": "Min. Defrost Time", "address": 1402, "data_type": "DIGI1", "category": "defrost", "min": 0.0, "max": 20.0, "step": 5, "unit": "min"},
-    "D30": {"name": "Bottom Heater Delays Off Time after Defrost", "address": 1437, "data_type": "DIGI1", "category": "defrost", "min": 0.0, "max": 60.0, "step": 5, "unit": "min"},
-    "DP2": {"name": "Dew Point Temp. Offset Value", "address": 1388, "data_type": "TEMP", "category": "defrost", "min": -10.0, "max": 10.0, "step": 0.5, "unit": "°C"},
-    "DP2-temp": {"name": "End OT Cooling", "address": 1382, "data_type": "TEMP", "category": "defrost", "min": 4.0, "max": 25.0, "step": 0.5},
-    "DP3": {"name": "Temp. diff. between indoor&outdoor temp. to stop", "address": 1389, "data_type": "TEMP", "category": "defrost", "min": 4.0, "max": 25.0, "step": 0.5, "unit": "°C"},
-    "DP3-TEMP": {"name": "Offset dew point", "address": 1384, "data_type": "TEMP", "category": "defrost", "min": -10.0, "max": 10.0, "step": 0.5},
-    "DefrstForceAmbient": {"name": "DefrstForceAmbient", "address": 1141, "data_type": "TEMP", "category": "defrost", "min": -30.0, "max": 30.0, "step": 0.5},
-    "G01": {"name": "Disinfection Water Temp.", "address": 1152, "data_type": "TEMP", "category": "disinfection", "min": 60.0, "max": 70.0, "step": 0.5, "unit": "°C"},
-    "G02": {"name": "Time Duration of Disinfection", "address": 1153, "data_type": "DIGI1", "category": "disinfection", "min": 0.0, "max": 60.0, "step": 5, "unit": "min"},
-    "G03": {"name": "Disinfection Starting Time", "address": 1154, "data_type": "DIGI1", "category": "disinfection", "min": 0.0, "max": 23.0, "step": 5, "unit": "min"},
-    "G04": {"name": "Interval Period of Disinfection", "address": 1155, "data_type": "DIGI1", "category": "disinfection", "min": 1.0, "max": 30.0, "step": 5},
-    "E02": {"name": "Target Superheat for Heating", "address": 1132, "data_type": "TEMP", "category": "eev", "min": -20.0, "max": 20.0, "step": 0.5},
-    "E03": {"name": "EEV Initial Steps for Heating", "address": 1133, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E03-1": {"name": "EEV Initial Steps for Heating1", "address": 1200, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E03-2": {"name": "EEV Initial Steps for Heating2", "address": 1142, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E03-3": {"name": "EEV Initial Steps for Heating3", "address": 1206, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E03-4": {"name": "EEV Initial Steps for Heating4", "address": 1207, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E03-5": {"name": "EEV Initial Steps for Heating5", "address": 1208, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E07": {"name": "EEV Min. Steps", "address": 1137, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E07-1": {"name": "EEV Min. Steps1", "address": 1209, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E07-2": {"name": "EEV Min. Steps2", "address": 1210, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E07-3": {"name": "EEV Min. Steps3", "address": 1211, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E07-4": {"name": "EEV Min. Steps4", "address": 1215, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E07-5": {"name": "EEV Min. Steps5", "address": 1216, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E08": {"name": "EEV Initial Steps for Cooling", "address": 1138, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E10": {"name": "EVI EEV: Initial Steps", "address": 1140, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E13": {"name": "EVI EEV Target Superheat Degree", "address": 1143, "data_type": "TEMP", "category": "eev", "min": -20.0, "max": 20.0, "step": 0.5},
-    "E14": {"name": "EVI EEV Min. Steps", "address": 1144, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E17": {"name": "Defrosting EEV Steps", "address": 1147, "data_type": "DIGI1", "category": "eev", "min": 10.0, "max": 500.0, "step": 10, "unit": "steps"},
-    "E18": {"name": "Target Superheat for Cooling", "address": 1148, "data_type": "TEMP", "category": "eev", "min": -10.0, "max": 10.0, "step": 0.5},
-    "E19": {"name": "EEV Adjustment Range In Smart Mode", "address": 1149, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 300.0, "step": 10},
-    "E20": {"name": "P of EEV PID", "address": 1351, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 10.0, "step": 1},
-    "E21": {"name": "I of EEV PID", "address": 1352, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 10.0, "step": 1},
-    "EMS Strategy": {"name": "EMS Strategy", "address": 8001, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 4.0, "step": 1},
-    "EMS01": {"name": "Low PV Max. Load Ratio", "address": 1422, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 100.0, "step": 5, "unit": "%"},
-    "EMS02": {"name": "Colling Mode Target Temp. Compen.", "address": 1423, "data_type": "TEMP", "category": "eev", "min": 0.0, "max": 20.0, "step": 0.5, "unit": "°C"},
-    "EMS03": {"name": "Heating Mode Target Temp. Compen.", "address": 1424, "data_type": "TEMP", "category": "eev", "min": 0.0, "max": 20.0, "step": 0.5, "unit": "°C"},
-    "EMS04": {"name": "DHW Mode Target Temp. Compen.", "address": 1425, "data_type": "TEMP", "category": "eev", "min": 0.0, "max": 20.0, "step": 0.5, "unit": "°C"},
-    "EMS05": {"name": "Zone Room Target Temp. Compen.", "address": 1426, "data_type": "TEMP", "category": "eev", "min": 0.0, "max": 20.0, "step": 0.5, "unit": "°C"},
-    "EMS06": {"name": "Max. Selling Power", "address": 1427, "data_type": "DIGI1", "category": "eev", "min": 0.0, "max": 6000.0, "step": 10},
-    "EMS07": {"name": "Power Limit", "address": 8006, "data_type": "DIGI5", "category": "eev", "min": 0.0, "max": 99.9, "step": 0.1},
-    "Electricity Price": {"name": "Electricity Price", "address": 8002, "data_type": "TEMP", "category": "eev", "step": 0.5},
-    "F02": {"name": "Coil Temp.. for Max. Fan Speed in Cooling", "address": 1060, "data_type": "TEMP", "category": "fan", "min": -15.0, "max": 60.0, "step": 0.5, "unit": "°C"},
-    "F03": {"name": "Coil Temp.. for Min. Fan Speed in Cooling", "address": 1062, "data_type": "TEMP", "category": "fan", "min": -15.0, "max": 60.0, "step": 0.5, "unit": "°C"},
-    "F05": {"name": "Coil Temp.. for Max. Fan Speed in Heating", "address": 1066, "data_type": "TEMP", "category": "fan", "min": -15.0, "max": 60.0, "step": 0.5, "unit": "°C"},
-    "F06": {"name": "Coil Temp.. for Min. Fan Speed in Heating", "address": 1068, "data_type": "TEMP", "category": "fan", "min": -15.0, "max": 60.0, "step": 0.5, "unit": "°C"},
-    "F18": {"name": "Min. Fan Speed in Cooling", "address": 1081, "data_type": "DIGI1", "category": "fan", "min": 10.0, "max": 1300.0, "step": 10, "unit": "rpm"},
-    "F19": {"name": "Min. Fan Speed in Heating", "address": 1083, "data_type": "DIGI1", "category": "fan", "min": 10.0, "max": 1300.0, "step": 10, "unit": "rpm"},
-    "F23": {"name": "Rated DC Fan Motor Speed", "address": 1089, "data_type": "DIGI1", "category": "fan", "min": 10.0, "max": 1300.0, "step": 10, "unit": "rpm"},
-    "F25": {"name": "Max. Fan Speed in Cooling", "address": 1103, "data_type": "DIGI1", "category": "fan", "min": 10.0, "max": 1300.0, "step": 10, "unit": "rpm"},
-    "F26": {"name": "Max. Fan Speed in Heating", "address": 1104, "data_type": "DIGI1", "category": "fan", "min": 10.0, "max": 1300.0, "step": 10, "unit": "rpm"},
-    "F28": {"name": "CT to Reduce Two Fans to One in Cooling", "address": 1101, "data_type": "TEMP", "category": "fan", "min": -30.0, "max": 60.0, "step": 0.5},
-    "F29": {"name": "CT to Stop Single Fan in Cooling", "address": 1102, "data_type": "TEMP", "category": "fan", "min": -30.0, "max": 60.0, "step": 0.5},
-    "FT3": {"name": "Target Temp.", "address": 1374, "data_type": "TEMP", "category": "fan", "min": 0.0, "max": 99.9, "step": 0.5, "unit": "°C"},
-    "FT4": {"name": "Compressor Frequency", "address": 1375, "data_type": "DIGI1", "category": "fan", "min": 0.0, "max": 120.0, "step": 10, "unit": "Hz"},
-    "FT5": {"name": "Target Speed of Fan1", "address": 1376, "data_type": "DIGI1", "category": "fan", "min": 0.0, "max": 1300.0, "step": 10, "unit": "rpm"},
-    "FT6": {"name": "Target Speed of Fan2", "address": 1377, "data_type": "DIGI1", "category": "fan", "min": 0.0, "max": 1300.0, "step": 10, "unit": "rpm"},
-    "FT7": {"name": "EEV Steps", "address": 1378, "data_type": "DIGI1", "category": "fan", "min": 0.0, "max": 550.0, "step": 10, "unit": "steps"},
-    "FT8": {"name": "EVI Steps", "address": 1379, "data_type": "DIGI1", "category": "fan", "min": 0.0, "max": 550.0, "step": 10, "unit": "steps"},
-    "FT9": {"name": "Speed of Circulation Pump", "address": 1380, "data_type": "DIGI1", "category": "fan", "min": 0.0, "max": 100.0, "step": 5},
-    "Fault": {"name": "Fault", "address": 8010, "data_type": "DIGI1", "category": "fan", "step": 1},
-    "/": {"name": "Unit Max. Power Limit", "address": 1405, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 99.9, "step": 0.1},
-    "Battery Power": {"name": "Battery Power", "address": 8003, "data_type": "Float", "category": "other", "step": 1},
-    "Battery SoC": {"name": "Battery SoC", "address": 8005, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 100.0, "step": 0.1},
-    "IntevalSeconds": {"name": "IntervalSecondsReport", "address": 1145, "data_type": "DIGI1", "category": "other", "min": 30.0, "max": 300.0, "step": 10},
-    "KG1": {"name": "Frist_Period_Power_ONOFF_Start", "address": 1256, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG10": {"name": "Fifth_Period_Power_ONOFF_End", "address": 1265, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG11": {"name": "Sixth_Period_Power_ONOFF_Start", "address": 1266, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG12": {"name": "Sixth_Period_Power_ONOFF_End", "address": 1267, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG2": {"name": "Frist_Period_Power_ONOFF_End", "address": 1257, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG3": {"name": "Second_Period_Power_ONOFF_Start", "address": 1258, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG4": {"name": "Second_Period_Power_ONOFF_End", "address": 1259, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG5": {"name": "Third_Period_Power_ONOFF_Start", "address": 1260, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG6": {"name": "Third_Period_Power_ONOFF_End", "address": 1261, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG7": {"name": "Fourth_Period_Power_ONOFF_Start", "address": 1262, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG8": {"name": "Fourth_Period_Power_ONOFF_End", "address": 1263, "data_type": "DIGI1", "category": "other", "step": 1},
-    "KG9": {"name": "Fifth_Period_Power_ONOFF_Start", "address": 1264, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L01": {"name": "P", "address": 5091, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 99.0, "step": 0.1},
-    "L02": {"name": "I", "address": 5092, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 99.0, "step": 0.1},
-    "L03": {"name": "D", "address": 5093, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 99.0, "step": 0.1},
-    "L04": {"name": "Cycle of PID", "address": 5094, "data_type": "DIGI1", "category": "other", "min": 0.0, "max": 100.0, "step": 5},
-    "L05": {"name": "Percentage of Units Allowed to Defrost", "address": 5095, "data_type": "DIGI1", "category": "other", "min": 0.0, "max": 100.0, "step": 5},
-    "L06": {"name": "Quantity of Units in The Project", "address": 5096, "data_type": "DIGI1", "category": "other", "min": 1.0, "max": 16.0, "step": 5},
-    "L08": {"name": "Low Diff. Value of Optimal Load Ratio", "address": 5098, "data_type": "Float", "category": "other", "min": -100.0, "max": 100.0, "step": 10, "unit": "%"},
-    "L09": {"name": "High Diff. Value of Optimal Load Ratio", "address": 5099, "data_type": "Float", "category": "other", "min": -100.0, "max": 100.0, "step": 10, "unit": "%"},
-    "L12": {"name": "Cooling Target Temp.", "address": 5102, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "L13": {"name": "Heating Target Temp.", "address": 5103, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "L14": {"name": "DHW Target Temp.", "address": 5104, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "L15": {"name": "Max. Cooling Target Temp.", "address": 5105, "data_type": "TEMP", "category": "other", "min": -30.0, "max": 80.0, "step": 0.5, "unit": "°C"},
-    "L16": {"name": "Min. Cooling Target Temp.", "address": 5106, "data_type": "TEMP", "category": "other", "min": -30.0, "max": 80.0, "step": 0.5, "unit": "°C"},
-    "L17": {"name": "Max. Heating Target Temp.", "address": 5107, "data_type": "TEMP", "category": "other", "min": -30.0, "max": 90.0, "step": 0.5, "unit": "°C"},
-    "L18": {"name": "Min. Heating Target Temp.", "address": 5108, "data_type": "TEMP", "category": "other", "min": -30.0, "max": 90.0, "step": 0.5, "unit": "°C"},
-    "L19": {"name": "Max. DHW Target Temp.", "address": 5109, "data_type": "TEMP", "category": "other", "min": 0.0, "max": 85.0, "step": 0.5, "unit": "°C"},
-    "L20": {"name": "Min. DHW Target Temp.", "address": 5110, "data_type": "TEMP", "category": "other", "min": 0.0, "max": 85.0, "step": 0.5, "unit": "°C"},
-    "L23": {"name": "Slope", "address": 5113, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 3.5, "step": 0.1},
-    "L24": {"name": "Offset", "address": 5114, "data_type": "TEMP", "category": "other", "min": 0.0, "max": 85.0, "step": 0.5},
-    "L28": {"name": "Electric Heater On AT", "address": 5118, "data_type": "TEMP", "category": "other", "min": -30.0, "max": 60.0, "step": 0.5},
-    "L29": {"name": "Electric Heater Delays On Time", "address": 5119, "data_type": "DIGI1", "category": "other", "min": 10.0, "max": 999.0, "step": 10, "unit": "min"},
-    "L30": {"name": "Electric Heater Forced On Time", "address": 5120, "data_type": "DIGI1", "category": "other", "min": 10.0, "max": 1440.0, "step": 10, "unit": "min"},
-    "L31": {"name": "AT to Start Electric Heater Without Delay", "address": 5121, "data_type": "TEMP", "category": "other", "min": -30.0, "max": 60.0, "step": 0.5},
-    "L32": {"name": "Electric Heater Off Temp. Diff", "address": 5122, "data_type": "TEMP", "category": "other", "min": 0.0, "max": 20.0, "step": 0.5, "unit": "°C"},
-    "L33": {"name": "Electric Heater Opening Temp.Diff", "address": 5123, "data_type": "TEMP", "category": "other", "min": 0.0, "max": 20.0, "step": 0.5, "unit": "°C"},
-    "L34": {"name": "Electric Heater On Load", "address": 5124, "data_type": "DIGI1", "category": "other", "min": 0.0, "max": 100.0, "step": 5},
-    "M1 Cooling Target": {"name": "Mode&Temp.&Power Timer1 Cooling Target", "address": 1285, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M1 End": {"name": "Mode&Temp.&Power Timer1 End", "address": 1282, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M1 Heating Target": {"name": "Mode&Temp.&Power Timer1 Heating Target", "address": 1284, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M1 Hot Water Target": {"name": "Mode&Temp.&Power Timer1 Hot Water Target", "address": 1283, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M1 Max. Power": {"name": "Mode&Temp.&Power Timer1 Max. Power", "address": 1287, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 99.9, "step": 0.1, "unit": "°C"},
-    "M1 Start": {"name": "Mode&Temp.&Power Timer1 Start", "address": 1281, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M2 Cooling Target": {"name": "Mode&Temp.&Power Timer2 Cooling Target", "address": 1292, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M2 End": {"name": "Mode&Temp.&Power Timer2 End", "address": 1289, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M2 Heating Target": {"name": "Mode&Temp.&Power Timer2 Heating Target", "address": 1291, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M2 Hot Water Target": {"name": "Mode&Temp.&Power Timer2 Hot Water Target", "address": 1290, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M2 Max. Power": {"name": "Mode&Temp.&Power Timer2 Max. Power", "address": 1294, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 99.9, "step": 0.1, "unit": "°C"},
-    "M2 Start": {"name": "Mode&Temp.&Power Timer2 Start", "address": 1288, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M3 Cooling Target": {"name": "Mode&Temp.&Power Timer3 Cooling Target", "address": 1299, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M3 End": {"name": "Mode&Temp.&Power Timer3 End", "address": 1296, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M3 Heating Target": {"name": "Mode&Temp.&Power Timer3 Heating Target", "address": 1298, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M3 Hot Water Target": {"name": "Mode&Temp.&Power Timer3 Hot Water Target", "address": 1297, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M3 Max. Power": {"name": "Mode&Temp.&Power Timer3 Max. Power", "address": 1301, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 99.9, "step": 0.1, "unit": "°C"},
-    "M3 Start": {"name": "Mode&Temp.&Power Timer3 Start", "address": 1295, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M4 Cooling Target": {"name": "Mode&Temp.&Power Timer4 Cooling Target", "address": 1306, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M4 End": {"name": "Mode&Temp.&Power Timer4 End", "address": 1303, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M4 Heating Target": {"name": "Mode&Temp.&Power Timer4 Heating Target", "address": 1305, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M4 Hot Water Target": {"name": "Mode&Temp.&Power Timer4 Hot Water Target", "address": 1304, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M4 Max. Power": {"name": "Mode&Temp.&Power Timer4 Max. Power", "address": 1308, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 99.9, "step": 0.1, "unit": "°C"},
-    "M4 Start": {"name": "Mode&Temp.&Power Timer4 Start", "address": 1302, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M5 Cooling Target": {"name": "Mode&Temp.&Power Timer5 Cooling Target", "address": 1313, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M5 End": {"name": "Mode&Temp.&Power Timer5 End", "address": 1310, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M5 Heating Target": {"name": "Mode&Temp.&Power Timer5 Heating Target", "address": 1312, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M5 Hot Water Target": {"name": "Mode&Temp.&Power Timer5 Hot Water Target", "address": 1311, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M5 Max. Power": {"name": "Mode&Temp.&Power Timer5 Max. Power", "address": 1315, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 99.9, "step": 0.1, "unit": "°C"},
-    "M5 Start": {"name": "Mode&Temp.&Power Timer5 Start", "address": 1309, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M6 Cooling Target": {"name": "Mode&Temp.&Power Timer6 Cooling Target", "address": 1320, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M6 End": {"name": "Mode&Temp.&Power Timer6 End", "address": 1317, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "M6 Heating Target": {"name": "Mode&Temp.&Power Timer6 Heating Target", "address": 1319, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M6 Hot Water Target": {"name": "Mode&Temp.&Power Timer6 Hot Water Target", "address": 1318, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "M6 Max. Power": {"name": "Mode&Temp.&Power Timer6 Max. Power", "address": 1322, "data_type": "DIGI5", "category": "other", "min": 0.0, "max": 99.9, "step": 0.1, "unit": "°C"},
-    "M6 Start": {"name": "Mode&Temp.&Power Timer6 Start", "address": 1316, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "°C"},
-    "W1 End": {"name": "Warm Water Cir. Pump Timer1 End", "address": 1327, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "min"},
-    "W1 Start": {"name": "Warm Water Cir. Pump Timer1 Start", "address": 1326, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "min"},
-    "W2 End": {"name": "Warm Water Cir. Pump Timer2 End", "address": 1329, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "min"},
-    "W2 Start": {"name": "Warm Water Cir. Pump Timer2 Start", "address": 1328, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "min"},
-    "W3 End": {"name": "Warm Water Cir. Pump Timer3 End", "address": 1331, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "min"},
-    "W3 Start": {"name": "Warm Water Cir. Pump Timer3 Start", "address": 1330, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "min"},
-    "OnGridPower": {"name": "OnGridPower", "address": 8004, "data_type": "Float", "category": "outputs", "step": 1},
-    "A03": {"name": "Shutdown Ambient Temp.", "address": 1037, "data_type": "TEMP", "category": "protection", "min": -40.0, "max": 10.0, "step": 0.5, "unit": "°C"},
-    "A04": {"name": "Antifreeze Temp.", "address": 1038, "data_type": "TEMP", "category": "protection", "step": 0.5, "unit": "°C"},
-    "A05": {"name": "Antifreeze Temp. Difference", "address": 1039, "data_type": "TEMP", "category": "protection", "min": 1.0, "max": 50.0, "step": 0.5, "unit": "°C"},
-    "A06": {"name": "Max. Exhaust Temp.", "address": 1040, "data_type": "TEMP", "category": "protection", "min": 60.0, "max": 130.0, "step": 0.5, "unit": "°C"},
-    "A22": {"name": "Min. Antifreeze Temp.", "address": 1053, "data_type": "TEMP", "category": "protection", "min": -20.0, "max": 10.0, "step": 0.5, "unit": "°C"},
-    "A23": {"name": "Min. Outlet Water Temp. Protect", "address": 1043, "data_type": "TEMP", "category": "protection", "min": -30.0, "max": 20.0, "step": 0.5, "unit": "°C"},
-    "A24": {"name": "Excess Temp. Diff. Between Inlet and Outlet Temp.", "address": 1044, "data_type": "TEMP", "category": "protection", "min": 0.0, "max": 30.0, "step": 0.5, "unit": "°C"},
-    "A25": {"name": "Minimum Evaporation Temp. of Cooling", "address": 1055, "data_type": "TEMP", "category": "protection", "min": -50.0, "max": 30.0, "step": 0.5, "unit": "°C"},
-    "A26": {"name": "Refrigerant Type", "address": 1054, "data_type": "DIGI1", "category": "protection", "min": 0.0, "max": 99.0, "step": 5},
-    "A27": {"name": "Temp. Diff. of Limiting Frequency", "address": 1056, "data_type": "TEMP", "category": "protection", "min": -20.0, "max": 95.0, "step": 0.5, "unit": "°C"},
-    "A28": {"name": "Temp. Diff. Between Outlet and DHW Temp.", "address": 1057, "data_type": "TEMP", "category": "protection", "min": -20.0, "max": 95.0, "step": 0.5, "unit": "°C"},
-    "A30": {"name": "Min. AT for Cooling", "address": 1051, "data_type": "TEMP", "category": "protection", "min": -30.0, "max": 60.0, "step": 0.5},
-    "A31": {"name": "Electric Heater On AT", "address": 1049, "data_type": "TEMP", "category": "protection", "min": -30.0, "max": 60.0, "step": 0.5},
-    "A32": {"name": "Electric Heater Delays Comp. On Time", "address": 1050, "data_type": "DIGI1", "category": "protection", "min": 10.0, "max": 999.0, "step": 10, "unit": "min"},
-    "A33": {"name": "Electric Heater Opening Temp. Diff", "address": 1063, "data_type": "TEMP", "category": "protection", "min": 0.0, "max": 20.0, "step": 0.5, "unit": "°C"},
-    "A34": {"name": "Crank preheating time", "address": 1064, "data_type": "DIGI1", "category": "protection", "min": 0.0, "max": 360.0, "step": 10, "unit": "min"},
-    "A35": {"name": "Electric Heater OFF Temp. Diff", "address": 1031, "data_type": "TEMP", "category": "protection", "min": 0.0, "max": 30.0, "step": 0.5, "unit": "°C"},
-    "A38": {"name": "Low Pressure of Limiting Frequency", "address": 1342, "data_type": "DIGI5", "category": "protection", "min": 0.0, "max": 20.0, "step": 0.1, "unit": "bar"},
-    "A39": {"name": "Max. Current Value", "address": 1343, "data_type": "DIGI5", "category": "protection", "min": 0.0, "max": 50.0, "step": 0.1, "unit": "A"},
-    "A40": {"name": "Rated Water Flow", "address": 1344, "data_type": "DIGI9", "category": "protection", "min": 0.0, "max": 9.99, "step": 0.1, "unit": "L/min"},
-    "app_heartbeat": {"name": "app_heartbeat", "address": 1191, "data_type": "DIGI1", "category": "protection", "min": 0.0, "max": 23205.0, "step": 10},
-    "P02": {"name": "Interval Time", "address": 1198, "data_type": "DIGI1", "category": "pump", "min": 1.0, "max": 120.0, "step": 10, "unit": "min"},
-    "P03": {"name": "Operation Duration Time", "address": 1199, "data_type": "DIGI1", "category": "pump", "min": 1.0, "max": 30.0, "step": 5, "unit": "min"},
-    "P09": {"name": "Circulation Pump Protection Period", "address": 1203, "data_type": "DIGI1", "category": "pump", "min": 0.0, "max": 30.0, "step": 5},
-    "P10": {"name": "Speed of Circulation Pump", "address": 1205, "data_type": "DIGI1", "category": "pump", "min": 0.0, "max": 100.0, "step": 5},
-    "P11": {"name": "Target Temp. Diff. for Pump Speed Control", "address": 1432, "data_type": "TEMP", "category": "pump", "min": 0.0, "max": 20.0, "step": 0.5, "unit": "°C"},
-    "P12": {"name": "Pump Speed Adjust Range for Each Period", "address": 1433, "data_type": "DIGI1", "category": "pump", "min": 0.0, "max": 10.0, "step": 1},
-    "P13": {"name": "Refill Valve Start Cycle (for IDU)", "address": 1435, "data_type": "DIGI1", "category": "pump", "min": 0.0, "max": 200.0, "step": 10},
-    "P14": {"name": "Refill Valve Working Duration (for IDU)", "address": 1436, "data_type": "DIGI1", "category": "pump", "min": 0.0, "max": 6000.0, "step": 10, "unit": "min"},
-    "P15": {"name": "Target Water Pressure (for IDU)", "address": 1438, "data_type": "DIGI5", "category": "pump", "min": 0.0, "max": 20.0, "step": 0.1, "unit": "bar"},
-    "P16": {"name": "Stop Refilling Pressure Diff. (for IDU)", "address": 1444, "data_type": "DIGI5", "category": "pump", "min": 0.0, "max": 5.0, "step": 0.1, "unit": "bar"},
-    "P99": {"name": "P99", "address": 1381, "data_type": "DIGI1", "category": "pump", "min": 0.0, "max": 100.0, "step": 5},
-    "R01": {"name": "Domestic Hot Water / DHW Target Temp.", "address": 1157, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R02": {"name": "Heating Target Temp.", "address": 1158, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R03": {"name": "Cooling Target Temp.", "address": 1159, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R04": {"name": "Temp. Diff. for Power-on in Heating", "address": 1160, "data_type": "TEMP", "category": "setpoints", "min": 0.0, "max": 10.0, "step": 0.5, "unit": "°C"},
-    "R05": {"name": "Temp. Diff. for Standby in Heating", "address": 1161, "data_type": "TEMP", "category": "setpoints", "min": 0.0, "max": 10.0, "step": 0.5, "unit": "°C"},
-    "R06": {"name": "Temp. Diff. for Power-on in Cooling", "address": 1174, "data_type": "TEMP", "category": "setpoints", "min": 0.0, "max": 10.0, "step": 0.5, "unit": "°C"},
-    "R07": {"name": "Temp. Diff. for Standby in Cooling", "address": 1175, "data_type": "TEMP", "category": "setpoints", "min": 0.0, "max": 10.0, "step": 0.5, "unit": "°C"},
-    "R08": {"name": "Min. Cooling Target Temp.", "address": 1162, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R09": {"name": "Max. Cooling Target Temp.", "address": 1163, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R10": {"name": "Min. Heating Target Temp.", "address": 1164, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R11": {"name": "Max. Heating Target Temp.", "address": 1165, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R15": {"name": "Temp. Diff. of Exiting Overhigh Outlet Temp.", "address": 1166, "data_type": "TEMP", "category": "setpoints", "min": 0.0, "max": 15.0, "step": 0.5, "unit": "°C"},
-    "R16": {"name": "Temp. Diff. for Power-on in DHW", "address": 1195, "data_type": "TEMP", "category": "setpoints", "min": 0.0, "max": 10.0, "step": 0.5, "unit": "°C"},
-    "R17": {"name": "Temp. Diff. for Standby in DHW", "address": 1196, "data_type": "TEMP", "category": "setpoints", "min": 0.0, "max": 10.0, "step": 0.5, "unit": "°C"},
-    "R29": {"name": "Low AT for Water Temp. Limit On", "address": 1167, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R30": {"name": "Low AT for Water Temp. Limit Off", "address": 1168, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R31": {"name": "Max. Limit Outlet Water Temp. at Low AT", "address": 1169, "data_type": "TEMP", "category": "setpoints", "min": 20.0, "max": 85.0, "step": 0.5, "unit": "°C"},
-    "R32": {"name": "High AT for Water Temp. Limit On", "address": 1170, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R33": {"name": "High AT for Water Temp. Limit Off", "address": 1171, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R34": {"name": "Max. Limit Outlet Water Temp. at High AT", "address": 1172, "data_type": "TEMP", "category": "setpoints", "min": 20.0, "max": 85.0, "step": 0.5, "unit": "°C"},
-    "R36": {"name": "Min. DHW Target Temp.", "address": 1176, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R37": {"name": "Max. DHW Target Temp.", "address": 1177, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "R39": {"name": "AT for Auto-start Heating Mode", "address": 1192, "data_type": "TEMP", "category": "setpoints", "min": 5.0, "max": 20.0, "step": 0.5},
-    "R40": {"name": "AT for Main Circulation Pump in Smart Mode", "address": 1193, "data_type": "TEMP", "category": "setpoints", "min": -10.0, "max": 60.0, "step": 0.5},
-    "R41": {"name": "AT for DHW Pump in Smart Mode", "address": 1194, "data_type": "TEMP", "category": "setpoints", "min": -10.0, "max": 60.0, "step": 0.5},
-    "R42": {"name": "Max. Outlet Water Temp. in Heating", "address": 1228, "data_type": "TEMP", "category": "setpoints", "min": 20.0, "max": 85.0, "step": 0.5, "unit": "°C"},
-    "R43": {"name": "Max. Limit Target Water Temp. at Low AT in Heating", "address": 1229, "data_type": "TEMP", "category": "setpoints", "min": 20.0, "max": 85.0, "step": 0.5, "unit": "°C"},
-    "R44": {"name": "Max. Limit Target Water Temp. at High AT in Heating", "address": 1230, "data_type": "TEMP", "category": "setpoints", "min": 20.0, "max": 85.0, "step": 0.5, "unit": "°C"},
-    "R45": {"name": "AT to Start Electric Heater Without Delay", "address": 1231, "data_type": "TEMP", "category": "setpoints", "min": -50.0, "max": 20.0, "step": 0.5},
-    "R46": {"name": "Temp. Diff. between Max. DHW Target Temp. & Max. Outlet Temp.", "address": 1232, "data_type": "TEMP", "category": "setpoints", "min": 0.0, "max": 25.0, "step": 0.5, "unit": "°C"},
-    "R60": {"name": "AT to Start Frequency Limit in Cooling", "address": 1233, "data_type": "TEMP", "category": "setpoints", "min": 0.0, "max": 60.0, "step": 0.5, "unit": "Hz"},
-    "R61": {"name": "AT to Stop Frequency Limit in Cooling", "address": 1237, "data_type": "TEMP", "category": "setpoints", "min": 0.0, "max": 60.0, "step": 0.5, "unit": "Hz"},
-    "R62": {"name": "Max. Heat Pump Outlet Water Temp.", "address": 1238, "data_type": "TEMP", "category": "setpoints", "min": 40.0, "max": 95.0, "step": 0.5, "unit": "°C"},
-    "R70": {"name": "Target Room Temp.", "address": 1239, "data_type": "TEMP", "category": "setpoints", "min": 5.0, "max": 27.0, "step": 0.5, "unit": "°C"},
-    "R71": {"name": "Room Temp. Diff. for Power-on in Heating", "address": 1240, "data_type": "TEMP", "category": "setpoints", "min": 0.1, "max": 3.0, "step": 0.5, "unit": "°C"},
-    "R72": {"name": "Room Temp. Diff. for Standby in Heating", "address": 1241, "data_type": "TEMP", "category": "setpoints", "min": 0.1, "max": 3.0, "step": 0.5, "unit": "°C"},
-    "R73": {"name": "Room Temp. Diff. for Power-on in Cooling", "address": 1242, "data_type": "TEMP", "category": "setpoints", "min": 0.1, "max": 3.0, "step": 0.5, "unit": "°C"},
-    "R74": {"name": "Room Temp. Diff. for Standby in Cooling", "address": 1243, "data_type": "TEMP", "category": "setpoints", "min": 0.1, "max": 3.0, "step": 0.5, "unit": "°C"},
-    "RT1-10": {"name": "Thermostat1_Offset", "address": 7009, "data_type": "TEMP", "category": "setpoints", "min": 8.0, "max": 30.0, "step": 0.5},
-    "RT1-2": {"name": "Thermostat1_RoomTarget", "address": 7002, "data_type": "TEMP", "category": "setpoints", "min": 8.0, "max": 30.0, "step": 0.5},
-    "RT1-9": {"name": "Thermostat1_Slope", "address": 7008, "data_type": "DIGI5", "category": "setpoints", "min": 0.0, "max": 3.5, "step": 0.1},
-    "RT2-10": {"name": "Thermostat2_Offset", "address": 7099, "data_type": "TEMP", "category": "setpoints", "min": 8.0, "max": 30.0, "step": 0.5},
-    "RT2-2": {"name": "Thermostat2_RoomTarget", "address": 7092, "data_type": "TEMP", "category": "setpoints", "min": 8.0, "max": 30.0, "step": 0.5},
-    "RT2-9": {"name": "Thermostat2_Slope", "address": 7098, "data_type": "DIGI5", "category": "setpoints", "min": 0.0, "max": 3.5, "step": 0.1},
-    "SG02": {"name": "Block Time of Mode 1", "address": 1335, "data_type": "DIGI1", "category": "status", "min": 0.0, "max": 120.0, "step": 10, "unit": "min"},
-    "SG03": {"name": "Limited Power in Solar Low Mode 2", "address": 1336, "data_type": "DIGI5", "category": "status", "min": 0.0, "max": 99.9, "step": 0.1},
-    "SG04": {"name": "Limited Power in Solar Medium Mode 3", "address": 1337, "data_type": "DIGI5", "category": "status", "min": 0.0, "max": 99.9, "step": 0.1},
-    "SG05": {"name": "Additional hot water temp. in Mode 4", "address": 1338, "data_type": "TEMP", "category": "status", "min": 0.0, "max": 25.0, "step": 0.5, "unit": "°C"},
-    "SG06": {"name": "Additional heating water temp. in Mode 4", "address": 1339, "data_type": "TEMP", "category": "status", "min": 0.0, "max": 25.0, "step": 0.5, "unit": "°C"},
-    "SG07": {"name": "Additional Cooling water temp. in Mode 4", "address": 1340, "data_type": "TEMP", "category": "status", "min": 0.0, "max": 25.0, "step": 0.5, "unit": "°C"},
-    "H": {"name": "H", "address": 1026, "data_type": "DIGI1", "category": "system", "min": 0.0, "max": 65535.0, "step": 10},
-    "H10": {"name": "Unit Address", "address": 1024, "data_type": "DIGI1", "category": "system", "min": 1.0, "max": 32.0, "step": 5},
-    "H29": {"name": "Operation Code", "address": 1034, "data_type": "DIGI1", "category": "system", "min": 0.0, "max": 20.0, "step": 5, "unit": "%"},
-    "H32": {"name": "Force Switch Mode Time", "address": 1045, "data_type": "DIGI1", "category": "system", "min": 1.0, "max": 300.0, "step": 10, "unit": "min"},
-    "H34": {"name": "ERP Testing Mode", "address": 1020, "data_type": "DIGI1", "category": "system", "min": 0.0, "max": 3.0, "step": 1},
-    "H41": {"name": "Password for unmodified parameters", "address": 1346, "data_type": "DIGI1", "category": "system", "min": 66.0, "max": 999.0, "step": 10},
-    "H42": {"name": "AT for bottom plate heater turned on", "address": 1356, "data_type": "TEMP", "category": "system", "min": -20.0, "max": 20.0, "step": 0.5},
-    "Test1": {"name": "Test1", "address": 1212, "data_type": "TEMP", "category": "temperatures", "min": -10.0, "max": 10.0, "step": 0.5},
-    "Test11": {"name": "Test11", "address": 1353, "data_type": "TEMP", "category": "temperatures", "min": -10.0, "max": 10.0, "step": 0.5},
-    "Test12": {"name": "Test12", "address": 1354, "data_type": "TEMP", "category": "temperatures", "min": -10.0, "max": 10.0, "step": 0.5},
-    "Test2": {"name": "Test2", "address": 1213, "data_type": "TEMP", "category": "temperatures", "min": -10.0, "max": 10.0, "step": 0.5},
-    "Test3": {"name": "Test3", "address": 1214, "data_type": "TEMP", "category": "temperatures", "min": -10.0, "max": 10.0, "step": 0.5},
-    "Test9": {"name": "Test9", "address": 1355, "data_type": "TEMP", "category": "temperatures", "min": -10.0, "max": 10.0, "step": 0.5},
-    "TimerMuteOffHour": {"name": "TimerMuteOffHour", "address": 1248, "data_type": "DIGI1", "category": "temperatures", "min": 0.0, "max": 23.0, "step": 5, "unit": "min"},
-    "TimerMuteOffMinute": {"name": "TimerMuteOffMinute", "address": 1249, "data_type": "DIGI1", "category": "temperatures", "min": 0.0, "max": 59.0, "step": 5, "unit": "min"},
-    "TimerMuteOnHour": {"name": "TimerMuteOnHour", "address": 1245, "data_type": "DIGI1", "category": "temperatures", "min": 0.0, "max": 23.0, "step": 5, "unit": "min"},
-    "TimerMuteOnMinute": {"name": "TimerMuteOnMinute", "address": 1246, "data_type": "DIGI1", "category": "temperatures", "min": 0.0, "max": 59.0, "step": 5, "unit": "min"},
-    "Z02": {"name": "Zone 1 Target RT", "address": 1070, "data_type": "TEMP", "category": "zones", "min": 10.0, "max": 35.0, "step": 0.5},
-    "Z03": {"name": "Zone 1 RT Diff. to Start", "address": 1071, "data_type": "TEMP", "category": "zones", "min": 0.0, "max": 10.0, "step": 0.5},
-    "Z04": {"name": "Zone 2 Target RT", "address": 1072, "data_type": "TEMP", "category": "zones", "min": 10.0, "max": 35.0, "step": 0.5},
-    "Z05": {"name": "Zone 2 RT Diff. to Start", "address": 1073, "data_type": "TEMP", "category": "zones", "min": 0.0, "max": 10.0, "step": 0.5},
-    "Z06": {"name": "Zone 1 Heating Target Outlet WT", "address": 1075, "data_type": "TEMP", "category": "zones", "step": 0.5},
-    "Z07": {"name": "Zone 2 Mixing Target Outlet WT", "address": 1076, "data_type": "TEMP", "category": "zones", "step": 0.5},
-    "Z08": {"name": "Mixing Valve Manual Adjustment Ratio (0% for Auto", "address": 1080, "data_type": "DIGI1", "category": "zones", "min": 0.0, "max": 100.0, "step": 5, "unit": "%"},
-    "Z09": {"name": "Mixing Valve Opening Time", "address": 1082, "data_type": "DIGI1", "category": "zones", "min": 0.0, "max": 2000.0, "step": 10, "unit": "min"},
-    "Z10": {"name": "Mixing Valve Closing Time", "address": 1084, "data_type": "DIGI1", "category": "zones", "min": 0.0, "max": 2000.0, "step": 10, "unit": "min"},
-    "Z11": {"name": "Mixing Valve Adjustment P(PID)", "address": 1085, "data_type": "DIGI5", "category": "zones", "min": 0.0, "max": 10.0, "step": 0.1},
-    "Z12": {"name": "Mixing Valve Adjustment I(PID)", "address": 1088, "data_type": "DIGI5", "category": "zones", "min": 0.0, "max": 10.0, "step": 0.1},
-    "Z13": {"name": "Mixing Valve PID Period", "address": 1090, "data_type": "DIGI1", "category": "zones", "min": 1.0, "max": 20.0, "step": 5},
-    "Z14": {"name": "Steps of Mixing Valve in Cooling", "address": 1134, "data_type": "DIGI1", "category": "zones", "min": 0.0, "max": 100.0, "step": 5, "unit": "steps"},
-    "Z15": {"name": "Zone 2 Max. Water Target Temp.", "address": 1135, "data_type": "TEMP", "category": "zones", "step": 0.5, "unit": "°C"},
-    "Z19": {"name": "Diff. of No Pump On at Low Water Temp.", "address": 1357, "data_type": "TEMP", "category": "zones", "min": 0.0, "max": 25.0, "step": 0.5, "unit": "°C"},
-    "Zone 2 Cure Slope": {"name": "Zone 2 Cure Slope", "address": 1078, "data_type": "DIGI5", "category": "zones", "min": 0.0, "max": 4.0, "step": 0.1},
-    "Zone 2 Curve Offset": {"name": "Zone 2 Curve Offset", "address": 1079, "data_type": "DIGI5", "category": "zones", "min": 0.0, "max": 60.0, "step": 0.1},
-}
+WRITABLE_RECORDS = (
+    ("C01", "Manual Comp. Frequency", 1218, "DIGI1", "compressor", 0.0, 120.0, None, None, 10, "Hz"),
+    ("C02", "Min. Comp. Frequency", 1219, "DIGI1", "compressor", 20.0, 60.0, None, None, 5, "Hz"),
+    ("C03", "Max. Comp. Frequency", 1220, "DIGI1", "compressor", 30.0, 120.0, None, None, 5, "Hz"),
+    ("C04", "Model Selection", 1221, "DIGI1", "compressor", 0.0, 100.0, None, None, 5, ""),
+    ("C05", "Min. Comp. Frequency in Cooling at Low Ambient Temp.", 1222, "DIGI1", "compressor", 0.0, 60.0, None, None, 5, "°C"),
+    ("C06", "Frequency Control Mode", 1223, "DIGI1", "compressor", 1.0, 120.0, None, None, 10, "Hz"),
+    ("C07", "Resonance Point 1", 1224, "DIGI1", "compressor", 0.0, 120.0, None, None, 10, ""),
+    ("C08", "Resonance Point 2", 1225, "DIGI1", "compressor", 0.0, 120.0, None, None, 10, ""),
+    ("C09", "Resonance Point 3", 1226, "DIGI1", "compressor", 0.0, 120.0, None, None, 10, ""),
+    ("C10", "Min. Comp. Frequency in Heating at Low Ambient Temp.", 1227, "DIGI1", "compressor", 0.0, 120.0, None, None, 10, "°C"),
+    ("C11", "Max. Comp. Frequency in Cooling at High Ambient Temp.", 1217, "DIGI1", "compressor", 0.0, 120.0, None, None, 10, "°C"),
+    ("C12", "Max. Comp. Frequency in DHW mode", 1347, "DIGI1", "compressor", 30.0, None, None, "C03", 1, "Hz"),
+    ("C13", "P of Comp. Frequency PID", 1348, "DIGI1", "compressor", 0.0, 10.0, None, None, 1, "Hz"),
+    ("C14", "I of Comp. Frequency PID", 1349, "DIGI1", "compressor", 0.0, 10.0, None, None, 1, "Hz"),
+    ("C15", "D of Comp. Frequency PID", 1350, "DIGI1", "compressor", 0.0, 10.0, None, None, 1, "Hz"),
+    ("compensate_offset", "compensate offset", 1235, "TEMP", "compressor", 0.0, 75.0, None, None, 0.5, ""),
+    ("compensate_slope", "compensate slope", 1234, "DIGI5", "compressor", 0.0, 3.5, None, None, 0.1, ""),
+    ("D01", "Ambient Temp. of Starting Defrosting", 1105, "TEMP", "defrost", -37.0, 45.0, None, None, 0.5, "°C"),
+    ("D02", "Heating Operation Time Before Defrosting", 1106, "DIGI1", "defrost", 0.0, 120.0, None, None, 10, "min"),
+    ("D03", "Interval Time Between Defrosting Cycles", 1107, "DIGI1", "defrost", 10.0, 90.0, None, None, 5, "min"),
+    ("D04", "Exhaust Temp. Correction for Defrosting Cycle", 1108, "TEMP", "defrost", 0.0, 150.0, None, None, 0.5, "°C"),
+    ("D05-1", "Defrosting Suction Pressure 1", 1109, "DIGI5", "defrost", 0.0, 45.0, None, None, 0.1, "bar"),
+    ("D05-2", "Defrosting Suction Pressure 2", 1110, "DIGI5", "defrost", 0.0, 45.0, None, None, 0.1, "bar"),
+    ("D06", "Defrosting Cycle Time Correction", 1111, "DIGI1", "defrost", 0.0, 120.0, None, None, 10, "min"),
+    ("D07", "Ambient Temp. of Start Sliding Defrosting", 1112, "TEMP", "defrost", -37.0, 45.0, None, None, 0.5, "°C"),
+    ("D08", "Suction Temp. of Start Sliding Defrosting", 1113, "TEMP", "defrost", -37.0, 45.0, None, None, 0.5, "°C"),
+    ("D09", "Ambient Temp. of Stop Sliding Defrosting", 1114, "TEMP", "defrost", -37.0, 45.0, None, None, 0.5, "°C"),
+    ("D10", "Suction Temp. of Stop Sliding Defrosting", 1115, "TEMP", "defrost", -37.0, 45.0, None, None, 0.5, "°C"),
+    ("D11", "Min. Inlet Water Temp. of Defrosting", 1116, "TEMP", "defrost", 4.0, 65.0, None, None, 0.5, "°C"),
+    ("D12", "Suction Pressure of Forced Defrosting", 1117, "DIGI5", "defrost", 0.0, 45.0, None, None, 0.1, "bar"),
+    ("D13", "Heating Operation Time Before Forced Defrosting", 1118, "DIGI1", "defrost", 0.0, 360.0, None, None, 10, "min"),
+    ("D14", "Fan Motor Power Ratio to Extend Defrosting Cycle", 1119, "DIGI9", "defrost", 0.0, 5.0, None, None, 0.1, "%"),
+    ("D15", "Fan Motor Power Ratio to Enter Forced Defrosting", 1120, "DIGI9", "defrost", 0.0, 5.0, None, None, 0.1, "%"),
+    ("D16", "Max. Fan Motor Power to Enter Forced Defrosting", 1121, "DIGI1", "defrost", 50.0, 1000.0, None, None, 10, ""),
+    ("D17", "Coil Temp. of Exit Defrosting", 1122, "TEMP", "defrost", -37.0, 45.0, None, None, 0.5, "°C"),
+    ("D18", "Distributor Tube Temp. of Exit Defrosting", 1123, "TEMP", "defrost", -37.0, 80.0, None, None, 0.5, "°C"),
+    ("D19", "Max. Defrosting Time", 1124, "DIGI1", "defrost", 0.0, 20.0, None, None, 5, "min"),
+    ("D20", "Defrosting Frequency", 1125, "DIGI1", "defrost", 30.0, 90.0, None, None, 5, "Hz"),
+    ("D22", "Water Flow of Defrosting", 1127, "DIGI9", "defrost", 0.0, 50.0, None, None, 0.1, "L/min"),
+    ("D23", "Max. Defrosting Cycle by Fan Motor Power", 1128, "DIGI1", "defrost", 0.0, 240.0, None, None, 10, ""),
+    ("D25", "Max. Water Temp. Decrease during Defrosting", 1130, "TEMP", "defrost", 2.0, 65.0, None, None, 0.5, "°C"),
+    ("D29", "Min. Defrost Time", 1402, "DIGI1", "defrost", 0.0, 20.0, None, None, 5, "min"),
+    ("D30", "Bottom Heater Delays Off Time after Defrost", 1437, "DIGI1", "defrost", 0.0, 60.0, None, None, 5, "min"),
+    ("DP2", "Dew Point Temp. Offset Value", 1388, "TEMP", "defrost", -10.0, 10.0, None, None, 0.5, "°C"),
+    ("DP2-temp", "End OT Cooling", 1382, "TEMP", "defrost", 4.0, 25.0, None, None, 0.5, ""),
+    ("DP3", "Temp. diff. between indoor&outdoor temp. to stop", 1389, "TEMP", "defrost", 4.0, 25.0, None, None, 0.5, "°C"),
+    ("DP3-TEMP", "Offset dew point", 1384, "TEMP", "defrost", -10.0, 10.0, None, None, 0.5, ""),
+    ("DefrstForceAmbient", "DefrstForceAmbient", 1141, "TEMP", "defrost", -30.0, 30.0, None, None, 0.5, ""),
+    ("G01", "Disinfection Water Temp.", 1152, "TEMP", "disinfection", 60.0, 70.0, None, None, 0.5, "°C"),
+    ("G02", "Time Duration of Disinfection", 1153, "DIGI1", "disinfection", 0.0, 60.0, None, None, 5, "min"),
+    ("G03", "Disinfection Starting Time", 1154, "DIGI1", "disinfection", 0.0, 23.0, None, None, 5, "min"),
+    ("G04", "Interval Period of Disinfection", 1155, "DIGI1", "disinfection", 1.0, 30.0, None, None, 5, ""),
+    ("E02", "Target Superheat for Heating", 1132, "TEMP", "eev", -20.0, 20.0, None, None, 0.5, ""),
+    ("E03", "EEV Initial Steps for Heating", 1133, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E03-1", "EEV Initial Steps for Heating1", 1200, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E03-2", "EEV Initial Steps for Heating2", 1142, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E03-3", "EEV Initial Steps for Heating3", 1206, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E03-4", "EEV Initial Steps for Heating4", 1207, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E03-5", "EEV Initial Steps for Heating5", 1208, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E07", "EEV Min. Steps", 1137, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E07-1", "EEV Min. Steps1", 1209, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E07-2", "EEV Min. Steps2", 1210, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E07-3", "EEV Min. Steps3", 1211, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E07-4", "EEV Min. Steps4", 1215, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E07-5", "EEV Min. Steps5", 1216, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E08", "EEV Initial Steps for Cooling", 1138, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E10", "EVI EEV: Initial Steps", 1140, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E13", "EVI EEV Target Superheat Degree", 1143, "TEMP", "eev", -20.0, 20.0, None, None, 0.5, ""),
+    ("E14", "EVI EEV Min. Steps", 1144, "DIGI1", "eev", 0.0, 500.0, None, None, 10, "steps"),
+    ("E17", "Defrosting EEV Steps", 1147, "DIGI1", "eev", 10.0, 500.0, None, None, 10, "steps"),
+    ("E18", "Target Superheat for Cooling", 1148, "TEMP", "eev", -10.0, 10.0, None, None, 0.5, ""),
+    ("E19", "EEV Adjustment Range In Smart Mode", 1149, "DIGI1", "eev", 0.0, 300.0, None, None, 10, ""),
+    ("E20", "P of EEV PID", 1351, "DIGI1", "eev", 0.0, 10.0, None, None, 1, ""),
+    ("E21", "I of EEV PID", 1352, "DIGI1", "eev", 0.0, 10.0, None, None, 1, ""),
+    ("EMS Strategy", "EMS Strategy", 8001, "DIGI1", "eev", 0.0, 4.0, None, None, 1, ""),
+    ("EMS01", "Low PV Max. Load Ratio", 1422, "DIGI1", "eev", 0.0, 100.0, None, None, 5, "%"),
+    ("EMS02", "Colling Mode Target Temp. Compen.", 1423, "TEMP", "eev", 0.0, 20.0, None, None, 0.5, "°C"),
+    ("EMS03", "Heating Mode Target Temp. Compen.", 1424, "TEMP", "eev", 0.0, 20.0, None, None, 0.5, "°C"),
+    ("EMS04", "DHW Mode Target Temp. Compen.", 1425, "TEMP", "eev", 0.0, 20.0, None, None, 0.5, "°C"),
+    ("EMS05", "Zone Room Target Temp. Compen.", 1426, "TEMP", "eev", 0.0, 20.0, None, None, 0.5, "°C"),
+    ("EMS06", "Max. Selling Power", 1427, "DIGI1", "eev", 0.0, 6000.0, None, None, 10, ""),
+    ("EMS07", "Power Limit", 8006, "DIGI5", "eev", 0.0, 99.9, None, None, 0.1, ""),
+    ("Electricity Price", "Electricity Price", 8002, "TEMP", "eev", None, None, None, None, 0.5, ""),
+    ("F02", "Coil Temp.. for Max. Fan Speed in Cooling", 1060, "TEMP", "fan", -15.0, 60.0, None, None, 0.5, "°C"),
+    ("F03", "Coil Temp.. for Min. Fan Speed in Cooling", 1062, "TEMP", "fan", -15.0, 60.0, None, None, 0.5, "°C"),
+    ("F05", "Coil Temp.. for Max. Fan Speed in Heating", 1066, "TEMP", "fan", -15.0, 60.0, None, None, 0.5, "°C"),
+    ("F06", "Coil Temp.. for Min. Fan Speed in Heating", 1068, "TEMP", "fan", -15.0, 60.0, None, None, 0.5, "°C"),
+    ("F18", "Min. Fan Speed in Cooling", 1081, "DIGI1", "fan", 10.0, 1300.0, None, None, 10, "rpm"),
+    ("F19", "Min. Fan Speed in Heating", 1083, "DIGI1", "fan", 10.0, 1300.0, None, None, 10, "rpm"),
+    ("F23", "Rated DC Fan Motor Speed", 1089, "DIGI1", "fan", 10.0, 1300.0, None, None, 10, "rpm"),
+    ("F25", "Max. Fan Speed in Cooling", 1103, "DIGI1", "fan", 10.0, 1300.0, None, None, 10, "rpm"),
+    ("F26", "Max. Fan Speed in Heating", 1104, "DIGI1", "fan", 10.0, 1300.0, None, None, 10, "rpm"),
+    ("F28", "CT to Reduce Two Fans to One in Cooling", 1101, "TEMP", "fan", -30.0, 60.0, None, None, 0.5, ""),
+    ("F29", "CT to Stop Single Fan in Cooling", 1102, "TEMP", "fan", -30.0, 60.0, None, None, 0.5, ""),
+    ("FT3", "Target Temp.", 1374, "TEMP", "fan", 0.0, 99.9, None, None, 0.5, "°C"),
+    ("FT4", "Compressor Frequency", 1375, "DIGI1", "fan", 0.0, 120.0, None, None, 10, "Hz"),
+    ("FT5", "Target Speed of Fan1", 1376, "DIGI1", "fan", 0.0, 1300.0, None, None, 10, "rpm"),
+    ("FT6", "Target Speed of Fan2", 1377, "DIGI1", "fan", 0.0, 1300.0, None, None, 10, "rpm"),
+    ("FT7", "EEV Steps", 1378, "DIGI1", "fan", 0.0, 550.0, None, None, 10, "steps"),
+    ("FT8", "EVI Steps", 1379, "DIGI1", "fan", 0.0, 550.0, None, None, 10, "steps"),
+    ("FT9", "Speed of Circulation Pump", 1380, "DIGI1", "fan", 0.0, 100.0, None, None, 5, ""),
+    ("Fault", "Fault", 8010, "DIGI1", "fan", None, None, None, None, 1, ""),
+    ("/", "Unit Max. Power Limit", 1405, "DIGI5", "other", 0.0, 99.9, None, None, 0.1, ""),
+    ("Battery Power", "Battery Power", 8003, "Float", "other", None, None, None, None, 1, ""),
+    ("Battery SoC", "Battery SoC", 8005, "DIGI5", "other", 0.0, 100.0, None, None, 0.1, ""),
+    ("IntevalSeconds", "IntervalSecondsReport", 1145, "DIGI1", "other", 30.0, 300.0, None, None, 10, ""),
+    ("KG1", "Frist_Period_Power_ONOFF_Start", 1256, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG10", "Fifth_Period_Power_ONOFF_End", 1265, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG11", "Sixth_Period_Power_ONOFF_Start", 1266, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG12", "Sixth_Period_Power_ONOFF_End", 1267, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG2", "Frist_Period_Power_ONOFF_End", 1257, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG3", "Second_Period_Power_ONOFF_Start", 1258, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG4", "Second_Period_Power_ONOFF_End", 1259, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG5", "Third_Period_Power_ONOFF_Start", 1260, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG6", "Third_Period_Power_ONOFF_End", 1261, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG7", "Fourth_Period_Power_ONOFF_Start", 1262, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG8", "Fourth_Period_Power_ONOFF_End", 1263, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("KG9", "Fifth_Period_Power_ONOFF_Start", 1264, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L01", "P", 5091, "DIGI5", "other", 0.0, 99.0, None, None, 0.1, ""),
+    ("L02", "I", 5092, "DIGI5", "other", 0.0, 99.0, None, None, 0.1, ""),
+    ("L03", "D", 5093, "DIGI5", "other", 0.0, 99.0, None, None, 0.1, ""),
+    ("L04", "Cycle of PID", 5094, "DIGI1", "other", 0.0, 100.0, None, None, 5, ""),
+    ("L05", "Percentage of Units Allowed to Defrost", 5095, "DIGI1", "other", 0.0, 100.0, None, None, 5, ""),
+    ("L06", "Quantity of Units in The Project", 5096, "DIGI1", "other", 1.0, 16.0, None, None, 5, ""),
+    ("L08", "Low Diff. Value of Optimal Load Ratio", 5098, "Float", "other", -100.0, 100.0, None, None, 10, "%"),
+    ("L09", "High Diff. Value of Optimal Load Ratio", 5099, "Float", "other", -100.0, 100.0, None, None, 10, "%"),
+    ("L12", "Cooling Target Temp.", 5102, "TEMP", "other", None, None, "L16", "L15", 0.5, "°C"),
+    ("L13", "Heating Target Temp.", 5103, "TEMP", "other", None, None, "L18", "L17", 0.5, "°C"),
+    ("L14", "DHW Target Temp.", 5104, "TEMP", "other", None, None, "L20", "L19", 0.5, "°C"),
+    ("L15", "Max. Cooling Target Temp.", 5105, "TEMP", "other", -30.0, 80.0, None, None, 0.5, "°C"),
+    ("L16", "Min. Cooling Target Temp.", 5106, "TEMP", "other", -30.0, 80.0, None, None, 0.5, "°C"),
+    ("L17", "Max. Heating Target Temp.", 5107, "TEMP", "other", -30.0, 90.0, None, None, 0.5, "°C"),
+    ("L18", "Min. Heating Target Temp.", 5108, "TEMP", "other", -30.0, 90.0, None, None, 0.5, "°C"),
+    ("L19", "Max. DHW Target Temp.", 5109, "TEMP", "other", 0.0, 85.0, None, None, 0.5, "°C"),
+    ("L20", "Min. DHW Target Temp.", 5110, "TEMP", "other", 0.0, 85.0, None, None, 0.5, "°C"),
+    ("L23", "Slope", 5113, "DIGI5", "other", 0.0, 3.5, None, None, 0.1, ""),
+    ("L24", "Offset", 5114, "TEMP", "other", 0.0, 85.0, None, None, 0.5, ""),
+    ("L28", "Electric Heater On AT", 5118, "TEMP", "other", -30.0, 60.0, None, None, 0.5, ""),
+    ("L29", "Electric Heater Delays On Time", 5119, "DIGI1", "other", 10.0, 999.0, None, None, 10, "min"),
+    ("L30", "Electric Heater Forced On Time", 5120, "DIGI1", "other", 10.0, 1440.0, None, None, 10, "min"),
+    ("L31", "AT to Start Electric Heater Without Delay", 5121, "TEMP", "other", -30.0, 60.0, None, None, 0.5, ""),
+    ("L32", "Electric Heater Off Temp. Diff", 5122, "TEMP", "other", 0.0, 20.0, None, None, 0.5, "°C"),
+    ("L33", "Electric Heater Opening Temp.Diff", 5123, "TEMP", "other", 0.0, 20.0, None, None, 0.5, "°C"),
+    ("L34", "Electric Heater On Load", 5124, "DIGI1", "other", 0.0, 100.0, None, None, 5, ""),
+    ("M1 Cooling Target", "Mode&Temp.&Power Timer1 Cooling Target", 1285, "TEMP", "other", None, None, "R08", "R09", 0.5, "°C"),
+    ("M1 End", "Mode&Temp.&Power Timer1 End", 1282, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M1 Heating Target", "Mode&Temp.&Power Timer1 Heating Target", 1284, "TEMP", "other", None, None, "R10", "R11", 0.5, "°C"),
+    ("M1 Hot Water Target", "Mode&Temp.&Power Timer1 Hot Water Target", 1283, "TEMP", "other", None, None, "R36", "R37", 0.5, "°C"),
+    ("M1 Max. Power", "Mode&Temp.&Power Timer1 Max. Power", 1287, "DIGI5", "other", 0.0, 99.9, None, None, 0.1, "°C"),
+    ("M1 Start", "Mode&Temp.&Power Timer1 Start", 1281, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M2 Cooling Target", "Mode&Temp.&Power Timer2 Cooling Target", 1292, "TEMP", "other", None, None, "R08", "R09", 0.5, "°C"),
+    ("M2 End", "Mode&Temp.&Power Timer2 End", 1289, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M2 Heating Target", "Mode&Temp.&Power Timer2 Heating Target", 1291, "TEMP", "other", None, None, "R10", "R11", 0.5, "°C"),
+    ("M2 Hot Water Target", "Mode&Temp.&Power Timer2 Hot Water Target", 1290, "TEMP", "other", None, None, "R36", "R37", 0.5, "°C"),
+    ("M2 Max. Power", "Mode&Temp.&Power Timer2 Max. Power", 1294, "DIGI5", "other", 0.0, 99.9, None, None, 0.1, "°C"),
+    ("M2 Start", "Mode&Temp.&Power Timer2 Start", 1288, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M3 Cooling Target", "Mode&Temp.&Power Timer3 Cooling Target", 1299, "TEMP", "other", None, None, "R08", "R09", 0.5, "°C"),
+    ("M3 End", "Mode&Temp.&Power Timer3 End", 1296, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M3 Heating Target", "Mode&Temp.&Power Timer3 Heating Target", 1298, "TEMP", "other", None, None, "R10", "R11", 0.5, "°C"),
+    ("M3 Hot Water Target", "Mode&Temp.&Power Timer3 Hot Water Target", 1297, "TEMP", "other", None, None, "R36", "R37", 0.5, "°C"),
+    ("M3 Max. Power", "Mode&Temp.&Power Timer3 Max. Power", 1301, "DIGI5", "other", 0.0, 99.9, None, None, 0.1, "°C"),
+    ("M3 Start", "Mode&Temp.&Power Timer3 Start", 1295, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M4 Cooling Target", "Mode&Temp.&Power Timer4 Cooling Target", 1306, "TEMP", "other", None, None, "R08", "R09", 0.5, "°C"),
+    ("M4 End", "Mode&Temp.&Power Timer4 End", 1303, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M4 Heating Target", "Mode&Temp.&Power Timer4 Heating Target", 1305, "TEMP", "other", None, None, "R10", "R11", 0.5, "°C"),
+    ("M4 Hot Water Target", "Mode&Temp.&Power Timer4 Hot Water Target", 1304, "TEMP", "other", None, None, "R36", "R37", 0.5, "°C"),
+    ("M4 Max. Power", "Mode&Temp.&Power Timer4 Max. Power", 1308, "DIGI5", "other", 0.0, 99.9, None, None, 0.1, "°C"),
+    ("M4 Start", "Mode&Temp.&Power Timer4 Start", 1302, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M5 Cooling Target", "Mode&Temp.&Power Timer5 Cooling Target", 1313, "TEMP", "other", None, None, "R08", "R09", 0.5, "°C"),
+    ("M5 End", "Mode&Temp.&Power Timer5 End", 1310, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M5 Heating Target", "Mode&Temp.&Power Timer5 Heating Target", 1312, "TEMP", "other", None, None, "R10", "R11", 0.5, "°C"),
+    ("M5 Hot Water Target", "Mode&Temp.&Power Timer5 Hot Water Target", 1311, "TEMP", "other", None, None, "R36", "R37", 0.5, "°C"),
+    ("M5 Max. Power", "Mode&Temp.&Power Timer5 Max. Power", 1315, "DIGI5", "other", 0.0, 99.9, None, None, 0.1, "°C"),
+    ("M5 Start", "Mode&Temp.&Power Timer5 Start", 1309, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M6 Cooling Target", "Mode&Temp.&Power Timer6 Cooling Target", 1320, "TEMP", "other", None, None, "R08", "R09", 0.5, "°C"),
+    ("M6 End", "Mode&Temp.&Power Timer6 End", 1317, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("M6 Heating Target", "Mode&Temp.&Power Timer6 Heating Target", 1319, "TEMP", "other", None, None, "R10", "R11", 0.5, "°C"),
+    ("M6 Hot Water Target", "Mode&Temp.&Power Timer6 Hot Water Target", 1318, "TEMP", "other", None, None, "R36", "R37", 0.5, "°C"),
+    ("M6 Max. Power", "Mode&Temp.&Power Timer6 Max. Power", 1322, "DIGI5", "other", 0.0, 99.9, None, None, 0.1, "°C"),
+    ("M6 Start", "Mode&Temp.&Power Timer6 Start", 1316, "DIGI1", "other", None, None, None, None, 1, "°C"),
+    ("W1 End", "Warm Water Cir. Pump Timer1 End", 1327, "DIGI1", "other", None, None, None, None, 1, "min"),
+    ("W1 Start", "Warm Water Cir. Pump Timer1 Start", 1326, "DIGI1", "other", None, None, None, None, 1, "min"),
+    ("W2 End", "Warm Water Cir. Pump Timer2 End", 1329, "DIGI1", "other", None, None, None, None, 1, "min"),
+    ("W2 Start", "Warm Water Cir. Pump Timer2 Start", 1328, "DIGI1", "other", None, None, None, None, 1, "min"),
+    ("W3 End", "Warm Water Cir. Pump Timer3 End", 1331, "DIGI1", "other", None, None, None, None, 1, "min"),
+    ("W3 Start", "Warm Water Cir. Pump Timer3 Start", 1330, "DIGI1", "other", None, None, None, None, 1, "min"),
+    ("OnGridPower", "OnGridPower", 8004, "Float", "outputs", None, None, None, None, 1, ""),
+    ("A03", "Shutdown Ambient Temp.", 1037, "TEMP", "protection", -40.0, 10.0, None, None, 0.5, "°C"),
+    ("A04", "Antifreeze Temp.", 1038, "TEMP", "protection", None, 10.0, "A22", None, 0.5, "°C"),
+    ("A05", "Antifreeze Temp. Difference", 1039, "TEMP", "protection", 1.0, 50.0, None, None, 0.5, "°C"),
+    ("A06", "Max. Exhaust Temp.", 1040, "TEMP", "protection", 60.0, 130.0, None, None, 0.5, "°C"),
+    ("A22", "Min. Antifreeze Temp.", 1053, "TEMP", "protection", -20.0, 10.0, None, None, 0.5, "°C"),
+    ("A23", "Min. Outlet Water Temp. Protect", 1043, "TEMP", "protection", -30.0, 20.0, None, None, 0.5, "°C"),
+    ("A24", "Excess Temp. Diff. Between Inlet and Outlet Temp.", 1044, "TEMP", "protection", 0.0, 30.0, None, None, 0.5, "°C"),
+    ("A25", "Minimum Evaporation Temp. of Cooling", 1055, "TEMP", "protection", -50.0, 30.0, None, None, 0.5, "°C"),
+    ("A26", "Refrigerant Type", 1054, "DIGI1", "protection", 0.0, 99.0, None, None, 5, ""),
+    ("A27", "Temp. Diff. of Limiting Frequency", 1056, "TEMP", "protection", -20.0, 95.0, None, None, 0.5, "°C"),
+    ("A28", "Temp. Diff. Between Outlet and DHW Temp.", 1057, "TEMP", "protection", -20.0, 95.0, None, None, 0.5, "°C"),
+    ("A30", "Min. AT for Cooling", 1051, "TEMP", "protection", -30.0, 60.0, None, None, 0.5, ""),
+    ("A31", "Electric Heater On AT", 1049, "TEMP", "protection", -30.0, 60.0, None, None, 0.5, ""),
+    ("A32", "Electric Heater Delays Comp. On Time", 1050, "DIGI1", "protection", 10.0, 999.0, None, None, 10, "min"),
+    ("A33", "Electric Heater Opening Temp. Diff", 1063, "TEMP", "protection", 0.0, 20.0, None, None, 0.5, "°C"),
+    ("A34", "Crank preheating time", 1064, "DIGI1", "protection", 0.0, 360.0, None, None, 10, "min"),
+    ("A35", "Electric Heater OFF Temp. Diff", 1031, "TEMP", "protection", 0.0, 30.0, None, None, 0.5, "°C"),
+    ("A38", "Low Pressure of Limiting Frequency", 1342, "DIGI5", "protection", 0.0, 20.0, None, None, 0.1, "bar"),
+    ("A39", "Max. Current Value", 1343, "DIGI5", "protection", 0.0, 50.0, None, None, 0.1, "A"),
+    ("A40", "Rated Water Flow", 1344, "DIGI9", "protection", 0.0, 9.99, None, None, 0.1, "L/min"),
+    ("app_heartbeat", "app_heartbeat", 1191, "DIGI1", "protection", 0.0, 23205.0, None, None, 10, ""),
+    ("P02", "Interval Time", 1198, "DIGI1", "pump", 1.0, 120.0, None, None, 10, "min"),
+    ("P03", "Operation Duration Time", 1199, "DIGI1", "pump", 1.0, 30.0, None, None, 5, "min"),
+    ("P09", "Circulation Pump Protection Period", 1203, "DIGI1", "pump", 0.0, 30.0, None, None, 5, ""),
+    ("P10", "Speed of Circulation Pump", 1205, "DIGI1", "pump", 0.0, 100.0, None, None, 5, ""),
+    ("P11", "Target Temp. Diff. for Pump Speed Control", 1432, "TEMP", "pump", 0.0, 20.0, None, None, 0.5, "°C"),
+    ("P12", "Pump Speed Adjust Range for Each Period", 1433, "DIGI1", "pump", 0.0, 10.0, None, None, 1, ""),
+    ("P13", "Refill Valve Start Cycle (for IDU)", 1435, "DIGI1", "pump", 0.0, 200.0, None, None, 10, ""),
+    ("P14", "Refill Valve Working Duration (for IDU)", 1436, "DIGI1", "pump", 0.0, 6000.0, None, None, 10, "min"),
+    ("P15", "Target Water Pressure (for IDU)", 1438, "DIGI5", "pump", 0.0, 20.0, None, None, 0.1, "bar"),
+    ("P16", "Stop Refilling Pressure Diff. (for IDU)", 1444, "DIGI5", "pump", 0.0, 5.0, None, None, 0.1, "bar"),
+    ("P99", "P99", 1381, "DIGI1", "pump", 0.0, 100.0, None, None, 5, ""),
+    ("R01", "Domestic Hot Water / DHW Target Temp.", 1157, "TEMP", "setpoints", None, None, "R36", "R37", 0.5, "°C"),
+    ("R02", "Heating Target Temp.", 1158, "TEMP", "setpoints", None, None, "R10", "R11", 0.5, "°C"),
+    ("R03", "Cooling Target Temp.", 1159, "TEMP", "setpoints", None, None, "R08", "R09", 0.5, "°C"),
+    ("R04", "Temp. Diff. for Power-on in Heating", 1160, "TEMP", "setpoints", 0.0, 10.0, None, None, 0.5, "°C"),
+    ("R05", "Temp. Diff. for Standby in Heating", 1161, "TEMP", "setpoints", 0.0, 10.0, None, None, 0.5, "°C"),
+    ("R06", "Temp. Diff. for Power-on in Cooling", 1174, "TEMP", "setpoints", 0.0, 10.0, None, None, 0.5, "°C"),
+    ("R07", "Temp. Diff. for Standby in Cooling", 1175, "TEMP", "setpoints", 0.0, 10.0, None, None, 0.5, "°C"),
+    ("R08", "Min. Cooling Target Temp.", 1162, "TEMP", "setpoints", -30.0, None, None, "R09", 0.5, "°C"),
+    ("R09", "Max. Cooling Target Temp.", 1163, "TEMP", "setpoints", None, 80.0, "R08", None, 0.5, "°C"),
+    ("R10", "Min. Heating Target Temp.", 1164, "TEMP", "setpoints", -30.0, None, None, "R11", 0.5, "°C"),
+    ("R11", "Max. Heating Target Temp.", 1165, "TEMP", "setpoints", None, 99.0, "R10", None, 0.5, "°C"),
+    ("R15", "Temp. Diff. of Exiting Overhigh Outlet Temp.", 1166, "TEMP", "setpoints", 0.0, 15.0, None, None, 0.5, "°C"),
+    ("R16", "Temp. Diff. for Power-on in DHW", 1195, "TEMP", "setpoints", 0.0, 10.0, None, None, 0.5, "°C"),
+    ("R17", "Temp. Diff. for Standby in DHW", 1196, "TEMP", "setpoints", 0.0, 10.0, None, None, 0.5, "°C"),
+    ("R29", "Low AT for Water Temp. Limit On", 1167, "TEMP", "setpoints", None, 4.0, "R30", None, 0.5, "°C"),
+    ("R30", "Low AT for Water Temp. Limit Off", 1168, "TEMP", "setpoints", -35.0, None, None, "R29", 0.5, "°C"),
+    ("R31", "Max. Limit Outlet Water Temp. at Low AT", 1169, "TEMP", "setpoints", 20.0, 85.0, None, None, 0.5, "°C"),
+    ("R32", "High AT for Water Temp. Limit On", 1170, "TEMP", "setpoints", 0.1, None, None, "R33", 0.5, "°C"),
+    ("R33", "High AT for Water Temp. Limit Off", 1171, "TEMP", "setpoints", None, 60.0, "R32", None, 0.5, "°C"),
+    ("R34", "Max. Limit Outlet Water Temp. at High AT", 1172, "TEMP", "setpoints", 20.0, 85.0, None, None, 0.5, "°C"),
+    ("R36", "Min. DHW Target Temp.", 1176, "TEMP", "setpoints", 0.0, None, None, "R37", 0.5, "°C"),
+    ("R37", "Max. DHW Target Temp.", 1177, "TEMP", "setpoints", None, 85.0, "R36", None, 0.5, "°C"),
+    ("R39", "AT for Auto-start Heating Mode", 1192, "TEMP", "setpoints", 5.0, 20.0, None, None, 0.5, ""),
+    ("R40", "AT for Main Circulation Pump in Smart Mode", 1193, "TEMP", "setpoints", -10.0, 60.0, None, None, 0.5, ""),
+    ("R41", "AT for DHW Pump in Smart Mode", 1194, "TEMP", "setpoints", -10.0, 60.0, None, None, 0.5, ""),
+    ("R42", "Max. Outlet Water Temp. in Heating", 1228, "TEMP", "setpoints", 20.0, 85.0, None, None, 0.5, "°C"),
+    ("R43", "Max. Limit Target Water Temp. at Low AT in Heating", 1229, "TEMP", "setpoints", 20.0, 85.0, None, None, 0.5, "°C"),
+    ("R44", "Max. Limit Target Water Temp. at High AT in Heating", 1230, "TEMP", "setpoints", 20.0, 85.0, None, None, 0.5, "°C"),
+    ("R45", "AT to Start Electric Heater Without Delay", 1231, "TEMP", "setpoints", -50.0, 20.0, None, None, 0.5, ""),
+    ("R46", "Temp. Diff. between Max. DHW Target Temp. & Max. Outlet Temp.", 1232, "TEMP", "setpoints", 0.0, 25.0, None, None, 0.5, "°C"),
+    ("R60", "AT to Start Frequency Limit in Cooling", 1233, "TEMP", "setpoints", 0.0, 60.0, None, None, 0.5, "Hz"),
+    ("R61", "AT to Stop Frequency Limit in Cooling", 1237, "TEMP", "setpoints", 0.0, 60.0, None, None, 0.5, "Hz"),
+    ("R62", "Max. Heat Pump Outlet Water Temp.", 1238, "TEMP", "setpoints", 40.0, 95.0, None, None, 0.5, "°C"),
+    ("R70", "Target Room Temp.", 1239, "TEMP", "setpoints", 5.0, 27.0, None, None, 0.5, "°C"),
+    ("R71", "Room Temp. Diff. for Power-on in Heating", 1240, "TEMP", "setpoints", 0.1, 3.0, None, None, 0.5, "°C"),
+    ("R72", "Room Temp. Diff. for Standby in Heating", 1241, "TEMP", "setpoints", 0.1, 3.0, None, None, 0.5, "°C"),
+    ("R73", "Room Temp. Diff. for Power-on in Cooling", 1242, "TEMP", "setpoints", 0.1, 3.0, None, None, 0.5, "°C"),
+    ("R74", "Room Temp. Diff. for Standby in Cooling", 1243, "TEMP", "setpoints", 0.1, 3.0, None, None, 0.5, "°C"),
+    ("RT1-10", "Thermostat1_Offset", 7009, "TEMP", "setpoints", 8.0, 30.0, None, None, 0.5, ""),
+    ("RT1-2", "Thermostat1_RoomTarget", 7002, "TEMP", "setpoints", 8.0, 30.0, None, None, 0.5, ""),
+    ("RT1-9", "Thermostat1_Slope", 7008, "DIGI5", "setpoints", 0.0, 3.5, None, None, 0.1, ""),
+    ("RT2-10", "Thermostat2_Offset", 7099, "TEMP", "setpoints", 8.0, 30.0, None, None, 0.5, ""),
+    ("RT2-2", "Thermostat2_RoomTarget", 7092, "TEMP", "setpoints", 8.0, 30.0, None, None, 0.5, ""),
+    ("RT2-9", "Thermostat2_Slope", 7098, "DIGI5", "setpoints", 0.0, 3.5, None, None, 0.1, ""),
+    ("SG02", "Block Time of Mode 1", 1335, "DIGI1", "status", 0.0, 120.0, None, None, 10, "min"),
+    ("SG03", "Limited Power in Solar Low Mode 2", 1336, "DIGI5", "status", 0.0, 99.9, None, None, 0.1, ""),
+    ("SG04", "Limited Power in Solar Medium Mode 3", 1337, "DIGI5", "status", 0.0, 99.9, None, None, 0.1, ""),
+    ("SG05", "Additional hot water temp. in Mode 4", 1338, "TEMP", "status", 0.0, 25.0, None, None, 0.5, "°C"),
+    ("SG06", "Additional heating water temp. in Mode 4", 1339, "TEMP", "status", 0.0, 25.0, None, None, 0.5, "°C"),
+    ("SG07", "Additional Cooling water temp. in Mode 4", 1340, "TEMP", "status", 0.0, 25.0, None, None, 0.5, "°C"),
+    ("H", "H", 1026, "DIGI1", "system", 0.0, 65535.0, None, None, 10, ""),
+    ("H10", "Unit Address", 1024, "DIGI1", "system", 1.0, 32.0, None, None, 5, ""),
+    ("H29", "Operation Code", 1034, "DIGI1", "system", 0.0, 20.0, None, None, 5, "%"),
+    ("H32", "Force Switch Mode Time", 1045, "DIGI1", "system", 1.0, 300.0, None, None, 10, "min"),
+    ("H34", "ERP Testing Mode", 1020, "DIGI1", "system", 0.0, 3.0, None, None, 1, ""),
+    ("H41", "Password for unmodified parameters", 1346, "DIGI1", "system", 66.0, 999.0, None, None, 10, ""),
+    ("H42", "AT for bottom plate heater turned on", 1356, "TEMP", "system", -20.0, 20.0, None, None, 0.5, ""),
+    ("Test1", "Test1", 1212, "TEMP", "temperatures", -10.0, 10.0, None, None, 0.5, ""),
+    ("Test11", "Test11", 1353, "TEMP", "temperatures", -10.0, 10.0, None, None, 0.5, ""),
+    ("Test12", "Test12", 1354, "TEMP", "temperatures", -10.0, 10.0, None, None, 0.5, ""),
+    ("Test2", "Test2", 1213, "TEMP", "temperatures", -10.0, 10.0, None, None, 0.5, ""),
+    ("Test3", "Test3", 1214, "TEMP", "temperatures", -10.0, 10.0, None, None, 0.5, ""),
+    ("Test9", "Test9", 1355, "TEMP", "temperatures", -10.0, 10.0, None, None, 0.5, ""),
+    ("TimerMuteOffHour", "TimerMuteOffHour", 1248, "DIGI1", "temperatures", 0.0, 23.0, None, None, 5, "min"),
+    ("TimerMuteOffMinute", "TimerMuteOffMinute", 1249, "DIGI1", "temperatures", 0.0, 59.0, None, None, 5, "min"),
+    ("TimerMuteOnHour", "TimerMuteOnHour", 1245, "DIGI1", "temperatures", 0.0, 23.0, None, None, 5, "min"),
+    ("TimerMuteOnMinute", "TimerMuteOnMinute", 1246, "DIGI1", "temperatures", 0.0, 59.0, None, None, 5, "min"),
+    ("Z02", "Zone 1 Target RT", 1070, "TEMP", "zones", 10.0, 35.0, None, None, 0.5, ""),
+    ("Z03", "Zone 1 RT Diff. to Start", 1071, "TEMP", "zones", 0.0, 10.0, None, None, 0.5, ""),
+    ("Z04", "Zone 2 Target RT", 1072, "TEMP", "zones", 10.0, 35.0, None, None, 0.5, ""),
+    ("Z05", "Zone 2 RT Diff. to Start", 1073, "TEMP", "zones", 0.0, 10.0, None, None, 0.5, ""),
+    ("Z06", "Zone 1 Heating Target Outlet WT", 1075, "TEMP", "zones", None, None, "R10", "R11", 0.5, ""),
+    ("Z07", "Zone 2 Mixing Target Outlet WT", 1076, "TEMP", "zones", None, None, "R10", "Z15", 0.5, ""),
+    ("Z08", "Mixing Valve Manual Adjustment Ratio (0% for Auto", 1080, "DIGI1", "zones", 0.0, 100.0, None, None, 5, "%"),
+    ("Z09", "Mixing Valve Opening Time", 1082, "DIGI1", "zones", 0.0, 2000.0, None, None, 10, "min"),
+    ("Z10", "Mixing Valve Closing Time", 1084, "DIGI1", "zones", 0.0, 2000.0, None, None, 10, "min"),
+    ("Z11", "Mixing Valve Adjustment P(PID)", 1085, "DIGI5", "zones", 0.0, 10.0, None, None, 0.1, ""),
+    ("Z12", "Mixing Valve Adjustment I(PID)", 1088, "DIGI5", "zones", 0.0, 10.0, None, None, 0.1, ""),
+    ("Z13", "Mixing Valve PID Period", 1090, "DIGI1", "zones", 1.0, 20.0, None, None, 5, ""),
+    ("Z14", "Steps of Mixing Valve in Cooling", 1134, "DIGI1", "zones", 0.0, 100.0, None, None, 5, "steps"),
+    ("Z15", "Zone 2 Max. Water Target Temp.", 1135, "TEMP", "zones", None, 99.0, "R10", None, 0.5, "°C"),
+    ("Z19", "Diff. of No Pump On at Low Water Temp.", 1357, "TEMP", "zones", 0.0, 25.0, None, None, 0.5, "°C"),
+    ("Zone 2 Cure Slope", "Zone 2 Cure Slope", 1078, "DIGI5", "zones", 0.0, 4.0, None, None, 0.1, ""),
+    ("Zone 2 Curve Offset", "Zone 2 Curve Offset", 1079, "DIGI5", "zones", 0.0, 60.0, None, None, 0.1, ""),
+)
 
 # SENSOR PARAMETERS (Read-only)
-SENSOR_PARAMS = {
-    "COP/EER(Total)": {"name": "COP/EER(ODU+IDU)", "address": 2060, "data_type": "DIGI9", "category": "compressor", "step": 0.1},
-    "Capacity Out(IDU)": {"name": "Capacity Output(IDU)", "address": 2147, "data_type": "DIGI5", "category": "compressor", "step": 0.1},
-    "Capacity Out(ODU)": {"name": "Capacity Output(ODU)", "address": 2138, "data_type": "DIGI5", "category": "compressor", "step": 0.1},
-    "Capacity Out(Total)": {"name": "Capacity Output(ODU+IDU)", "address": 2059, "data_type": "DIGI5", "category": "compressor", "step": 0.1},
-    "Comsuption Power-H": {"name": "Comsuption Power-H", "address": 2078, "data_type": "DIGI1", "category": "compressor", "step": 1},
-    "Comsuption Power-L": {"name": "Comsuption Power-L", "address": 2079, "data_type": "DIGI1", "category": "compressor", "step": 1},
-    "Cooling Con. H(ODU)": {"name": "Cooling Consumption H(ODU)", "address": 2121, "data_type": "DIGI1", "category": "compressor", "step": 1},
-    "Cooling Con. L(ODU)": {"name": "Cooling Consumption L(ODU)", "address": 2122, "data_type": "DIGI1", "category": "compressor", "step": 1},
-    "Cooling Gen.H(ODU)": {"name": "Cooling Generated H(ODU)", "address": 2123, "data_type": "DIGI1", "category": "compressor", "step": 1},
-    "Cooling Gen.L(ODU)": {"name": "Cooling Generated L(ODU)", "address": 2124, "data_type": "DIGI1", "category": "compressor", "step": 1},
-    "code_version": {"name": "Code Version", "address": 2104, "data_type": "DIGI5", "category": "compressor", "step": 0.1},
-    "DHW Con. H(IDU)": {"name": "DHW Consumption/Generated H(IDU)", "address": 2142, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "DHW Con. H(ODU)": {"name": "DHW Consumption H(ODU)", "address": 2125, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "DHW Con. L(IDU)": {"name": "DHW Consumption/Generated L(IDU)", "address": 2143, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "DHW Con. L(ODU)": {"name": "DHW Consumption L(ODU)", "address": 2126, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "DHW Gen.H(ODU)": {"name": "DHW Generated H(ODU)", "address": 2127, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "DHW Gen.L(ODU)": {"name": "DHW Generated L(ODU)", "address": 2128, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "DP4": {"name": "Indoor Temp.", "address": 2178, "data_type": "TEMP", "category": "defrost", "step": 0.5, "unit": "°C"},
-    "DP5": {"name": "Indoor Humidity", "address": 2179, "data_type": "TEMP", "category": "defrost", "step": 0.5},
-    "DP6": {"name": "Dew Point Temp.", "address": 2180, "data_type": "TEMP", "category": "defrost", "step": 0.5, "unit": "°C"},
-    "DSP_version": {"name": "DSP_version", "address": 2026, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "Display Firmware Ver": {"name": "Display Firmware Version", "address": 2113, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "DisplayCommSucess": {"name": "DisplayCommSucess", "address": 2144, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "Display_Program_Code": {"name": "Display_Program_Code", "address": 2111, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "Display_Program_Version": {"name": "Display_Program_Version", "address": 2112, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "Driver Board Status": {"name": "Driver Board Status", "address": 2080, "data_type": "DIGI1", "category": "defrost", "step": 1},
-    "EEPROM": {"name": "EEPROM", "address": 2028, "data_type": "DIGI1", "category": "eev", "step": 1},
-    "EMS Strategy Command": {"name": "EMS Strategy Command", "address": 2151, "data_type": "DIGI1", "category": "eev", "step": 1},
-    "EMS_State": {"name": "EMS_State", "address": 2152, "data_type": "DIGI1", "category": "eev", "step": 1},
-    "Electricity_Price": {"name": "Electricity_Price", "address": 2153, "data_type": "TEMP", "category": "eev", "step": 0.5},
-    "Fault1": {"name": "Fault1", "address": 2085, "data_type": "BINARY", "category": "fan", "step": 1},
-    "Fault10": {"name": "Fault10", "address": 2084, "data_type": "BINARY", "category": "fan", "step": 1},
-    "Fault2": {"name": "Fault2", "address": 2086, "data_type": "BINARY", "category": "fan", "step": 1},
-    "Fault3": {"name": "Fault3", "address": 2087, "data_type": "BINARY", "category": "fan", "step": 1},
-    "Fault4": {"name": "Fault4", "address": 2088, "data_type": "BINARY", "category": "fan", "step": 1},
-    "Fault5": {"name": "Fault5", "address": 2089, "data_type": "BINARY", "category": "fan", "step": 1},
-    "Fault6": {"name": "Fault6", "address": 2090, "data_type": "BINARY", "category": "fan", "step": 1},
-    "Fault7": {"name": "Fault7", "address": 2081, "data_type": "BINARY", "category": "fan", "step": 1},
-    "Fault8": {"name": "Fault8", "address": 2082, "data_type": "BINARY", "category": "fan", "step": 1},
-    "Fault9": {"name": "Fault9", "address": 2083, "data_type": "BINARY", "category": "fan", "step": 1},
-    "BatteryPower": {"name": "BatteryPower", "address": 2156, "data_type": "DIGI6", "category": "other", "step": 1},
-    "BatterySoC": {"name": "BatterySoC", "address": 2155, "data_type": "DIGI5", "category": "other", "step": 0.1},
-    "IDU.WaterPressure": {"name": "IDU.WaterPressure", "address": 2041, "data_type": "DIGI5", "category": "other", "step": 0.1, "unit": "bar"},
-    "InputCurrent1": {"name": "InputCurrent1", "address": 2029, "data_type": "DIGI5", "category": "other", "step": 0.1, "unit": "A"},
-    "InputCurrent2": {"name": "InputCurrent2", "address": 2030, "data_type": "DIGI5", "category": "other", "step": 0.1, "unit": "A"},
-    "InputCurrent3": {"name": "InputCurrent3", "address": 2031, "data_type": "DIGI5", "category": "other", "step": 0.1, "unit": "A"},
-    "InverterCommSucess": {"name": "InverterCommSucess", "address": 2145, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L40": {"name": "Centralized Control Software Code", "address": 5136, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L41": {"name": "Centralized Control Version", "address": 5137, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L42": {"name": "Operating Units", "address": 5138, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L43": {"name": "Average Frequency of Running", "address": 5139, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "Hz"},
-    "L44": {"name": "Average Load Ratio", "address": 5140, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "%"},
-    "L45": {"name": "Average Inlet Water Temp. of Running", "address": 5141, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "L46": {"name": "Average Outlet Water Temp. of Running", "address": 5142, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "L47": {"name": "DHW Tank Temp.", "address": 5143, "data_type": "TEMP", "category": "other", "step": 0.5, "unit": "°C"},
-    "L48": {"name": "Quantity of Units to Defrosting", "address": 5144, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L49": {"name": "Quantity of Units in Defrosting", "address": 5145, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L50": {"name": "PID Out Value", "address": 5146, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L52": {"name": "If change the unit mode", "address": 5148, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L53": {"name": "JK Power", "address": 5150, "data_type": "ENUM", "category": "other", "step": 1},
-    "L54": {"name": "JK Run Mode", "address": 5151, "data_type": "ENUM", "category": "other", "step": 1},
-    "L56": {"name": "OneKeyFlag", "address": 5152, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L57": {"name": "UnitCommFalutFlag", "address": 5153, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L58": {"name": "Communication Fault Rate", "address": 5154, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L65": {"name": "SG Run Mode", "address": 5155, "data_type": "DIGI1", "category": "other", "step": 1},
-    "L66": {"name": "BMS Communication Enabled", "address": 5156, "data_type": "DIGI1", "category": "other", "step": 1},
-    "Main Freq. status": {"name": "Mainboard Freq. status", "address": 2139, "data_type": "DIGI1", "category": "other", "step": 1, "unit": "Hz"},
-    "MainBoard Version": {"name": "MainBoard Version", "address": 2105, "data_type": "DIGI1", "category": "other", "step": 1},
-    "Mode&Temp. Status": {"name": "Mode&Temp.&Power Timer Status", "address": 2134, "data_type": "ENUM", "category": "other", "step": 1, "unit": "°C"},
-    "ModeState": {"name": "Mode State", "address": 2012, "data_type": "ENUM", "category": "other", "step": 1},
-    "Natural Gas Price": {"name": "Natural Gas Price", "address": 8008, "data_type": "DIGI9", "category": "other", "step": 0.1},
-    "NaturalGasPrice": {"name": "NaturalGasPrice", "address": 2158, "data_type": "DIGI9", "category": "other", "step": 0.1},
-    "unsupported_mode": {"name": "unsupported_mode", "address": 2110, "data_type": "DIGI1", "category": "other", "step": 1},
-    "O01~023": {"name": "Load Output", "address": 2019, "data_type": "BINARY", "category": "outputs", "step": 1},
-    "O15": {"name": "EEV Steps", "address": 2020, "data_type": "DIGI1", "category": "outputs", "step": 1, "unit": "steps"},
-    "O17": {"name": "EVI EEV Steps", "address": 2022, "data_type": "DIGI1", "category": "outputs", "step": 1, "unit": "steps"},
-    "O25": {"name": "Load Output", "address": 2018, "data_type": "BINARY", "category": "outputs", "step": 1},
-    "OnGrid Power": {"name": "OnGrid Power", "address": 2154, "data_type": "DIGI6", "category": "outputs", "step": 1},
-    "AT_Temp": {"name": "AT_Temp", "address": 2136, "data_type": "TEMP", "category": "protection", "step": 0.5, "unit": "°C"},
-    "PFC_version": {"name": "PFC_version", "address": 2027, "data_type": "DIGI1", "category": "pump", "step": 1},
-    "PV Power": {"name": "PV Power", "address": 8007, "data_type": "Float", "category": "pump", "step": 1},
-    "PV_Power": {"name": "PV_Power", "address": 2157, "data_type": "DIGI6", "category": "pump", "step": 1},
-    "Power In(ODU)": {"name": "Power Input(ODU)", "address": 2137, "data_type": "DIGI5", "category": "pump", "step": 0.1},
-    "Power In(Total)": {"name": "Power Input(ODU+IDU)", "address": 2054, "data_type": "DIGI5", "category": "pump", "step": 0.1},
-    "Power State": {"name": "Power State", "address": 2011, "data_type": "ENUM", "category": "pump", "step": 1},
-    "RT1-11": {"name": "Thermostat1_StateTarget", "address": 7065, "data_type": "TEMP", "category": "setpoints", "step": 0.5},
-    "RT1-4": {"name": "Thermostat1_Code", "address": 7060, "data_type": "DIGI1", "category": "setpoints", "step": 1},
-    "RT1-5": {"name": "Thermostat1_Version", "address": 7061, "data_type": "DIGI1", "category": "setpoints", "step": 1},
-    "RT1-6": {"name": "Thermostat1_Selection", "address": 7062, "data_type": "BINARY", "category": "setpoints", "step": 1},
-    "RT1-7": {"name": "Thermostat1_RoomTemp", "address": 7063, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "RT1-8": {"name": "Thermostat1_NeedOn", "address": 7064, "data_type": "ENUM", "category": "setpoints", "step": 1},
-    "RT1-Fault": {"name": "RT1-Fault", "address": 7080, "data_type": "DIGI1", "category": "setpoints", "step": 1},
-    "RT2-11": {"name": "Thermostat2_StateTarget", "address": 7155, "data_type": "ENUM", "category": "setpoints", "step": 1},
-    "RT2-4": {"name": "Thermostat2_Code", "address": 7150, "data_type": "DIGI1", "category": "setpoints", "step": 1},
-    "RT2-5": {"name": "Thermostat2_Version", "address": 7151, "data_type": "DIGI1", "category": "setpoints", "step": 1},
-    "RT2-6": {"name": "Thermostat2_Selection", "address": 7152, "data_type": "ENUM", "category": "setpoints", "step": 1},
-    "RT2-7": {"name": "Thermostat2_RoomTemp", "address": 7153, "data_type": "TEMP", "category": "setpoints", "step": 0.5, "unit": "°C"},
-    "RT2-8": {"name": "Thermostat2_NeedOn", "address": 7154, "data_type": "ENUM", "category": "setpoints", "step": 1},
-    "RT2-Fault": {"name": "RT2-Fault", "address": 7170, "data_type": "DIGI1", "category": "setpoints", "step": 1},
-    "S01~S10": {"name": "Switch State", "address": 2034, "data_type": "BINARY", "category": "status", "step": 1},
-    "SG_Ready Status": {"name": "SG_Ready Status", "address": 2133, "data_type": "ENUM", "category": "status", "step": 1},
-    "S_IDU": {"name": "3rd IDU Dialing Status", "address": 2040, "data_type": "DIGI1", "category": "status", "step": 1},
-    "Silent_Mode": {"name": "Silent_Mode", "address": 2108, "data_type": "DIGI1", "category": "status", "step": 1},
-    "H99": {"name": "DHW Temp. Sourcing", "address": 1046, "data_type": "DIGI1", "category": "system", "min": 0.0, "max": 1.0, "step": 1, "unit": "°C"},
-    "Heating Con.H(IDU)": {"name": "Heating Consumption/Generated H(IDU)", "address": 2140, "data_type": "DIGI1", "category": "system", "step": 1},
-    "Heating Con.H(ODU)": {"name": "Heating Consumption H(ODU)", "address": 2117, "data_type": "DIGI1", "category": "system", "step": 1},
-    "Heating Con.L(IDU)": {"name": "Heating Consumption/Generated L(IDU)", "address": 2141, "data_type": "DIGI1", "category": "system", "step": 1},
-    "Heating Con.L(ODU)": {"name": "Heating Consumption L(ODU)", "address": 2118, "data_type": "DIGI1", "category": "system", "step": 1},
-    "Heating Gen.H(ODU)": {"name": "Heating Generated H(ODU)", "address": 2119, "data_type": "DIGI1", "category": "system", "step": 1},
-    "Heating Gen.L(ODU)": {"name": "Heating Generated L(ODU)", "address": 2120, "data_type": "DIGI1", "category": "system", "step": 1},
-    "T01": {"name": "Inlet Water Temp.", "address": 2045, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T02": {"name": "Outlet Water Temp.", "address": 2046, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T03": {"name": "Coil Temp.", "address": 2049, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T04": {"name": "Ambient Temp. (AT)", "address": 2048, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T05": {"name": "Suction Temp.", "address": 2051, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T06": {"name": "Antifreeze Temp.", "address": 2055, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T07": {"name": "Buffer Tank Temp.", "address": 2052, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T08": {"name": "DHW Tank Temp.", "address": 2047, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T09": {"name": "Room Temp.", "address": 2058, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T10": {"name": "EVI Inlet Temp.", "address": 2063, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T11": {"name": "EVI Outlet Temp.", "address": 2064, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T12": {"name": "Exhaust Temp.", "address": 2053, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T14": {"name": "Distributor Tube Temp.", "address": 2050, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T15": {"name": "Low Pressure", "address": 2069, "data_type": "DIGI5", "category": "temperatures", "step": 0.1, "unit": "bar"},
-    "T27": {"name": "Speed of Fan Motor 1", "address": 2074, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "rpm"},
-    "T28": {"name": "Speed of Fan Motor 2", "address": 2075, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "rpm"},
-    "T29": {"name": "Target Speed of Fan Motor", "address": 2076, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "rpm"},
-    "T30": {"name": "Compressor Frequency", "address": 2071, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "Hz"},
-    "T31": {"name": "Operation Frequency of Compressor", "address": 2072, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "Hz"},
-    "T32": {"name": "Max. Frequency from Comp. Driver", "address": 2073, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "Hz"},
-    "T33": {"name": "IPM High Fault Temp.", "address": 2061, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T34": {"name": "AC Input Voltage", "address": 2062, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "V"},
-    "T35": {"name": "AC Input Current", "address": 2057, "data_type": "DIGI5", "category": "temperatures", "step": 0.1, "unit": "A"},
-    "T36": {"name": "Phase Current of Compressor", "address": 2042, "data_type": "DIGI5", "category": "temperatures", "step": 0.1, "unit": "A"},
-    "T37": {"name": "DC Power Bus Voltage", "address": 2043, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "V"},
-    "T38": {"name": "IPM Temp.", "address": 2044, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T39": {"name": "Water Flow Rate", "address": 2077, "data_type": "DIGI9", "category": "temperatures", "step": 0.1, "unit": "L/min"},
-    "T40": {"name": "Heating Returning Water Temp.", "address": 2035, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T41": {"name": "Heating Leaving Water Temp.", "address": 2036, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T42": {"name": "Mix Tube Outlet Water Temp.", "address": 2037, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T43": {"name": "DHW Returning Water Temp.", "address": 2038, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T44": {"name": "DHW Leaving Water Temp.", "address": 2039, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T46": {"name": "Exernal Fan Motor Driver IPM Temp.", "address": 2130, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T47": {"name": "Exernal Fan Motor Driver Power", "address": 2131, "data_type": "DIGI1", "category": "temperatures", "step": 1},
-    "T48": {"name": "Exernal Fan Motor Driver Current", "address": 2132, "data_type": "DIGI6", "category": "temperatures", "step": 1, "unit": "A"},
-    "T49": {"name": "Evaporation Temperature", "address": 2065, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T50": {"name": "Exhaust Superheat", "address": 2066, "data_type": "TEMP", "category": "temperatures", "step": 0.5},
-    "T51": {"name": "Superheat", "address": 2067, "data_type": "TEMP", "category": "temperatures", "step": 0.5},
-    "T55": {"name": "Outlet Temp. after Electric Heater", "address": 2068, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "T57": {"name": "Number of startup times of the compressor", "address": 2023, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "min"},
-    "T58": {"name": "Backup Heater Running Time in DHW Mode", "address": 2024, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "min"},
-    "T59": {"name": "Backup Heater Running Time in Heating mode", "address": 2025, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "min"},
-    "T60": {"name": "Compressor running time", "address": 2032, "data_type": "DIGI1", "category": "temperatures", "step": 1, "unit": "min"},
-    "T_PWM_IN": {"name": "Main Pump Feedback PWM Duty", "address": 2116, "data_type": "DIGI1", "category": "temperatures", "step": 1},
-    "T_PWM_Out": {"name": "Main Pump Speed Output PWM Duty", "address": 2115, "data_type": "DIGI1", "category": "temperatures", "step": 1},
-    "T_Test01": {"name": "BufferTank Outlet(Test)", "address": 2148, "data_type": "TEMP", "category": "temperatures", "step": 0.5},
-    "T_Test02": {"name": "BufferTank Inlet(Test)", "address": 2149, "data_type": "TEMP", "category": "temperatures", "step": 0.5},
-    "Thermostat1_EnvTemp": {"name": "Thermostat1_EnvTemp", "address": 7006, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "Thermostat1_MuteStatus": {"name": "Thermostat1_MuteStatus", "address": 7066, "data_type": "ENUM", "category": "temperatures", "step": 1},
-    "Thermostat2_EnvTemp": {"name": "Thermostat2_EnvTemp", "address": 7096, "data_type": "TEMP", "category": "temperatures", "step": 0.5, "unit": "°C"},
-    "Zone 1 Room Temp": {"name": "Zone 1 Room Temp", "address": 2160, "data_type": "TEMP", "category": "zones", "step": 0.5, "unit": "°C"},
-    "Zone 1 Water Target": {"name": "Zone 1 Water Target", "address": 2164, "data_type": "TEMP", "category": "zones", "step": 0.5},
-    "Zone 2 Mixing Temp": {"name": "Zone 2 Mixing Temp", "address": 2161, "data_type": "TEMP", "category": "zones", "step": 0.5, "unit": "°C"},
-    "Zone 2 Mixing Valve": {"name": "Zone 2 Mixing Valve Percentage", "address": 2163, "data_type": "DIGI1", "category": "zones", "step": 1},
-    "Zone 2 Room Temp": {"name": "Zone 2 Room Temp", "address": 2162, "data_type": "TEMP", "category": "zones", "step": 0.5, "unit": "°C"},
-    "Zone 2 Water Target": {"name": "Zone 2 Water Target", "address": 2165, "data_type": "TEMP", "category": "zones", "step": 0.5},
-    "zone_mixingvalve_operation_cnt": {"name": "zone_mixingvalve_operation_cnt", "address": 2166, "data_type": "DIGI1", "category": "zones", "step": 1, "unit": "%"},
-}
+SENSOR_RECORDS = (
+    ("COP/EER(Total)", "COP/EER(ODU+IDU)", 2060, "DIGI9", "compressor", None, None, None, None, 0.1, ""),
+    ("Capacity Out(IDU)", "Capacity Output(IDU)", 2147, "DIGI5", "compressor", None, None, None, None, 0.1, ""),
+    ("Capacity Out(ODU)", "Capacity Output(ODU)", 2138, "DIGI5", "compressor", None, None, None, None, 0.1, ""),
+    ("Capacity Out(Total)", "Capacity Output(ODU+IDU)", 2059, "DIGI5", "compressor", None, None, None, None, 0.1, ""),
+    ("Comsuption Power-H", "Comsuption Power-H", 2078, "DIGI1", "compressor", None, None, None, None, 1, ""),
+    ("Comsuption Power-L", "Comsuption Power-L", 2079, "DIGI1", "compressor", None, None, None, None, 1, ""),
+    ("Cooling Con. H(ODU)", "Cooling Consumption H(ODU)", 2121, "DIGI1", "compressor", None, None, None, None, 1, ""),
+    ("Cooling Con. L(ODU)", "Cooling Consumption L(ODU)", 2122, "DIGI1", "compressor", None, None, None, None, 1, ""),
+    ("Cooling Gen.H(ODU)", "Cooling Generated H(ODU)", 2123, "DIGI1", "compressor", None, None, None, None, 1, ""),
+    ("Cooling Gen.L(ODU)", "Cooling Generated L(ODU)", 2124, "DIGI1", "compressor", None, None, None, None, 1, ""),
+    ("code_version", "Code Version", 2104, "DIGI5", "compressor", None, None, None, None, 0.1, ""),
+    ("DHW Con. H(IDU)", "DHW Consumption/Generated H(IDU)", 2142, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("DHW Con. H(ODU)", "DHW Consumption H(ODU)", 2125, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("DHW Con. L(IDU)", "DHW Consumption/Generated L(IDU)", 2143, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("DHW Con. L(ODU)", "DHW Consumption L(ODU)", 2126, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("DHW Gen.H(ODU)", "DHW Generated H(ODU)", 2127, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("DHW Gen.L(ODU)", "DHW Generated L(ODU)", 2128, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("DP4", "Indoor Temp.", 2178, "TEMP", "defrost", None, None, None, None, 0.5, "°C"),
+    ("DP5", "Indoor Humidity", 2179, "TEMP", "defrost", None, None, None, None, 0.5, ""),
+    ("DP6", "Dew Point Temp.", 2180, "TEMP", "defrost", None, None, None, None, 0.5, "°C"),
+    ("DSP_version", "DSP_version", 2026, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("Display Firmware Ver", "Display Firmware Version", 2113, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("DisplayCommSucess", "DisplayCommSucess", 2144, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("Display_Program_Code", "Display_Program_Code", 2111, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("Display_Program_Version", "Display_Program_Version", 2112, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("Driver Board Status", "Driver Board Status", 2080, "DIGI1", "defrost", None, None, None, None, 1, ""),
+    ("EEPROM", "EEPROM", 2028, "DIGI1", "eev", None, None, None, None, 1, ""),
+    ("EMS Strategy Command", "EMS Strategy Command", 2151, "DIGI1", "eev", None, None, None, None, 1, ""),
+    ("EMS_State", "EMS_State", 2152, "DIGI1", "eev", None, None, None, None, 1, ""),
+    ("Electricity_Price", "Electricity_Price", 2153, "TEMP", "eev", None, None, None, None, 0.5, ""),
+    ("Fault1", "Fault1", 2085, "BINARY", "fan", None, None, None, None, 1, ""),
+    ("Fault10", "Fault10", 2084, "BINARY", "fan", None, None, None, None, 1, ""),
+    ("Fault2", "Fault2", 2086, "BINARY", "fan", None, None, None, None, 1, ""),
+    ("Fault3", "Fault3", 2087, "BINARY", "fan", None, None, None, None, 1, ""),
+    ("Fault4", "Fault4", 2088, "BINARY", "fan", None, None, None, None, 1, ""),
+    ("Fault5", "Fault5", 2089, "BINARY", "fan", None, None, None, None, 1, ""),
+    ("Fault6", "Fault6", 2090, "BINARY", "fan", None, None, None, None, 1, ""),
+    ("Fault7", "Fault7", 2081, "BINARY", "fan", None, None, None, None, 1, ""),
+    ("Fault8", "Fault8", 2082, "BINARY", "fan", None, None, None, None, 1, ""),
+    ("Fault9", "Fault9", 2083, "BINARY", "fan", None, None, None, None, 1, ""),
+    ("BatteryPower", "BatteryPower", 2156, "DIGI6", "other", None, None, None, None, 1, ""),
+    ("BatterySoC", "BatterySoC", 2155, "DIGI5", "other", None, None, None, None, 0.1, ""),
+    ("IDU.WaterPressure", "IDU.WaterPressure", 2041, "DIGI5", "other", None, None, None, None, 0.1, "bar"),
+    ("InputCurrent1", "InputCurrent1", 2029, "DIGI5", "other", None, None, None, None, 0.1, "A"),
+    ("InputCurrent2", "InputCurrent2", 2030, "DIGI5", "other", None, None, None, None, 0.1, "A"),
+    ("InputCurrent3", "InputCurrent3", 2031, "DIGI5", "other", None, None, None, None, 0.1, "A"),
+    ("InverterCommSucess", "InverterCommSucess", 2145, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L40", "Centralized Control Software Code", 5136, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L41", "Centralized Control Version", 5137, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L42", "Operating Units", 5138, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L43", "Average Frequency of Running", 5139, "DIGI1", "other", None, None, None, None, 1, "Hz"),
+    ("L44", "Average Load Ratio", 5140, "DIGI1", "other", None, None, None, None, 1, "%"),
+    ("L45", "Average Inlet Water Temp. of Running", 5141, "TEMP", "other", None, None, None, None, 0.5, "°C"),
+    ("L46", "Average Outlet Water Temp. of Running", 5142, "TEMP", "other", None, None, None, None, 0.5, "°C"),
+    ("L47", "DHW Tank Temp.", 5143, "TEMP", "other", None, None, None, None, 0.5, "°C"),
+    ("L48", "Quantity of Units to Defrosting", 5144, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L49", "Quantity of Units in Defrosting", 5145, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L50", "PID Out Value", 5146, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L52", "If change the unit mode", 5148, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L53", "JK Power", 5150, "ENUM", "other", None, None, None, None, 1, ""),
+    ("L54", "JK Run Mode", 5151, "ENUM", "other", None, None, None, None, 1, ""),
+    ("L56", "OneKeyFlag", 5152, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L57", "UnitCommFalutFlag", 5153, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L58", "Communication Fault Rate", 5154, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L65", "SG Run Mode", 5155, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("L66", "BMS Communication Enabled", 5156, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("Main Freq. status", "Mainboard Freq. status", 2139, "DIGI1", "other", None, None, None, None, 1, "Hz"),
+    ("MainBoard Version", "MainBoard Version", 2105, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("Mode&Temp. Status", "Mode&Temp.&Power Timer Status", 2134, "ENUM", "other", None, None, None, None, 1, "°C"),
+    ("ModeState", "Mode State", 2012, "ENUM", "other", None, None, None, None, 1, ""),
+    ("Natural Gas Price", "Natural Gas Price", 8008, "DIGI9", "other", None, None, None, None, 0.1, ""),
+    ("NaturalGasPrice", "NaturalGasPrice", 2158, "DIGI9", "other", None, None, None, None, 0.1, ""),
+    ("unsupported_mode", "unsupported_mode", 2110, "DIGI1", "other", None, None, None, None, 1, ""),
+    ("O01~023", "Load Output", 2019, "BINARY", "outputs", None, None, None, None, 1, ""),
+    ("O15", "EEV Steps", 2020, "DIGI1", "outputs", None, None, None, None, 1, "steps"),
+    ("O17", "EVI EEV Steps", 2022, "DIGI1", "outputs", None, None, None, None, 1, "steps"),
+    ("O25", "Load Output", 2018, "BINARY", "outputs", None, None, None, None, 1, ""),
+    ("OnGrid Power", "OnGrid Power", 2154, "DIGI6", "outputs", None, None, None, None, 1, ""),
+    ("AT_Temp", "AT_Temp", 2136, "TEMP", "protection", None, None, None, None, 0.5, "°C"),
+    ("PFC_version", "PFC_version", 2027, "DIGI1", "pump", None, None, None, None, 1, ""),
+    ("PV Power", "PV Power", 8007, "Float", "pump", None, None, None, None, 1, ""),
+    ("PV_Power", "PV_Power", 2157, "DIGI6", "pump", None, None, None, None, 1, ""),
+    ("Power In(ODU)", "Power Input(ODU)", 2137, "DIGI5", "pump", None, None, None, None, 0.1, ""),
+    ("Power In(Total)", "Power Input(ODU+IDU)", 2054, "DIGI5", "pump", None, None, None, None, 0.1, ""),
+    ("Power State", "Power State", 2011, "ENUM", "pump", None, None, None, None, 1, ""),
+    ("RT1-11", "Thermostat1_StateTarget", 7065, "TEMP", "setpoints", None, None, None, None, 0.5, ""),
+    ("RT1-4", "Thermostat1_Code", 7060, "DIGI1", "setpoints", None, None, None, None, 1, ""),
+    ("RT1-5", "Thermostat1_Version", 7061, "DIGI1", "setpoints", None, None, None, None, 1, ""),
+    ("RT1-6", "Thermostat1_Selection", 7062, "BINARY", "setpoints", None, None, None, None, 1, ""),
+    ("RT1-7", "Thermostat1_RoomTemp", 7063, "TEMP", "setpoints", None, None, None, None, 0.5, "°C"),
+    ("RT1-8", "Thermostat1_NeedOn", 7064, "ENUM", "setpoints", None, None, None, None, 1, ""),
+    ("RT1-Fault", "RT1-Fault", 7080, "DIGI1", "setpoints", None, None, None, None, 1, ""),
+    ("RT2-11", "Thermostat2_StateTarget", 7155, "ENUM", "setpoints", None, None, None, None, 1, ""),
+    ("RT2-4", "Thermostat2_Code", 7150, "DIGI1", "setpoints", None, None, None, None, 1, ""),
+    ("RT2-5", "Thermostat2_Version", 7151, "DIGI1", "setpoints", None, None, None, None, 1, ""),
+    ("RT2-6", "Thermostat2_Selection", 7152, "ENUM", "setpoints", None, None, None, None, 1, ""),
+    ("RT2-7", "Thermostat2_RoomTemp", 7153, "TEMP", "setpoints", None, None, None, None, 0.5, "°C"),
+    ("RT2-8", "Thermostat2_NeedOn", 7154, "ENUM", "setpoints", None, None, None, None, 1, ""),
+    ("RT2-Fault", "RT2-Fault", 7170, "DIGI1", "setpoints", None, None, None, None, 1, ""),
+    ("S01~S10", "Switch State", 2034, "BINARY", "status", None, None, None, None, 1, ""),
+    ("SG_Ready Status", "SG_Ready Status", 2133, "ENUM", "status", None, None, None, None, 1, ""),
+    ("S_IDU", "3rd IDU Dialing Status", 2040, "DIGI1", "status", None, None, None, None, 1, ""),
+    ("Silent_Mode", "Silent_Mode", 2108, "DIGI1", "status", None, None, None, None, 1, ""),
+    ("H99", "DHW Temp. Sourcing", 1046, "DIGI1", "system", 0.0, 1.0, None, None, 1, "°C"),
+    ("Heating Con.H(IDU)", "Heating Consumption/Generated H(IDU)", 2140, "DIGI1", "system", None, None, None, None, 1, ""),
+    ("Heating Con.H(ODU)", "Heating Consumption H(ODU)", 2117, "DIGI1", "system", None, None, None, None, 1, ""),
+    ("Heating Con.L(IDU)", "Heating Consumption/Generated L(IDU)", 2141, "DIGI1", "system", None, None, None, None, 1, ""),
+    ("Heating Con.L(ODU)", "Heating Consumption L(ODU)", 2118, "DIGI1", "system", None, None, None, None, 1, ""),
+    ("Heating Gen.H(ODU)", "Heating Generated H(ODU)", 2119, "DIGI1", "system", None, None, None, None, 1, ""),
+    ("Heating Gen.L(ODU)", "Heating Generated L(ODU)", 2120, "DIGI1", "system", None, None, None, None, 1, ""),
+    ("T01", "Inlet Water Temp.", 2045, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T02", "Outlet Water Temp.", 2046, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T03", "Coil Temp.", 2049, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T04", "Ambient Temp. (AT)", 2048, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T05", "Suction Temp.", 2051, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T06", "Antifreeze Temp.", 2055, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T07", "Buffer Tank Temp.", 2052, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T08", "DHW Tank Temp.", 2047, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T09", "Room Temp.", 2058, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T10", "EVI Inlet Temp.", 2063, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T11", "EVI Outlet Temp.", 2064, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T12", "Exhaust Temp.", 2053, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T14", "Distributor Tube Temp.", 2050, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T15", "Low Pressure", 2069, "DIGI5", "temperatures", None, None, None, None, 0.1, "bar"),
+    ("T27", "Speed of Fan Motor 1", 2074, "DIGI1", "temperatures", None, None, None, None, 1, "rpm"),
+    ("T28", "Speed of Fan Motor 2", 2075, "DIGI1", "temperatures", None, None, None, None, 1, "rpm"),
+    ("T29", "Target Speed of Fan Motor", 2076, "DIGI1", "temperatures", None, None, None, None, 1, "rpm"),
+    ("T30", "Compressor Frequency", 2071, "DIGI1", "temperatures", None, None, None, None, 1, "Hz"),
+    ("T31", "Operation Frequency of Compressor", 2072, "DIGI1", "temperatures", None, None, None, None, 1, "Hz"),
+    ("T32", "Max. Frequency from Comp. Driver", 2073, "DIGI1", "temperatures", None, None, None, None, 1, "Hz"),
+    ("T33", "IPM High Fault Temp.", 2061, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T34", "AC Input Voltage", 2062, "DIGI1", "temperatures", None, None, None, None, 1, "V"),
+    ("T35", "AC Input Current", 2057, "DIGI5", "temperatures", None, None, None, None, 0.1, "A"),
+    ("T36", "Phase Current of Compressor", 2042, "DIGI5", "temperatures", None, None, None, None, 0.1, "A"),
+    ("T37", "DC Power Bus Voltage", 2043, "DIGI1", "temperatures", None, None, None, None, 1, "V"),
+    ("T38", "IPM Temp.", 2044, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T39", "Water Flow Rate", 2077, "DIGI9", "temperatures", None, None, None, None, 0.1, "L/min"),
+    ("T40", "Heating Returning Water Temp.", 2035, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T41", "Heating Leaving Water Temp.", 2036, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T42", "Mix Tube Outlet Water Temp.", 2037, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T43", "DHW Returning Water Temp.", 2038, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T44", "DHW Leaving Water Temp.", 2039, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T46", "Exernal Fan Motor Driver IPM Temp.", 2130, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T47", "Exernal Fan Motor Driver Power", 2131, "DIGI1", "temperatures", None, None, None, None, 1, ""),
+    ("T48", "Exernal Fan Motor Driver Current", 2132, "DIGI6", "temperatures", None, None, None, None, 1, "A"),
+    ("T49", "Evaporation Temperature", 2065, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T50", "Exhaust Superheat", 2066, "TEMP", "temperatures", None, None, None, None, 0.5, ""),
+    ("T51", "Superheat", 2067, "TEMP", "temperatures", None, None, None, None, 0.5, ""),
+    ("T55", "Outlet Temp. after Electric Heater", 2068, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("T57", "Number of startup times of the compressor", 2023, "DIGI1", "temperatures", None, None, None, None, 1, "min"),
+    ("T58", "Backup Heater Running Time in DHW Mode", 2024, "DIGI1", "temperatures", None, None, None, None, 1, "min"),
+    ("T59", "Backup Heater Running Time in Heating mode", 2025, "DIGI1", "temperatures", None, None, None, None, 1, "min"),
+    ("T60", "Compressor running time", 2032, "DIGI1", "temperatures", None, None, None, None, 1, "min"),
+    ("T_PWM_IN", "Main Pump Feedback PWM Duty", 2116, "DIGI1", "temperatures", None, None, None, None, 1, ""),
+    ("T_PWM_Out", "Main Pump Speed Output PWM Duty", 2115, "DIGI1", "temperatures", None, None, None, None, 1, ""),
+    ("T_Test01", "BufferTank Outlet(Test)", 2148, "TEMP", "temperatures", None, None, None, None, 0.5, ""),
+    ("T_Test02", "BufferTank Inlet(Test)", 2149, "TEMP", "temperatures", None, None, None, None, 0.5, ""),
+    ("Thermostat1_EnvTemp", "Thermostat1_EnvTemp", 7006, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("Thermostat1_MuteStatus", "Thermostat1_MuteStatus", 7066, "ENUM", "temperatures", None, None, None, None, 1, ""),
+    ("Thermostat2_EnvTemp", "Thermostat2_EnvTemp", 7096, "TEMP", "temperatures", None, None, None, None, 0.5, "°C"),
+    ("Zone 1 Room Temp", "Zone 1 Room Temp", 2160, "TEMP", "zones", None, None, None, None, 0.5, "°C"),
+    ("Zone 1 Water Target", "Zone 1 Water Target", 2164, "TEMP", "zones", None, None, None, None, 0.5, ""),
+    ("Zone 2 Mixing Temp", "Zone 2 Mixing Temp", 2161, "TEMP", "zones", None, None, None, None, 0.5, "°C"),
+    ("Zone 2 Mixing Valve", "Zone 2 Mixing Valve Percentage", 2163, "DIGI1", "zones", None, None, None, None, 1, ""),
+    ("Zone 2 Room Temp", "Zone 2 Room Temp", 2162, "TEMP", "zones", None, None, None, None, 0.5, "°C"),
+    ("Zone 2 Water Target", "Zone 2 Water Target", 2165, "TEMP", "zones", None, None, None, None, 0.5, ""),
+    ("zone_mixingvalve_operation_cnt", "zone_mixingvalve_operation_cnt", 2166, "DIGI1", "zones", None, None, None, None, 1, "%"),
+)
 
 # SWITCH PARAMETERS (Binary on/off)
-SWITCH_PARAMS = {
-    "D21": {"name": "Enable Electric Heater During Defrosting", "address": 1126, "data_type": "ENUM", "category": "defrost", "min": 0.0, "max": 1.0, "step": 1},
-    "D26": {"name": "Enable Defrosting Communication in Cascade", "address": 1047, "data_type": "ENUM", "category": "defrost", "min": 0.0, "max": 1.0, "step": 1},
-    "DP1-temp": {"name": "Dew point monitoring", "address": 1385, "data_type": "ENUM", "category": "defrost", "min": 0.0, "max": 1.0, "step": 1},
-    "G05": {"name": "Enable Disinfection", "address": 1156, "data_type": "ENUM", "category": "disinfection", "min": 0.0, "max": 1.0, "step": 1},
-    "G06": {"name": "Allow Disinfection in Standby & Off Mode", "address": 1429, "data_type": "ENUM", "category": "disinfection", "min": 0.0, "max": 1.0, "step": 1},
-    "E09": {"name": "EVI EEV: Adjustment Mode", "address": 1139, "data_type": "ENUM", "category": "eev", "min": 0.0, "max": 1.0, "step": 1},
-    "F10": {"name": "Fan Quantity", "address": 1074, "data_type": "ENUM", "category": "fan", "min": 0.0, "max": 1.0, "step": 1},
-    "F22": {"name": "Enable Manual-control Fan Speed", "address": 1087, "data_type": "ENUM", "category": "fan", "min": 0.0, "max": 1.0, "step": 1, "unit": "rpm"},
-    "FT1": {"name": "Power", "address": 1372, "data_type": "ENUM", "category": "fan", "min": 0.0, "max": 1.0, "step": 1},
-    "KG13~KG28": {"name": "First_Second_Period(Enable/Disable)", "address": 1268, "data_type": "BINARY", "category": "other", "step": 1},
-    "KG29~KG44": {"name": "Third_Fourth_Period(Enable/Disable)", "address": 1269, "data_type": "BINARY", "category": "other", "step": 1},
-    "KG45~KG60": {"name": "Fifth_Sixth_Period(Enable/Disable)", "address": 1270, "data_type": "BINARY", "category": "other", "step": 1},
-    "L10": {"name": "Power", "address": 5100, "data_type": "ENUM", "category": "other", "min": 0.0, "max": 1.0, "step": 1},
-    "L22": {"name": "Enable weather compensation", "address": 5112, "data_type": "ENUM", "category": "other", "min": 0.0, "max": 1.0, "step": 1},
-    "L25": {"name": "Enable Energy level coordination", "address": 5115, "data_type": "ENUM", "category": "other", "min": 0.0, "max": 1.0, "step": 1},
-    "M1_2 Enalbe": {"name": "Mode&Temp.&Power Timer1_2 Enalbe", "address": 1323, "data_type": "BINARY", "category": "other", "step": 1, "unit": "°C"},
-    "M3_4 Enalbe": {"name": "Mode&Temp.&Power Timer3_4 Enalbe", "address": 1324, "data_type": "BINARY", "category": "other", "step": 1, "unit": "°C"},
-    "M5_6 Enalbe": {"name": "Mode&Temp.&Power Timer5_6 Enalbe", "address": 1325, "data_type": "BINARY", "category": "other", "step": 1, "unit": "°C"},
-    "W1_2 Enalbe": {"name": "Warm Water Cir. Pump Timer1_2 Enalbe", "address": 1332, "data_type": "BINARY", "category": "other", "step": 1, "unit": "min"},
-    "W3 Enalbe": {"name": "Warm Water Cir. Pump Timer3 Enalbe", "address": 1333, "data_type": "BINARY", "category": "other", "step": 1, "unit": "min"},
-    "A11": {"name": "Enable Low Pressure Sensor", "address": 1042, "data_type": "ENUM", "category": "protection", "min": 0.0, "max": 1.0, "step": 1, "unit": "bar"},
-    "A21": {"name": "Ambient/Suction/Coil Sensor Type", "address": 1052, "data_type": "ENUM", "category": "protection", "min": 0.0, "max": 1.0, "step": 1},
-    "A29": {"name": "Enable High Pressure Sensor", "address": 1058, "data_type": "ENUM", "category": "protection", "min": 0.0, "max": 1.0, "step": 1, "unit": "bar"},
-    "P06": {"name": "Main Circulation Pump Manual Control", "address": 1202, "data_type": "ENUM", "category": "pump", "min": 0.0, "max": 1.0, "step": 1},
-    "Power": {"name": "Power", "address": 1011, "data_type": "ENUM", "category": "pump", "min": 0.0, "max": 1.0, "step": 1},
-    "RT1-1": {"name": "Thermostat1_Power", "address": 7001, "data_type": "ENUM", "category": "setpoints", "min": 0.0, "max": 1.0, "step": 1},
-    "RT2-1": {"name": "Thermostat2_Power", "address": 7091, "data_type": "ENUM", "category": "setpoints", "min": 0.0, "max": 1.0, "step": 1},
-    "SG08": {"name": "Turn on the electric heater immediately in Mode 4", "address": 1341, "data_type": "ENUM", "category": "status", "min": 0.0, "max": 1.0, "step": 1},
-    "H01": {"name": "Enable Power-off Memory", "address": 1018, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 1.0, "step": 1},
-    "H05": {"name": "Enable Cooling Function", "address": 1021, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 1.0, "step": 1},
-    "H07": {"name": "Control Mode", "address": 1023, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 1.0, "step": 1},
-    "H20": {"name": "3-way Valve Polarity", "address": 1033, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 1.0, "step": 1},
-    "H21": {"name": "Temperature Unit", "address": 1029, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 1.0, "step": 1, "unit": "°C"},
-    "H22": {"name": "Enable Silent Mode", "address": 1030, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 1.0, "step": 1},
-    "H28": {"name": "Heating/Cooling and Hot Water Function Enabled", "address": 1028, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 2.0, "step": 1},
-    "H33": {"name": "Fan Motor Driver and Comp. Driver Integrated", "address": 1019, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 1.0, "step": 1},
-    "H36": {"name": "H36/Z16 Enable Positive Weather Compensation", "address": 1236, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 1.0, "step": 1},
-    "H37": {"name": "DHW Temp. Sourcing", "address": 1048, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 1.0, "step": 1, "unit": "°C"},
-    "H45": {"name": "Enable Showing COP and Heating Output", "address": 1404, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 1.0, "step": 1},
-    "hanControl": {"name": "Manual Control", "address": 1016, "data_type": "BINARY", "category": "system", "step": 1},
-    "Thermostat1_Mute": {"name": "Thermostat1_Mute", "address": 7005, "data_type": "ENUM", "category": "temperatures", "min": 0.0, "max": 1.0, "step": 1},
-    "Thermostat2_Mute": {"name": "Thermostat2_Mute", "address": 7095, "data_type": "ENUM", "category": "temperatures", "min": 0.0, "max": 1.0, "step": 1},
-    "Timer_Mute_Off_En": {"name": "Timer_Mute_Off_En", "address": 1247, "data_type": "ENUM", "category": "temperatures", "min": 0.0, "max": 1.0, "step": 1, "unit": "min"},
-    "Timer_Mute_On_En": {"name": "Timer_Mute_On_En", "address": 1244, "data_type": "ENUM", "category": "temperatures", "min": 0.0, "max": 1.0, "step": 1, "unit": "min"},
-    "Z17": {"name": "Enable AT Compensation Curve Zone 2", "address": 1077, "data_type": "ENUM", "category": "zones", "min": 0.0, "max": 1.0, "step": 1},
-    "Z20": {"name": "Enable Zone 1 Water Pump in Cooling", "address": 1358, "data_type": "ENUM", "category": "zones", "min": 0.0, "max": 1.0, "step": 1},
-}
+SWITCH_RECORDS = (
+    ("D21", "Enable Electric Heater During Defrosting", 1126, "ENUM", "defrost", 0.0, 1.0, None, None, 1, ""),
+    ("D26", "Enable Defrosting Communication in Cascade", 1047, "ENUM", "defrost", 0.0, 1.0, None, None, 1, ""),
+    ("DP1-temp", "Dew point monitoring", 1385, "ENUM", "defrost", 0.0, 1.0, None, None, 1, ""),
+    ("G05", "Enable Disinfection", 1156, "ENUM", "disinfection", 0.0, 1.0, None, None, 1, ""),
+    ("G06", "Allow Disinfection in Standby & Off Mode", 1429, "ENUM", "disinfection", 0.0, 1.0, None, None, 1, ""),
+    ("E09", "EVI EEV: Adjustment Mode", 1139, "ENUM", "eev", 0.0, 1.0, None, None, 1, ""),
+    ("F10", "Fan Quantity", 1074, "ENUM", "fan", 0.0, 1.0, None, None, 1, ""),
+    ("F22", "Enable Manual-control Fan Speed", 1087, "ENUM", "fan", 0.0, 1.0, None, None, 1, "rpm"),
+    ("FT1", "Power", 1372, "ENUM", "fan", 0.0, 1.0, None, None, 1, ""),
+    ("KG13~KG28", "First_Second_Period(Enable/Disable)", 1268, "BINARY", "other", None, None, None, None, 1, ""),
+    ("KG29~KG44", "Third_Fourth_Period(Enable/Disable)", 1269, "BINARY", "other", None, None, None, None, 1, ""),
+    ("KG45~KG60", "Fifth_Sixth_Period(Enable/Disable)", 1270, "BINARY", "other", None, None, None, None, 1, ""),
+    ("L10", "Power", 5100, "ENUM", "other", 0.0, 1.0, None, None, 1, ""),
+    ("L22", "Enable weather compensation", 5112, "ENUM", "other", 0.0, 1.0, None, None, 1, ""),
+    ("L25", "Enable Energy level coordination", 5115, "ENUM", "other", 0.0, 1.0, None, None, 1, ""),
+    ("M1_2 Enalbe", "Mode&Temp.&Power Timer1_2 Enalbe", 1323, "BINARY", "other", None, None, None, None, 1, "°C"),
+    ("M3_4 Enalbe", "Mode&Temp.&Power Timer3_4 Enalbe", 1324, "BINARY", "other", None, None, None, None, 1, "°C"),
+    ("M5_6 Enalbe", "Mode&Temp.&Power Timer5_6 Enalbe", 1325, "BINARY", "other", None, None, None, None, 1, "°C"),
+    ("W1_2 Enalbe", "Warm Water Cir. Pump Timer1_2 Enalbe", 1332, "BINARY", "other", None, None, None, None, 1, "min"),
+    ("W3 Enalbe", "Warm Water Cir. Pump Timer3 Enalbe", 1333, "BINARY", "other", None, None, None, None, 1, "min"),
+    ("A11", "Enable Low Pressure Sensor", 1042, "ENUM", "protection", 0.0, 1.0, None, None, 1, "bar"),
+    ("A21", "Ambient/Suction/Coil Sensor Type", 1052, "ENUM", "protection", 0.0, 1.0, None, None, 1, ""),
+    ("A29", "Enable High Pressure Sensor", 1058, "ENUM", "protection", 0.0, 1.0, None, None, 1, "bar"),
+    ("P06", "Main Circulation Pump Manual Control", 1202, "ENUM", "pump", 0.0, 1.0, None, None, 1, ""),
+    ("Power", "Power", 1011, "ENUM", "pump", 0.0, 1.0, None, None, 1, ""),
+    ("RT1-1", "Thermostat1_Power", 7001, "ENUM", "setpoints", 0.0, 1.0, None, None, 1, ""),
+    ("RT2-1", "Thermostat2_Power", 7091, "ENUM", "setpoints", 0.0, 1.0, None, None, 1, ""),
+    ("SG08", "Turn on the electric heater immediately in Mode 4", 1341, "ENUM", "status", 0.0, 1.0, None, None, 1, ""),
+    ("H01", "Enable Power-off Memory", 1018, "ENUM", "system", 0.0, 1.0, None, None, 1, ""),
+    ("H05", "Enable Cooling Function", 1021, "ENUM", "system", 0.0, 1.0, None, None, 1, ""),
+    ("H07", "Control Mode", 1023, "ENUM", "system", 0.0, 1.0, None, None, 1, ""),
+    ("H20", "3-way Valve Polarity", 1033, "ENUM", "system", 0.0, 1.0, None, None, 1, ""),
+    ("H21", "Temperature Unit", 1029, "ENUM", "system", 0.0, 1.0, None, None, 1, "°C"),
+    ("H22", "Enable Silent Mode", 1030, "ENUM", "system", 0.0, 1.0, None, None, 1, ""),
+    ("H28", "Heating/Cooling and Hot Water Function Enabled", 1028, "ENUM", "system", 0.0, 2.0, None, None, 1, ""),
+    ("H33", "Fan Motor Driver and Comp. Driver Integrated", 1019, "ENUM", "system", 0.0, 1.0, None, None, 1, ""),
+    ("H36", "H36/Z16 Enable Positive Weather Compensation", 1236, "ENUM", "system", 0.0, 1.0, None, None, 1, ""),
+    ("H37", "DHW Temp. Sourcing", 1048, "ENUM", "system", 0.0, 1.0, None, None, 1, "°C"),
+    ("H45", "Enable Showing COP and Heating Output", 1404, "ENUM", "system", 0.0, 1.0, None, None, 1, ""),
+    ("hanControl", "Manual Control", 1016, "BINARY", "system", None, None, None, None, 1, ""),
+    ("Thermostat1_Mute", "Thermostat1_Mute", 7005, "ENUM", "temperatures", 0.0, 1.0, None, None, 1, ""),
+    ("Thermostat2_Mute", "Thermostat2_Mute", 7095, "ENUM", "temperatures", 0.0, 1.0, None, None, 1, ""),
+    ("Timer_Mute_Off_En", "Timer_Mute_Off_En", 1247, "ENUM", "temperatures", 0.0, 1.0, None, None, 1, "min"),
+    ("Timer_Mute_On_En", "Timer_Mute_On_En", 1244, "ENUM", "temperatures", 0.0, 1.0, None, None, 1, "min"),
+    ("Z17", "Enable AT Compensation Curve Zone 2", 1077, "ENUM", "zones", 0.0, 1.0, None, None, 1, ""),
+    ("Z20", "Enable Zone 1 Water Pump in Cooling", 1358, "ENUM", "zones", 0.0, 1.0, None, None, 1, ""),
+)
 
 # SELECT PARAMETERS (Multi-option)
-SELECT_PARAMS = {
-    "D24": {"name": "Defrosting Heating Source in Heating / DHW Mode", "address": 1129, "data_type": "ENUM", "category": "defrost", "min": 0.0, "max": 2.0, "step": 1},
-    "DP1": {"name": "Dew point control function", "address": 1387, "data_type": "ENUM", "category": "defrost", "min": 0.0, "max": 2.0, "step": 1},
-    "E01": {"name": "EEV Adjust Mode", "address": 1131, "data_type": "ENUM", "category": "eev", "min": 0.0, "max": 2.0, "step": 1},
-    "F01": {"name": "Fan Motor Type", "address": 1059, "data_type": "ENUM", "category": "fan", "min": 1.0, "max": 4.0, "step": 1},
-    "FT0": {"name": "Factory Test Mode", "address": 1371, "data_type": "ENUM", "category": "fan", "min": 0.0, "max": 3.0, "step": 1},
-    "FT2": {"name": "Mode", "address": 1373, "data_type": "ENUM", "category": "fan", "step": 1},
-    "L07": {"name": "Temp. Control Selection", "address": 5097, "data_type": "ENUM", "category": "other", "min": 0.0, "max": 2.0, "step": 1, "unit": "°C"},
-    "L11": {"name": "Mode", "address": 5101, "data_type": "ENUM", "category": "other", "min": 0.0, "max": 4.0, "step": 1},
-    "L21": {"name": "Supported Mode of Project", "address": 5111, "data_type": "ENUM", "category": "other", "min": 1.0, "max": 6.0, "step": 1},
-    "L26": {"name": "Location of Electric Heater", "address": 5116, "data_type": "ENUM", "category": "other", "min": 0.0, "max": 3.0, "step": 1},
-    "L27": {"name": "Electric Heater Stage", "address": 5117, "data_type": "ENUM", "category": "other", "min": 1.0, "max": 3.0, "step": 1},
-    "M1 Mode": {"name": "Mode&Temp.&Power Timer1 Mode", "address": 1286, "data_type": "ENUM", "category": "other", "step": 1, "unit": "°C"},
-    "M2 Mode": {"name": "Mode&Temp.&Power Timer2 Mode", "address": 1293, "data_type": "ENUM", "category": "other", "step": 1, "unit": "°C"},
-    "M3 Mode": {"name": "Mode&Temp.&Power Timer3 Mode", "address": 1300, "data_type": "ENUM", "category": "other", "step": 1, "unit": "°C"},
-    "M4 Mode": {"name": "Mode&Temp.&Power Timer4 Mode", "address": 1307, "data_type": "ENUM", "category": "other", "step": 1, "unit": "°C"},
-    "M5 Mode": {"name": "Mode&Temp.&Power Timer5 Mode", "address": 1314, "data_type": "ENUM", "category": "other", "step": 1, "unit": "°C"},
-    "M6 Mode": {"name": "Mode&Temp.&Power Timer6 Mode", "address": 1321, "data_type": "ENUM", "category": "other", "step": 1, "unit": "°C"},
-    "Mode": {"name": "Mode", "address": 1012, "data_type": "ENUM", "category": "other", "step": 1},
-    "P01": {"name": "Main Circulation Pump Operation Mode", "address": 1197, "data_type": "ENUM", "category": "pump", "min": 0.0, "max": 2.0, "step": 1, "unit": "%"},
-    "P05": {"name": "DHW Pump Operation Mode", "address": 1201, "data_type": "ENUM", "category": "pump", "min": 0.0, "max": 2.0, "step": 1, "unit": "%"},
-    "R35": {"name": "Location of Electric Heater", "address": 1173, "data_type": "ENUM", "category": "setpoints", "min": 0.0, "max": 3.0, "step": 1},
-    "RT1-3": {"name": "Thermostat1_Zone_Selection", "address": 7003, "data_type": "ENUM", "category": "setpoints", "min": 1.0, "max": 2.0, "step": 1},
-    "RT2-3": {"name": "Thermostat2_Zone_Selection", "address": 7093, "data_type": "ENUM", "category": "setpoints", "min": 1.0, "max": 2.0, "step": 1},
-    "SG01": {"name": "SG Ready Application", "address": 1334, "data_type": "ENUM", "category": "status", "min": 0.0, "max": 2.0, "step": 1},
-    "H18": {"name": "Electric Heater Stage", "address": 1032, "data_type": "ENUM", "category": "system", "min": 1.0, "max": 3.0, "step": 1},
-    "H25": {"name": "Temp. Control Selection", "address": 1035, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 3.0, "step": 1, "unit": "°C"},
-    "H27": {"name": "Enable EVI", "address": 1027, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 3.0, "step": 1},
-    "H30": {"name": "Indoor Unit Type", "address": 1036, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 3.0, "step": 1},
-    "H31": {"name": "Circulation Pump Type", "address": 1041, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 5.0, "step": 1},
-    "H38": {"name": "language", "address": 1025, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 13.0, "step": 5},
-    "H40": {"name": "External pump selection", "address": 1345, "data_type": "ENUM", "category": "system", "min": 0.0, "max": 2.0, "step": 1},
-    "Thermostat1_Mode": {"name": "Thermostat1_Mode", "address": 7004, "data_type": "ENUM", "category": "temperatures", "min": 0.0, "max": 4.0, "step": 1},
-    "Thermostat2_Mode": {"name": "Thermostat2_Mode", "address": 7094, "data_type": "ENUM", "category": "temperatures", "min": 0.0, "max": 4.0, "step": 1},
-    "Z01": {"name": "Enable Multi-Zone Control", "address": 1069, "data_type": "ENUM", "category": "zones", "min": 0.0, "max": 9.0, "step": 1},
-}
+SELECT_RECORDS = (
+    ("D24", "Defrosting Heating Source in Heating / DHW Mode", 1129, "ENUM", "defrost", 0.0, 2.0, None, None, 1, ""),
+    ("DP1", "Dew point control function", 1387, "ENUM", "defrost", 0.0, 2.0, None, None, 1, ""),
+    ("E01", "EEV Adjust Mode", 1131, "ENUM", "eev", 0.0, 2.0, None, None, 1, ""),
+    ("F01", "Fan Motor Type", 1059, "ENUM", "fan", 1.0, 4.0, None, None, 1, ""),
+    ("FT0", "Factory Test Mode", 1371, "ENUM", "fan", 0.0, 3.0, None, None, 1, ""),
+    ("FT2", "Mode", 1373, "ENUM", "fan", None, None, None, None, 1, ""),
+    ("L07", "Temp. Control Selection", 5097, "ENUM", "other", 0.0, 2.0, None, None, 1, "°C"),
+    ("L11", "Mode", 5101, "ENUM", "other", 0.0, 4.0, None, None, 1, ""),
+    ("L21", "Supported Mode of Project", 5111, "ENUM", "other", 1.0, 6.0, None, None, 1, ""),
+    ("L26", "Location of Electric Heater", 5116, "ENUM", "other", 0.0, 3.0, None, None, 1, ""),
+    ("L27", "Electric Heater Stage", 5117, "ENUM", "other", 1.0, 3.0, None, None, 1, ""),
+    ("M1 Mode", "Mode&Temp.&Power Timer1 Mode", 1286, "ENUM", "other", None, None, None, None, 1, "°C"),
+    ("M2 Mode", "Mode&Temp.&Power Timer2 Mode", 1293, "ENUM", "other", None, None, None, None, 1, "°C"),
+    ("M3 Mode", "Mode&Temp.&Power Timer3 Mode", 1300, "ENUM", "other", None, None, None, None, 1, "°C"),
+    ("M4 Mode", "Mode&Temp.&Power Timer4 Mode", 1307, "ENUM", "other", None, None, None, None, 1, "°C"),
+    ("M5 Mode", "Mode&Temp.&Power Timer5 Mode", 1314, "ENUM", "other", None, None, None, None, 1, "°C"),
+    ("M6 Mode", "Mode&Temp.&Power Timer6 Mode", 1321, "ENUM", "other", None, None, None, None, 1, "°C"),
+    ("Mode", "Mode", 1012, "ENUM", "other", None, None, None, None, 1, ""),
+    ("P01", "Main Circulation Pump Operation Mode", 1197, "ENUM", "pump", 0.0, 2.0, None, None, 1, "%"),
+    ("P05", "DHW Pump Operation Mode", 1201, "ENUM", "pump", 0.0, 2.0, None, None, 1, "%"),
+    ("R35", "Location of Electric Heater", 1173, "ENUM", "setpoints", 0.0, 3.0, None, None, 1, ""),
+    ("RT1-3", "Thermostat1_Zone_Selection", 7003, "ENUM", "setpoints", 1.0, 2.0, None, None, 1, ""),
+    ("RT2-3", "Thermostat2_Zone_Selection", 7093, "ENUM", "setpoints", 1.0, 2.0, None, None, 1, ""),
+    ("SG01", "SG Ready Application", 1334, "ENUM", "status", 0.0, 2.0, None, None, 1, ""),
+    ("H18", "Electric Heater Stage", 1032, "ENUM", "system", 1.0, 3.0, None, None, 1, ""),
+    ("H25", "Temp. Control Selection", 1035, "ENUM", "system", 0.0, 3.0, None, None, 1, "°C"),
+    ("H27", "Enable EVI", 1027, "ENUM", "system", 0.0, 3.0, None, None, 1, ""),
+    ("H30", "Indoor Unit Type", 1036, "ENUM", "system", 0.0, 3.0, None, None, 1, ""),
+    ("H31", "Circulation Pump Type", 1041, "ENUM", "system", 0.0, 5.0, None, None, 1, ""),
+    ("H38", "language", 1025, "ENUM", "system", 0.0, 13.0, None, None, 5, ""),
+    ("H40", "External pump selection", 1345, "ENUM", "system", 0.0, 2.0, None, None, 1, ""),
+    ("Thermostat1_Mode", "Thermostat1_Mode", 7004, "ENUM", "temperatures", 0.0, 4.0, None, None, 1, ""),
+    ("Thermostat2_Mode", "Thermostat2_Mode", 7094, "ENUM", "temperatures", 0.0, 4.0, None, None, 1, ""),
+    ("Z01", "Enable Multi-Zone Control", 1069, "ENUM", "zones", 0.0, 9.0, None, None, 1, ""),
+)
+
+WRITABLE_PARAMS = ParamTable(WRITABLE_RECORDS)
+SENSOR_PARAMS = ParamTable(SENSOR_RECORDS)
+SWITCH_PARAMS = ParamTable(SWITCH_RECORDS)
+SELECT_PARAMS = ParamTable(SELECT_RECORDS)
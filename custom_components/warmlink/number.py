@@ -11,13 +11,21 @@ from homeassistant.components.number import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import is_device_online
-from .const import DOMAIN, CONF_LANGUAGE, ALL_WRITABLE_PARAMS
+from .const import (
+    DOMAIN,
+    CONF_CATEGORY_CLASSES,
+    CONF_LANGUAGE,
+    ALL_WRITABLE_PARAMS,
+    SIGNAL_DEVICES_ADDED,
+)
+from .classification import EntityClassification, classify
 from .coordinator import WarmLinkCoordinator
+from .entity import WarmLinkEntity
+from .validation import static_limits
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -248,74 +256,81 @@ async def async_setup_entry(
 ) -> None:
     """Set up Warmlink number entities."""
     data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: WarmLinkCoordinator = data["coordinator"]
-    api = data["api"]
+    coordinators: dict[str, WarmLinkCoordinator] = data["coordinators"]
     language = entry.data.get(CONF_LANGUAGE, "en")
+    category_classes = entry.options.get(CONF_CATEGORY_CLASSES, {})
 
-    entities = []
-    for device_code, device_data in coordinator.data.items():
-        parsed_data = device_data.get("_parsed_data", {})
+    @callback
+    def _async_add_devices(device_codes: list[str]) -> None:
+        """Create entities for the given devices."""
+        entities = []
+        for device_code in device_codes:
+            coordinator = coordinators[device_code]
+            device_data = coordinator.data
+            parsed_data = device_data.get("_parsed_data", {})
         
-        # Add all writable parameters that exist in device data
-        for param_code, param_info in WRITABLE_PARAMS.items():
-            # Check if device has this parameter OR it's a primary setpoint
-            if param_code in parsed_data or param_code in PRIMARY_SETPOINTS:
-                entities.append(
-                    WarmLinkNumber(
-                        coordinator=coordinator,
-                        api=api,
-                        device_code=device_code,
-                        device_data=device_data,
-                        param_code=param_code,
-                        param_info=param_info,
-                        language=language,
+            # Add all writable parameters that exist in device data
+            for param_code, param_info in WRITABLE_PARAMS.items():
+                # Check if device has this parameter OR it's a primary setpoint
+                if param_code in parsed_data or param_code in PRIMARY_SETPOINTS:
+                    entities.append(
+                        WarmLinkNumber(
+                            coordinator=coordinator,
+                            device_code=device_code,
+                            param_code=param_code,
+                            param_info=param_info,
+                            language=language,
+                            classification=classify(
+                                param_code,
+                                param_info.get("category", "other"),
+                                True,
+                                category_classes,
+                            ),
+                        )
                     )
-                )
 
-    _LOGGER.info("Setting up %d number entities for Warmlink", len(entities))
-    async_add_entities(entities)
+        _LOGGER.info("Setting up %d number entities for Warmlink", len(entities))
+        async_add_entities(entities)
 
+    _async_add_devices(list(coordinators))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), _async_add_devices
+        )
+    )
 
-class WarmLinkNumber(CoordinatorEntity[WarmLinkCoordinator], NumberEntity):
-    """Representation of a Warmlink number entity for setpoints."""
 
-    _attr_has_entity_name = True
+class WarmLinkNumber(WarmLinkEntity, NumberEntity):
+    """Representation of a Warmlink number entity for setpoints."""
 
     def __init__(
         self,
         coordinator: WarmLinkCoordinator,
-        api,
         device_code: str,
-        device_data: dict[str, Any],
         param_code: str,
         param_info: dict[str, Any],
         language: str = "en",
+        classification: EntityClassification | None = None,
     ) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
 
-        self._api = api
-        self._device_code = device_code
         self._param_code = param_code
         self._param_info = param_info
         self._language = language
 
-        device_name = (
-            device_data.get("device_nick_name")
-            or device_data.get("deviceNickName")
-            or device_code
-        )
-        model = device_data.get("custModel") or device_data.get("productId") or "Heat Pump"
-
         self._attr_unique_id = f"{DOMAIN}_{device_code}_{param_code}"
+        if classification is not None:
+            self._apply_classification(classification)
         
         # Get translated name
         translations = NUMBER_TRANSLATIONS.get(language, NUMBER_TRANSLATIONS["en"])
         self._attr_name = translations.get(param_code, param_info.get("name", param_code))
 
-        # Set number attributes from param_info
-        self._attr_native_min_value = float(param_info.get("min", 0))
-        self._attr_native_max_value = float(param_info.get("max", 100))
+        # Set number attributes from param_info; same fallback as validation
+        low, high = static_limits(param_code)
+        self._attr_native_min_value = float(low)
+        self._attr_native_max_value = float(high)
         self._attr_native_step = float(param_info.get("step", 0.5))
         self._attr_mode = NumberMode.SLIDER if param_code in PRIMARY_SETPOINTS else NumberMode.BOX
         self._attr_icon = param_info.get("icon", get_icon_for_param(param_code))
@@ -350,17 +365,10 @@ class WarmLinkNumber(CoordinatorEntity[WarmLinkCoordinator], NumberEntity):
         elif unit:
             self._attr_native_unit_of_measurement = unit
 
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_code)},
-            "name": device_name,
-            "manufacturer": "Phinx/Warmlink",
-            "model": model,
-        }
-
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        device = self.coordinator.data.get(self._device_code, {})
+        device = self._device
         parsed_data = device.get("_parsed_data", {})
         value = parsed_data.get(self._param_code)
 
@@ -372,10 +380,16 @@ class WarmLinkNumber(CoordinatorEntity[WarmLinkCoordinator], NumberEntity):
         return None
 
     @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.data.get(self._device_code, {})
-        return is_device_online(device) and super().available
+    def native_min_value(self) -> float:
+        """Return the current minimum (may depend on other parameters)."""
+        low, _ = self.coordinator.get_limits(self._param_code)
+        return self._attr_native_min_value if low is None else low
+
+    @property
+    def native_max_value(self) -> float:
+        """Return the current maximum (may depend on other parameters)."""
+        _, high = self.coordinator.get_limits(self._param_code)
+        return self._attr_native_max_value if high is None else high
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
@@ -386,18 +400,5 @@ class WarmLinkNumber(CoordinatorEntity[WarmLinkCoordinator], NumberEntity):
             self._device_code,
         )
 
-        success = await self._api.set_temperature(
-            self._device_code, self._param_code, value
-        )
-
-        if success:
-            # Optimistically update the value
-            device = self.coordinator.data.get(self._device_code, {})
-            parsed_data = device.get("_parsed_data", {})
-            parsed_data[self._param_code] = value
-            self.async_write_ha_state()
-
-            # Request a refresh
-            await self.coordinator.async_request_refresh()
-        else:
+        if not await self._async_write(self._param_code, value):
             _LOGGER.error("Failed to set %s", self._param_code)
@@ -0,0 +1,143 @@
+"""Offline tracking and reconnection backoff of a Warmlink device.
+
+An offline device used to be polled like an online one: a full device list
+walk (owned and shared lists) every cycle, only to skip it again. Its
+coordinator now checks it with getDeviceStatus alone (one small request),
+with exponential backoff from BACKOFF_MIN to BACKOFF_MAX (the previous
+longest poll interval, so a reconnect is not noticed later than before).
+The device counts as still offline only if the status explicitly says
+OFFLINE and the cached shared device list agrees. Otherwise (online, an
+unknown layout, or the list saw it online) the coordinator refreshes the
+device list and runs the full fetch in the same update, so entities
+recover right away instead of at the next regular cycle.
+
+OfflineWatcher keeps the backoff, the start of the current offline period,
+the reconnect count and the length of the last offline period; the latter
+are exported with as_dict() and restored from it.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
+# Delay of the first status check after a device went offline...
+BACKOFF_MIN: Final = 30  # seconds
+# ...doubled after every check that found it still offline, up to
+BACKOFF_MAX: Final = 300  # seconds
+
+# Keys of the exported values
+OFFLINE_DURATION: Final = "offline_duration"
+LAST_OFFLINE_DURATION: Final = "last_offline_duration"
+RECONNECTS: Final = "reconnects"
+
+# Fields of the device list entry; the getDeviceStatus layout is unverified
+_STATUS_FIELDS: Final = ("deviceStatus", "device_status")
+
+
+def status_online(status: Mapping[str, Any]) -> bool | None:
+    """Return the online state of a getDeviceStatus result, None if unknown.
+
+    Only explicit ONLINE / OFFLINE values count.
+    """
+    for field in _STATUS_FIELDS:
+        value = status.get(field)
+        if not isinstance(value, str):
+            continue
+        if value.upper() == "ONLINE":
+            return True
+        if value.upper() == "OFFLINE":
+            return False
+    return None
+
+
+class OfflineWatcher:
+    """Offline periods and reconnects of one device."""
+
+    __slots__ = (
+        "_offline_since",
+        "_checks",
+        "_reconnects",
+        "_last_duration",
+        "_values",
+    )
+
+    def __init__(self, state: Mapping[str, Any] | None = None) -> None:
+        """Initialize, restoring the state from as_dict() if given."""
+        state = state or {}
+        # Timestamp the current offline period started, None while online
+        self._offline_since: float | None = state.get("offline_since")
+        # Status checks since the device went offline (backoff exponent)
+        self._checks = 0
+        self._reconnects: int = state.get("reconnects", 0)
+        self._last_duration: float = state.get("last_duration", 0.0)
+        self._values = self._exported(self._offline_since)
+
+    @property
+    def offline(self) -> bool:
+        """Return True during an offline period."""
+        return self._offline_since is not None
+
+    @property
+    def values(self) -> Mapping[str, float]:
+        """Return read-only mapping of key -> value (durations in minutes)."""
+        return self._values
+
+    def _exported(self, now: float | None) -> Mapping[str, float]:
+        """Return the values as exported to entities at timestamp now."""
+        offline = 0.0
+        if self._offline_since is not None and now is not None:
+            offline = now - self._offline_since
+        return MappingProxyType(
+            {
+                OFFLINE_DURATION: round(offline / 60, 1),
+                LAST_OFFLINE_DURATION: round(self._last_duration / 60, 1),
+                RECONNECTS: self._reconnects,
+            }
+        )
+
+    def _refresh(self, now: float) -> None:
+        """Update the exported values, keeping the mapping if unchanged."""
+        exported = self._exported(now)
+        # Unchanged values keep their mapping, so snapshots compare equal
+        if exported != self._values:
+            self._values = exported
+
+    def mark_offline(self, now: float) -> bool:
+        """Record the device offline at timestamp now.
+
+        Returns True if it just went offline.
+        """
+        went_offline = self._offline_since is None
+        if went_offline:
+            self._offline_since = now
+            self._checks = 0
+        self._refresh(now)
+        return went_offline
+
+    def mark_online(self, now: float) -> float | None:
+        """Record the device online; return the offline seconds on reconnection."""
+        if self._offline_since is None:
+            return None
+        duration = max(now - self._offline_since, 0.0)
+        self._offline_since = None
+        self._checks = 0
+        self._reconnects += 1
+        self._last_duration = duration
+        self._refresh(now)
+        return duration
+
+    def next_delay(self) -> float:
+        """Return the delay of the next status check and back off further."""
+        delay = min(BACKOFF_MIN * 2**self._checks, BACKOFF_MAX)
+        if delay < BACKOFF_MAX:
+            self._checks += 1
+        return delay
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state as JSON-serializable dict."""
+        return {
+            "offline_since": self._offline_since,
+            "reconnects": self._reconnects,
+            "last_duration": self._last_duration,
+        }
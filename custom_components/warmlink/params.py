@@ -0,0 +1,110 @@
+"""Read-only views over the precompiled Modbus parameter table.
+
+generate_params.py emits every parameter as a flat record tuple
+(modbus_params.py). Tuples of constants are stored as a single constant in
+the compiled module, so importing the table does not build ~550 dicts.
+ParamTable exposes a tuple of records as a code -> ParamInfo mapping; the
+code -> index lookup and the ParamInfo views are only built when a table
+is first queried.
+
+ParamInfo behaves like the dict it replaces: fields without a value
+(``min``, ``unit``, ...) are missing, so ``info.get("min")`` and
+``"min" in info`` keep working.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any, Final
+
+# Field order of a record after its code
+FIELDS: Final[tuple[str, ...]] = (
+    "name",
+    "address",
+    "data_type",
+    "category",
+    "min",
+    "max",
+    "min_ref",
+    "max_ref",
+    "step",
+    "unit",
+)
+_FIELD_INDEX: Final[dict[str, int]] = {
+    field: index for index, field in enumerate(FIELDS, start=1)
+}
+
+Record = tuple[Any, ...]
+
+
+def _is_set(value: Any) -> bool:
+    """Return True if a record field holds a value."""
+    return value is not None and value != ""
+
+
+class ParamInfo(Mapping[str, Any]):
+    """Read-only field -> value view of one parameter record."""
+
+    __slots__ = ("_record",)
+
+    def __init__(self, record: Record) -> None:
+        """Initialize the view."""
+        self._record = record
+
+    @property
+    def code(self) -> str:
+        """Return the protocol code of the parameter."""
+        return self._record[0]
+
+    def __getitem__(self, field: str) -> Any:
+        index = _FIELD_INDEX.get(field)
+        if index is None or not _is_set(value := self._record[index]):
+            raise KeyError(field)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        record = self._record
+        return (field for field, index in _FIELD_INDEX.items() if _is_set(record[index]))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"ParamInfo({self.code!r}, {dict(self)!r})"
+
+
+class ParamTable(Mapping[str, ParamInfo]):
+    """Read-only code -> ParamInfo mapping over parameter records.
+
+    A code listed in several records maps to the last one.
+    """
+
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, *records: tuple[Record, ...]) -> None:
+        """Initialize the table from one or more tuples of records."""
+        self._records: tuple[Record, ...] = (
+            records[0] if len(records) == 1 else tuple(r for group in records for r in group)
+        )
+        self._index: dict[str, ParamInfo] | None = None
+
+    def _lookup(self) -> dict[str, ParamInfo]:
+        """Return code -> ParamInfo, building it on first use."""
+        if self._index is None:
+            self._index = {record[0]: ParamInfo(record) for record in self._records}
+        return self._index
+
+    def __getitem__(self, code: str) -> ParamInfo:
+        return self._lookup()[code]
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._lookup()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._lookup())
+
+    def __len__(self) -> int:
+        return len(self._lookup())
+
+    def codes(self) -> list[str]:
+        """Return the codes in record order, without building the lookup."""
+        return [record[0] for record in self._records]
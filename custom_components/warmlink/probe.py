@@ -0,0 +1,90 @@
+"""Change probe in front of the full Warmlink data fetch.
+
+A full poll requests all 550+ protocol codes in several getDataByCode
+chunks, even in standby when nothing moves. With probing enabled every
+poll first requests only PROBE_CODES (one small request) and escalates to
+the full fetch only when:
+
+- a probe value differs from the current value (or the probe failed)
+- the last full fetch is older than max_age
+- it was forced: after a write, on range refresh, or without values yet
+
+getDeviceStatus would be smaller still, but it carries no operating
+state, so it cannot tell a standby unit from a running one.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Final
+
+# Operating state sentinels: power, mode, mode state (defrost...) and compressor
+PROBE_CODES: Final = ("Power", "Mode", "ModeState", "T30")
+
+
+def _stored_form(value: Any) -> Any:
+    """Return a raw cloud value as DeviceValueStore keeps it."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return value
+
+
+class ChangeProbe:
+    """Decide per poll whether a device needs the full data fetch."""
+
+    __slots__ = ("_max_age", "_last_fetch", "_forced", "skipped", "fetched")
+
+    def __init__(self, max_age: float) -> None:
+        """Initialize; the first poll always fetches."""
+        self._max_age = max_age
+        # Monotonic time of the last full fetch
+        self._last_fetch: float | None = None
+        self._forced = True
+        # Polls answered by the probe alone / with a full fetch
+        self.skipped = 0
+        self.fetched = 0
+
+    @property
+    def max_age(self) -> float:
+        """Return the longest interval between two full fetches in seconds."""
+        return self._max_age
+
+    def fetch_age(self, now: float) -> float | None:
+        """Return seconds since the last full fetch, None before the first."""
+        if self._last_fetch is None:
+            return None
+        return now - self._last_fetch
+
+    def force(self) -> None:
+        """Make the next poll fetch all values."""
+        self._forced = True
+
+    def due(self, now: float) -> bool:
+        """Return True if the next poll must fetch regardless of the probe."""
+        return (
+            self._forced
+            or self._last_fetch is None
+            or now - self._last_fetch >= self._max_age
+        )
+
+    def changed(
+        self, probed: Mapping[str, Mapping[str, Any]], current: Mapping[str, Any]
+    ) -> bool:
+        """Return True if a probed value (get_device_data result) differs."""
+        for code in PROBE_CODES:
+            item = probed.get(code)
+            value = None if item is None else _stored_form(item.get("value"))
+            # Codes the unit does not report are missing on both sides
+            if value != current.get(code):
+                return True
+        return False
+
+    def record_fetch(self, now: float) -> None:
+        """Record a full fetch."""
+        self._last_fetch = now
+        self._forced = False
+        self.fetched += 1
+
+    def record_skip(self) -> None:
+        """Record a poll answered by the probe alone."""
+        self.skipped += 1
@@ -0,0 +1,177 @@
+"""Rolling statistics of selected Warmlink values.
+
+Statistics helpers on top of the temperature sensors each subscribe to
+state changes and keep their own sample lists. Instead, the coordinator
+feeds every successful poll into one RollingStats per device, which keeps
+a fixed-size ring buffer (array-backed timestamps and values) per code.
+
+Per window the running sum and sum of squares give mean and standard
+deviation in O(1); monotonic deques give minimum and maximum in amortized
+O(1). Samples leave the window by age (window seconds) or when the buffer
+is full. Several window lengths can run side by side, each with its own
+buffers.
+
+The results are companion sensors (mean as state, the rest as attributes
+excluded from the recorder), one per code and window. The coordinator
+signals every fetch that added samples, so they stay current also while
+the code's own value is stable or held by the deadband filter.
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+from collections.abc import Iterable, Mapping
+from typing import Any, Final
+
+# Codes with rolling statistics: water, tank, ambient temperatures and compressor
+ROLLING_CODES: Final = ("T01", "T02", "T04", "T08", "T30")
+
+# Keys of a summary
+SUMMARY_KEYS: Final = ("min", "max", "mean", "stddev", "samples")
+
+# Polls are at least this far apart (minimum adaptive interval); sizes the buffers
+MIN_SAMPLE_INTERVAL: Final = 10  # seconds
+
+# Running sums are recomputed from the buffer after this many samples per slot
+# to cancel float drift
+_RESUM_CYCLES: Final = 4
+
+
+class RollingWindow:
+    """Samples of one value within the last window seconds."""
+
+    __slots__ = (
+        "_window",
+        "_times",
+        "_values",
+        "_capacity",
+        "_start",
+        "_count",
+        "_seq",
+        "_sum",
+        "_sumsq",
+        "_mins",
+        "_maxs",
+        "_pushes",
+    )
+
+    def __init__(self, window: float, capacity: int) -> None:
+        """Initialize an empty window holding at most capacity samples."""
+        self._window = window
+        self._capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        # Ring buffer position of the oldest sample and number of samples
+        self._start = 0
+        self._count = 0
+        # Sequence number of the next sample
+        self._seq = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        # (sequence number, value) with increasing / decreasing values
+        self._mins: deque[tuple[int, float]] = deque()
+        self._maxs: deque[tuple[int, float]] = deque()
+        self._pushes = 0
+
+    def _pop_oldest(self) -> None:
+        """Remove the oldest sample."""
+        value = self._values[self._start]
+        self._sum -= value
+        self._sumsq -= value * value
+        self._start = (self._start + 1) % self._capacity
+        self._count -= 1
+        oldest = self._seq - self._count
+        while self._mins and self._mins[0][0] < oldest:
+            self._mins.popleft()
+        while self._maxs and self._maxs[0][0] < oldest:
+            self._maxs.popleft()
+
+    def _resum(self) -> None:
+        """Recompute the running sums from the buffer."""
+        values = [
+            self._values[(self._start + offset) % self._capacity]
+            for offset in range(self._count)
+        ]
+        self._sum = math.fsum(values)
+        self._sumsq = math.fsum(value * value for value in values)
+
+    def push(self, timestamp: float, value: float) -> None:
+        """Add a sample and drop the samples that left the window."""
+        if self._count == self._capacity:
+            self._pop_oldest()
+        position = (self._start + self._count) % self._capacity
+        self._times[position] = timestamp
+        self._values[position] = value
+        self._count += 1
+        self._sum += value
+        self._sumsq += value * value
+        seq = self._seq
+        self._seq += 1
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((seq, value))
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((seq, value))
+
+        cutoff = timestamp - self._window
+        while self._count > 1 and self._times[self._start] < cutoff:
+            self._pop_oldest()
+
+        self._pushes += 1
+        if self._pushes >= _RESUM_CYCLES * self._capacity:
+            self._pushes = 0
+            self._resum()
+
+    def summary(self, digits: int = 2) -> dict[str, float] | None:
+        """Return min, max, mean and (population) standard deviation."""
+        count = self._count
+        if not count:
+            return None
+        mean = self._sum / count
+        variance = max(self._sumsq / count - mean * mean, 0.0)
+        return {
+            "min": round(self._mins[0][1], digits),
+            "max": round(self._maxs[0][1], digits),
+            "mean": round(mean, digits),
+            "stddev": round(math.sqrt(variance), digits),
+            "samples": count,
+        }
+
+
+class RollingStats:
+    """Rolling windows of the ROLLING_CODES values of one device."""
+
+    __slots__ = ("_lengths", "_windows")
+
+    def __init__(self, lengths: Iterable[float]) -> None:
+        """Initialize windows of each of the lengths (seconds)."""
+        self._lengths = tuple(sorted(set(lengths)))
+        self._windows = {
+            (code, length): RollingWindow(
+                length, max(int(length // MIN_SAMPLE_INTERVAL) + 1, 2)
+            )
+            for code in ROLLING_CODES
+            for length in self._lengths
+        }
+
+    @property
+    def lengths(self) -> tuple[float, ...]:
+        """Return the window lengths in seconds, shortest first."""
+        return self._lengths
+
+    def add_samples(self, timestamp: float, values: Mapping[str, Any]) -> None:
+        """Add the current values of the codes as samples taken at timestamp."""
+        for (code, _), window in self._windows.items():
+            value = values.get(code)
+            if isinstance(value, float):
+                window.push(timestamp, value)
+
+    def summary(self, code: str, length: float) -> dict[str, float] | None:
+        """Return the statistics of a code in the window of length seconds.
+
+        None without samples or without such a window.
+        """
+        window = self._windows.get((code, length))
+        return None if window is None else window.summary()
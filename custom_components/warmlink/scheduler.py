@@ -0,0 +1,104 @@
+"""Request scheduling for the Warmlink cloud API.
+
+The cloud answers one request per account at a time reasonably fast, but a
+full 550-code poll is split into several getDataByCode chunks that can take
+seconds in total. Control commands must not wait behind that, so every API
+request goes through a small priority scheduler: control commands are served
+before queued poll chunks, and a multi-chunk poll gives up its slot between
+chunks.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+class RequestPriority(IntEnum):
+    """Scheduling lanes for cloud requests (lower value is served first)."""
+
+    CONTROL = 0  # User commands (switch, select, number, climate...)
+    POLL = 1  # Background polling (getDataByCode chunks, device list)
+    BACKFILL = 2  # History backfill (getHistoryTimes chunks)
+
+
+class WarmLinkRequestScheduler:
+    """Limit concurrent cloud requests and serve waiters by priority.
+
+    Waiters with the same priority are served in FIFO order.
+    """
+
+    def __init__(self, max_concurrent: int = 1) -> None:
+        """Initialize the scheduler."""
+        self._max_concurrent = max_concurrent
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def pending(self) -> int:
+        """Return number of requests waiting for a slot."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of the block."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        """Wait until a slot is free for the given priority."""
+        if self._active < self._max_concurrent and not self.pending:
+            self._active += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over right before cancellation - pass it on
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Free a slot and hand it to the most urgent waiter."""
+        self._active -= 1
+        while self._waiters and self._active < self._max_concurrent:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # Waiter was cancelled
+            self._active += 1
+            future.set_result(None)
+
+
+@dataclass
+class LatencyStats:
+    """End-to-end latency of control commands (call to cloud ack)."""
+
+    last: float | None = None
+    maximum: float = 0.0
+    total: float = 0.0
+    count: int = 0
+
+    @property
+    def average(self) -> float | None:
+        """Return mean latency in seconds."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def record(self, seconds: float) -> None:
+        """Record a single measurement in seconds."""
+        self.last = seconds
+        self.maximum = max(self.maximum, seconds)
+        self.total += seconds
+        self.count += 1
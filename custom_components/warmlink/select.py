@@ -2,20 +2,32 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import is_device_online
-from .const import DOMAIN, CONF_LANGUAGE, ALL_SELECT_PARAMS
+from .const import (
+    DOMAIN,
+    CONF_CATEGORY_CLASSES,
+    CONF_LANGUAGE,
+    ALL_SELECT_PARAMS,
+    SELECT_PARAMS as SELECT_OPTION_PARAMS,
+    SIGNAL_DEVICES_ADDED,
+    SUPPORTED_LANGUAGES,
+)
 
 # Use ALL_SELECT_PARAMS from modbus_params.py (34+ parameters)
 SELECT_PARAMS = ALL_SELECT_PARAMS
+from .classification import EntityClassification, classify
 from .coordinator import WarmLinkCoordinator
+from .entity import WarmLinkEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -223,6 +235,50 @@ SELECT_OPTIONS_PL = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class SelectOptions:
+    """Option labels of a select parameter in one language."""
+
+    # Display values, in value order
+    options: tuple[str, ...]
+    # Numeric value -> display value
+    by_value: Mapping[int, str]
+    # Display value -> value as sent to the cloud
+    by_option: Mapping[str, str]
+
+
+def _build_select_options(
+    param_code: str, param_info: Mapping[str, Any], language: str
+) -> SelectOptions:
+    """Build the option tables of a parameter.
+
+    Labels come from the Polish translations, then from the option lists in
+    const.SELECT_PARAMS; parameters without either get their numeric range.
+    """
+    labels = SELECT_OPTIONS_PL.get(param_code) if language == "pl" else None
+    if labels is None:
+        labels = SELECT_OPTION_PARAMS.get(param_code, {}).get("options")
+    if labels is None and param_info.get("min") is not None and param_info.get("max") is not None:
+        labels = {
+            str(value): str(value)
+            for value in range(int(param_info["min"]), int(param_info["max"]) + 1)
+        }
+    labels = labels or {}
+    return SelectOptions(
+        options=tuple(labels.values()),
+        by_value=MappingProxyType({int(value): label for value, label in labels.items()}),
+        by_option=MappingProxyType({label: value for value, label in labels.items()}),
+    )
+
+
+# (param code, language) -> options, shared by the selects of all devices
+SELECT_OPTIONS: Final[Mapping[tuple[str, str], SelectOptions]] = MappingProxyType({
+    (param_code, language): _build_select_options(param_code, param_info, language)
+    for param_code, param_info in SELECT_PARAMS.items()
+    for language in SUPPORTED_LANGUAGES
+})
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -230,63 +286,69 @@ async def async_setup_entry(
 ) -> None:
     """Set up Warmlink select entities."""
     data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: WarmLinkCoordinator = data["coordinator"]
-    api = data["api"]
+    coordinators: dict[str, WarmLinkCoordinator] = data["coordinators"]
     language = entry.data.get(CONF_LANGUAGE, "en")
+    category_classes = entry.options.get(CONF_CATEGORY_CLASSES, {})
 
-    entities = []
-    for device_code, device_data in coordinator.data.items():
-        for param_code, param_info in SELECT_PARAMS.items():
-            # Mode is always available, others check if device has parameter
-            parsed_data = device_data.get("_parsed_data", {})
-            if param_code == "Mode" or param_code in parsed_data:
-                entities.append(
-                    WarmLinkSelect(
-                        coordinator=coordinator,
-                        api=api,
-                        device_code=device_code,
-                        device_data=device_data,
-                        param_code=param_code,
-                        param_info=param_info,
-                        language=language,
+    @callback
+    def _async_add_devices(device_codes: list[str]) -> None:
+        """Create entities for the given devices."""
+        entities = []
+        for device_code in device_codes:
+            coordinator = coordinators[device_code]
+            device_data = coordinator.data
+            for param_code, param_info in SELECT_PARAMS.items():
+                # Mode is always available, others check if device has parameter
+                parsed_data = device_data.get("_parsed_data", {})
+                if param_code == "Mode" or param_code in parsed_data:
+                    entities.append(
+                        WarmLinkSelect(
+                            coordinator=coordinator,
+                            device_code=device_code,
+                            param_code=param_code,
+                            param_info=param_info,
+                            language=language,
+                            classification=classify(
+                                param_code,
+                                param_info.get("category", "other"),
+                                True,
+                                category_classes,
+                            ),
+                        )
                     )
-                )
 
-    async_add_entities(entities)
+        async_add_entities(entities)
+
+    _async_add_devices(list(coordinators))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), _async_add_devices
+        )
+    )
 
 
-class WarmLinkSelect(CoordinatorEntity[WarmLinkCoordinator], SelectEntity):
+class WarmLinkSelect(WarmLinkEntity, SelectEntity):
     """Representation of a Warmlink select entity."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: WarmLinkCoordinator,
-        api,
         device_code: str,
-        device_data: dict[str, Any],
         param_code: str,
         param_info: dict[str, Any],
         language: str = "en",
+        classification: EntityClassification | None = None,
     ) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator)
 
-        self._api = api
-        self._device_code = device_code
         self._param_code = param_code
         self._param_info = param_info
         self._language = language
 
-        device_name = (
-            device_data.get("device_nick_name")
-            or device_data.get("deviceNickName")
-            or device_code
-        )
-        model = device_data.get("custModel") or device_data.get("productId") or "Heat Pump"
-
         self._attr_unique_id = f"{DOMAIN}_{device_code}_{param_code}_select"
+        if classification is not None:
+            self._apply_classification(classification)
 
         # Get translated name
         translations = SELECT_TRANSLATIONS.get(language, SELECT_TRANSLATIONS["en"])
@@ -294,47 +356,26 @@ class WarmLinkSelect(CoordinatorEntity[WarmLinkCoordinator], SelectEntity):
 
         self._attr_icon = param_info.get("icon", "mdi:form-select")
 
-        # Build options list based on language
-        self._options_map = param_info.get("options", {})
-        if language == "pl" and param_code in SELECT_OPTIONS_PL:
-            self._options_map = SELECT_OPTIONS_PL[param_code]
-        
-        # Options are the display values
-        self._attr_options = list(self._options_map.values())
-        
-        # Reverse map for value lookup
-        self._value_to_option = self._options_map
-        self._option_to_value = {v: k for k, v in self._options_map.items()}
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_code)},
-            "name": device_name,
-            "manufacturer": "Phinx/Warmlink",
-            "model": model,
-        }
+        self._options = SELECT_OPTIONS.get(
+            (param_code, language), SELECT_OPTIONS[(param_code, "en")]
+        )
+        # SelectEntity takes a list; the shared tuple stays untouched
+        self._attr_options = list(self._options.options)
 
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
-        device = self.coordinator.data.get(self._device_code, {})
-        parsed_data = device.get("_parsed_data", {})
-        value = parsed_data.get(self._param_code)
-
-        if value is not None:
-            # Convert value to string for lookup
-            str_value = str(int(value)) if isinstance(value, float) else str(value)
-            return self._value_to_option.get(str_value)
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self.coordinator.data.get(self._device_code, {})
-        return is_device_online(device) and super().available
+        value = self._get_parsed_data().get(self._param_code)
+        if value is None:
+            return None
+        try:
+            return self._options.by_value.get(int(value))
+        except (TypeError, ValueError):
+            return None
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        value = self._option_to_value.get(option)
+        value = self._options.by_option.get(option)
         if value is None:
             _LOGGER.error("Unknown option: %s", option)
             return
@@ -347,21 +388,5 @@ class WarmLinkSelect(CoordinatorEntity[WarmLinkCoordinator], SelectEntity):
             self._device_code,
         )
 
-        if self._param_code == "Mode":
-            success = await self._api.set_mode(self._device_code, value)
-        else:
-            success = await self._api._control_device(
-                self._device_code, self._param_code, value
-            )
-
-        if success:
-            # Optimistically update the value
-            device = self.coordinator.data.get(self._device_code, {})
-            parsed_data = device.get("_parsed_data", {})
-            parsed_data[self._param_code] = int(value)
-            self.async_write_ha_state()
-
-            # Request a refresh
-            await self.coordinator.async_request_refresh()
-        else:
+        if not await self._async_write(self._param_code, value):
             _LOGGER.error("Failed to set %s", self._param_code)
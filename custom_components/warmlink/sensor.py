@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from functools import cache
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -13,7 +15,9 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    EntityCategory,
     UnitOfTemperature,
+    UnitOfTime,
     UnitOfFrequency,
     UnitOfPower,
     UnitOfEnergy,
@@ -22,13 +26,38 @@ from homeassistant.const import (
     UnitOfVolumeFlowRate,
     PERCENTAGE,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import is_device_online
-from .const import DOMAIN, CONF_LANGUAGE, ALL_SENSOR_PARAMS
+from .classification import classify
+from .const import (
+    DOMAIN,
+    CONF_CATEGORY_CLASSES,
+    CONF_LANGUAGE,
+    ALL_SENSOR_PARAMS,
+    SIGNAL_DEVICES_ADDED,
+    SIGNAL_ROLLING_UPDATED,
+    SIGNAL_TOTALS_UPDATED,
+)
 from .coordinator import WarmLinkCoordinator
+from .cycles import (
+    COMPRESSOR_RUNTIME_TODAY,
+    COMPRESSOR_STARTS,
+    COMPRESSOR_STARTS_TODAY,
+    DEFROST_COUNT,
+    DEFROST_TIME_TODAY,
+    DEFROSTS_TODAY,
+    LAST_COMPRESSOR_RUN,
+    LAST_DEFROST_DURATION,
+    SHORT_CYCLES,
+    SHORT_CYCLES_TODAY,
+)
+from .derived import COP, DELTA_T, THERMAL_POWER
+from .energy import ELECTRIC_ENERGY, HEAT_ENERGY, THERMAL_ENERGY
+from .entity import WarmLinkEntity
+from .offline import LAST_OFFLINE_DURATION, OFFLINE_DURATION, RECONNECTS
+from .rolling import ROLLING_CODES, SUMMARY_KEYS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -420,6 +449,9 @@ SENSOR_DESCRIPTIONS: tuple[WarmLinkSensorEntityDescription, ...] = (
         translation_key="display_version",
         native_unit_of_measurement=None,
         icon="mdi:monitor",
+        # Not in the Modbus table: classified by hand like MainBoard Version
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
     ),
     
     # === ZONE SENSORS ===
@@ -478,6 +510,90 @@ SENSOR_DESCRIPTIONS: tuple[WarmLinkSensorEntityDescription, ...] = (
     ),
 )
 
+# Computed locally from T01/T02, T39 and Power In(Total) (see derived.py)
+DERIVED_SENSOR_DESCRIPTIONS: tuple[WarmLinkSensorEntityDescription, ...] = (
+    WarmLinkSensorEntityDescription(
+        key=DELTA_T,
+        translation_key="derived_delta_t",
+        native_unit_of_measurement=UnitOfTemperature.KELVIN,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:thermometer-lines",
+    ),
+    WarmLinkSensorEntityDescription(
+        key=THERMAL_POWER,
+        translation_key="derived_thermal_power",
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:fire",
+    ),
+    WarmLinkSensorEntityDescription(
+        key=COP,
+        translation_key="derived_cop",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:gauge",
+    ),
+)
+
+# Integrated from Power In(Total), Capacity Out(Total) and thermal power (see energy.py)
+ENERGY_SENSOR_DESCRIPTIONS: tuple[WarmLinkSensorEntityDescription, ...] = tuple(
+    WarmLinkSensorEntityDescription(
+        key=key,
+        translation_key=f"derived_{key}",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon=icon,
+    )
+    for key, icon in (
+        (ELECTRIC_ENERGY, "mdi:lightning-bolt"),
+        (HEAT_ENERGY, "mdi:fire"),
+        (THERMAL_ENERGY, "mdi:water-thermometer"),
+    )
+)
+
+# Defrost and compressor cycle counters (see cycles.py)
+CYCLE_SENSOR_DESCRIPTIONS: tuple[WarmLinkSensorEntityDescription, ...] = tuple(
+    WarmLinkSensorEntityDescription(
+        key=key,
+        translation_key=f"cycle_{key}",
+        native_unit_of_measurement=UnitOfTime.MINUTES if duration else None,
+        device_class=SensorDeviceClass.DURATION if duration else None,
+        state_class=state_class,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon=icon,
+    )
+    for key, duration, state_class, icon in (
+        (DEFROST_COUNT, False, SensorStateClass.TOTAL_INCREASING, "mdi:snowflake-melt"),
+        (DEFROSTS_TODAY, False, SensorStateClass.TOTAL_INCREASING, "mdi:snowflake-melt"),
+        (DEFROST_TIME_TODAY, True, SensorStateClass.TOTAL_INCREASING, "mdi:snowflake-melt"),
+        (LAST_DEFROST_DURATION, True, None, "mdi:timer-outline"),
+        (COMPRESSOR_STARTS, False, SensorStateClass.TOTAL_INCREASING, "mdi:engine"),
+        (COMPRESSOR_STARTS_TODAY, False, SensorStateClass.TOTAL_INCREASING, "mdi:engine"),
+        (COMPRESSOR_RUNTIME_TODAY, True, SensorStateClass.TOTAL_INCREASING, "mdi:engine"),
+        (LAST_COMPRESSOR_RUN, True, None, "mdi:timer-outline"),
+        (SHORT_CYCLES, False, SensorStateClass.TOTAL_INCREASING, "mdi:alert-circle-outline"),
+        (SHORT_CYCLES_TODAY, False, SensorStateClass.TOTAL_INCREASING, "mdi:alert-circle-outline"),
+    )
+)
+
+OFFLINE_SENSOR_DESCRIPTIONS: tuple[WarmLinkSensorEntityDescription, ...] = tuple(
+    WarmLinkSensorEntityDescription(
+        key=key,
+        translation_key=f"connection_{key}",
+        native_unit_of_measurement=None if key == RECONNECTS else UnitOfTime.MINUTES,
+        device_class=None if key == RECONNECTS else SensorDeviceClass.DURATION,
+        state_class=state_class,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon=icon,
+    )
+    for key, state_class, icon in (
+        (OFFLINE_DURATION, SensorStateClass.MEASUREMENT, "mdi:cloud-off-outline"),
+        (LAST_OFFLINE_DURATION, None, "mdi:timer-outline"),
+        (RECONNECTS, SensorStateClass.TOTAL_INCREASING, "mdi:cloud-refresh"),
+    )
+)
+
 # Operating mode mapping
 MODE_STATE_MAP = {
     "0": "Cooling",
@@ -503,58 +619,136 @@ async def async_setup_entry(
 ) -> None:
     """Set up Warmlink sensor entities."""
     data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: WarmLinkCoordinator = data["coordinator"]
+    coordinators: dict[str, WarmLinkCoordinator] = data["coordinators"]
     language = entry.data.get(CONF_LANGUAGE, "en")
+    category_classes = frozenset(entry.options.get(CONF_CATEGORY_CLASSES, {}).items())
     
-    entities = []
+    @callback
+    def _async_add_devices(device_codes: list[str]) -> None:
+        """Create entities for the given devices."""
+        entities = []
     
-    # Track which keys we've added from SENSOR_DESCRIPTIONS
-    added_keys = set()
+        descriptions = sensor_descriptions(category_classes)
+        dynamic_descriptions = dynamic_sensor_descriptions(category_classes)
     
-    for device_code, device_data in coordinator.data.items():
-        # Add predefined sensors with full descriptions
-        for description in SENSOR_DESCRIPTIONS:
-            added_keys.add(description.key)
+        for device_code in device_codes:
+            coordinator = coordinators[device_code]
+            # Add predefined sensors with full descriptions
+            for description in descriptions:
+                entities.append(
+                    WarmLinkSensor(
+                        coordinator=coordinator,
+                        device_code=device_code,
+                        description=description,
+                        language=language,
+                    )
+                )
+        
+            # Add dynamic sensors from ALL_SENSOR_PARAMS that aren't in SENSOR_DESCRIPTIONS
+            for description in dynamic_descriptions:
+                entities.append(
+                    WarmLinkDynamicSensor(
+                        coordinator=coordinator,
+                        device_code=device_code,
+                        description=description,
+                        language=language,
+                    )
+                )
+        
+            # Delta T, thermal power and COP computed locally
+            for description in DERIVED_SENSOR_DESCRIPTIONS:
+                entities.append(
+                    WarmLinkDerivedSensor(
+                        coordinator=coordinator,
+                        device_code=device_code,
+                        description=description,
+                    )
+                )
+            # kWh totals for the Energy dashboard
+            for description in ENERGY_SENSOR_DESCRIPTIONS:
+                entities.append(
+                    WarmLinkEnergySensor(
+                        coordinator=coordinator,
+                        device_code=device_code,
+                        description=description,
+                    )
+                )
+            # Defrost and compressor cycles
+            for description in CYCLE_SENSOR_DESCRIPTIONS:
+                entities.append(
+                    WarmLinkCycleSensor(
+                        coordinator=coordinator,
+                        device_code=device_code,
+                        description=description,
+                    )
+                )
+            # Offline periods and reconnects (available while offline)
+            for description in OFFLINE_SENSOR_DESCRIPTIONS:
+                entities.append(
+                    WarmLinkConnectionSensor(
+                        coordinator=coordinator,
+                        device_code=device_code,
+                        description=description,
+                    )
+                )
+
+            # Fault history synced from the cloud
             entities.append(
-                WarmLinkSensor(
+                WarmLinkFaultLogSensor(
                     coordinator=coordinator,
                     device_code=device_code,
-                    device_data=device_data,
-                    description=description,
                     language=language,
                 )
             )
-        
-        # Add dynamic sensors from ALL_SENSOR_PARAMS that aren't in SENSOR_DESCRIPTIONS
-        for code, param_info in ALL_SENSOR_PARAMS.items():
-            if code in added_keys:
-                continue  # Skip if already added with predefined description
-            
+            # Control command latency (click to cloud ack)
+            entities.append(
+                WarmLinkWriteLatencySensor(
+                    coordinator=coordinator,
+                    device_code=device_code,
+                    language=language,
+                )
+            )
+            # Share of poll chunks skipped as unchanged
             entities.append(
-                WarmLinkDynamicSensor(
+                WarmLinkPollCacheSensor(
                     coordinator=coordinator,
                     device_code=device_code,
-                    device_data=device_data,
-                    param_code=code,
-                    param_info=param_info,
                     language=language,
                 )
             )
+            # Rolling statistics of key values, one sensor per window
+            if coordinator.rolling is not None:
+                for length in coordinator.rolling.lengths:
+                    for code in ROLLING_CODES:
+                        entities.append(
+                            WarmLinkRollingSensor(
+                                coordinator=coordinator,
+                                device_code=device_code,
+                                code=code,
+                                length=length,
+                                language=language,
+                            )
+                        )
     
-    async_add_entities(entities)
+        async_add_entities(entities)
+
+    _async_add_devices(list(coordinators))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), _async_add_devices
+        )
+    )
 
 
-class WarmLinkSensor(CoordinatorEntity[WarmLinkCoordinator], SensorEntity):
+class WarmLinkSensor(WarmLinkEntity, SensorEntity):
     """Representation of a Warmlink sensor."""
 
-    _attr_has_entity_name = True
     entity_description: WarmLinkSensorEntityDescription
 
     def __init__(
         self,
         coordinator: WarmLinkCoordinator,
         device_code: str,
-        device_data: dict[str, Any],
         description: WarmLinkSensorEntityDescription,
         language: str = "en",
     ) -> None:
@@ -562,26 +756,10 @@ class WarmLinkSensor(CoordinatorEntity[WarmLinkCoordinator], SensorEntity):
         super().__init__(coordinator)
         
         self.entity_description = description
-        self._device_code = device_code
         self._language = language
-        
-        device_name = device_data.get("device_nick_name") or device_data.get("deviceNickName") or device_code
-        model = device_data.get("custModel") or device_data.get("productId") or "Heat Pump"
-        
+
         self._attr_unique_id = f"{DOMAIN}_{device_code}_{description.key}"
         self._attr_translation_key = description.translation_key
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_code)},
-            "name": device_name,
-            "manufacturer": "Phinx/Warmlink",
-            "model": model,
-        }
-
-    def _get_parsed_data(self) -> dict[str, Any]:
-        """Get parsed data from coordinator."""
-        device = self.coordinator.data.get(self._device_code, {})
-        return device.get("_parsed_data", {})
 
     @property
     def native_value(self) -> float | str | None:
@@ -620,142 +798,166 @@ class WarmLinkSensor(CoordinatorEntity[WarmLinkCoordinator], SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.data.get(self._device_code, {})
-        
-        # Check if device is online
-        if not is_device_online(device):
-            return False
-        
-        # Check if we have data for this sensor
-        data = device.get("_parsed_data", {})
-        return self.entity_description.key in data and super().available
+        # Online check is done by the base class
+        return self.entity_description.key in self._get_parsed_data() and super().available
+
+
+# Unit -> (HA unit, device class, state class, icon) for dynamic sensors
+UNIT_PROPERTIES: dict[str, tuple[str | None, SensorDeviceClass | None, SensorStateClass, str | None]] = {
+    "°C": (UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT, None),
+    "Hz": (UnitOfFrequency.HERTZ, None, SensorStateClass.MEASUREMENT, "mdi:sine-wave"),
+    "V": (UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE, SensorStateClass.MEASUREMENT, None),
+    "A": (UnitOfElectricCurrent.AMPERE, SensorDeviceClass.CURRENT, SensorStateClass.MEASUREMENT, None),
+    "kW": (UnitOfPower.KILO_WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None),
+    "kWh": (UnitOfEnergy.KILO_WATT_HOUR, SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, None),
+    "L/min": ("L/min", None, SensorStateClass.MEASUREMENT, "mdi:water-pump"),
+    "bar": ("bar", SensorDeviceClass.PRESSURE, SensorStateClass.MEASUREMENT, None),
+    "rpm": ("rpm", None, SensorStateClass.MEASUREMENT, "mdi:fan"),
+    "%": (PERCENTAGE, None, SensorStateClass.MEASUREMENT, None),
+    "min": ("min", None, SensorStateClass.MEASUREMENT, "mdi:timer-outline"),
+    "steps": ("steps", None, SensorStateClass.MEASUREMENT, "mdi:stairs"),
+}
+
+# Icons of unitless dynamic sensors by category
+CATEGORY_ICONS: dict[str, str] = {
+    "temperatures": "mdi:thermometer",
+    "compressor": "mdi:engine",
+    "fan": "mdi:fan",
+    "pump": "mdi:water-pump",
+    "defrost": "mdi:snowflake",
+    "zones": "mdi:home-thermometer",
+}
+
+
+def _classified_description(
+    description: WarmLinkSensorEntityDescription,
+    category_classes: Mapping[str, str],
+) -> WarmLinkSensorEntityDescription:
+    """Apply the classification of its Modbus CSV parameter to a description.
+
+    Codes outside the Modbus table keep the description as written.
+    """
+    param_info = ALL_SENSOR_PARAMS.get(description.key)
+    if param_info is None:
+        return description
+    classification = classify(
+        description.key, param_info.get("category", "other"), False, category_classes
+    )
+    return replace(
+        description,
+        state_class=description.state_class if classification.statistics else None,
+        entity_category=(
+            EntityCategory(classification.entity_category)
+            if classification.entity_category
+            else None
+        ),
+        entity_registry_enabled_default=classification.enabled_default,
+    )
+
+
+@cache
+def sensor_descriptions(
+    category_classes: frozenset[tuple[str, str]] = frozenset(),
+) -> tuple[WarmLinkSensorEntityDescription, ...]:
+    """Return SENSOR_DESCRIPTIONS classified like the dynamic sensors.
+
+    Built once per set of category overrides (category, class).
+    """
+    overrides = dict(category_classes)
+    return tuple(
+        _classified_description(description, overrides)
+        for description in SENSOR_DESCRIPTIONS
+    )
 
 
-class WarmLinkDynamicSensor(CoordinatorEntity[WarmLinkCoordinator], SensorEntity):
+def _dynamic_description(
+    code: str,
+    param_info: Mapping[str, Any],
+    category_classes: Mapping[str, str],
+) -> WarmLinkSensorEntityDescription:
+    """Build the description of a sensor from its Modbus CSV parameter."""
+    unit = param_info.get("unit", "")
+    if param_info.get("data_type") == "TEMP":
+        unit = "°C"
+    properties = UNIT_PROPERTIES.get(unit)
+    if properties is None:
+        # Default for unknown units
+        properties = (
+            None,
+            None,
+            SensorStateClass.MEASUREMENT,
+            CATEGORY_ICONS.get(param_info.get("category", "")),
+        )
+    native_unit, device_class, state_class, icon = properties
+    # Static values are not recorded as statistics or enabled by default
+    classification = classify(
+        code, param_info.get("category", "other"), False, category_classes
+    )
+    return WarmLinkSensorEntityDescription(
+        key=code,
+        # Name with code prefix: "(T01) Inlet Water Temp"
+        name=f"({code}) {param_info.get('name', code)}",
+        native_unit_of_measurement=native_unit,
+        device_class=device_class,
+        state_class=state_class if classification.statistics else None,
+        icon=icon,
+        entity_category=(
+            EntityCategory(classification.entity_category)
+            if classification.entity_category
+            else None
+        ),
+        entity_registry_enabled_default=classification.enabled_default,
+    )
+
+
+@cache
+def dynamic_sensor_descriptions(
+    category_classes: frozenset[tuple[str, str]] = frozenset(),
+) -> tuple[WarmLinkSensorEntityDescription, ...]:
+    """Return descriptions of ALL_SENSOR_PARAMS without a SENSOR_DESCRIPTIONS entry.
+
+    Built once per set of category overrides (category, class) on first use
+    and shared by the sensors of all devices.
+    """
+    described = {description.key for description in SENSOR_DESCRIPTIONS}
+    overrides = dict(category_classes)
+    return tuple(
+        _dynamic_description(code, param_info, overrides)
+        for code, param_info in ALL_SENSOR_PARAMS.items()
+        if code not in described
+    )
+
+
+class WarmLinkDynamicSensor(WarmLinkEntity, SensorEntity):
     """Dynamic sensor created from ALL_SENSOR_PARAMS (Modbus CSV).
     
     Creates sensors for all parameters from modbus_params.py that don't have
-    explicit SENSOR_DESCRIPTIONS entries.
+    explicit SENSOR_DESCRIPTIONS entries. Name, unit, device class and icon
+    come from the shared description (see dynamic_sensor_descriptions).
     """
 
-    _attr_has_entity_name = True
+    entity_description: WarmLinkSensorEntityDescription
 
     def __init__(
         self,
         coordinator: WarmLinkCoordinator,
         device_code: str,
-        device_data: dict[str, Any],
-        param_code: str,
-        param_info: dict[str, Any],
+        description: WarmLinkSensorEntityDescription,
         language: str = "en",
     ) -> None:
         """Initialize the dynamic sensor."""
         super().__init__(coordinator)
         
-        self._device_code = device_code
-        self._param_code = param_code
-        self._param_info = param_info
+        self.entity_description = description
         self._language = language
-        
-        device_name = device_data.get("device_nick_name") or device_data.get("deviceNickName") or device_code
-        model = device_data.get("custModel") or device_data.get("productId") or "Heat Pump"
-        
-        self._attr_unique_id = f"{DOMAIN}_{device_code}_{param_code}"
-        
-        # Create name with code prefix: "(T01) Inlet Water Temp"
-        param_name = param_info.get("name", param_code)
-        self._attr_name = f"({param_code}) {param_name}"
-        
-        # Determine device class and unit from param_info
-        unit = param_info.get("unit", "")
-        data_type = param_info.get("data_type", "")
-        category = param_info.get("category", "")
-        
-        self._setup_sensor_properties(unit, data_type, category)
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_code)},
-            "name": device_name,
-            "manufacturer": "Phinx/Warmlink",
-            "model": model,
-        }
 
-    def _setup_sensor_properties(self, unit: str, data_type: str, category: str) -> None:
-        """Set up sensor properties based on param info."""
-        # Map units to HA units and device classes
-        if unit == "°C" or data_type == "TEMP":
-            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-            self._attr_device_class = SensorDeviceClass.TEMPERATURE
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif unit == "Hz":
-            self._attr_native_unit_of_measurement = UnitOfFrequency.HERTZ
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-            self._attr_icon = "mdi:sine-wave"
-        elif unit == "V":
-            self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-            self._attr_device_class = SensorDeviceClass.VOLTAGE
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif unit == "A":
-            self._attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-            self._attr_device_class = SensorDeviceClass.CURRENT
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif unit == "kW":
-            self._attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
-            self._attr_device_class = SensorDeviceClass.POWER
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif unit == "kWh":
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        elif unit == "L/min":
-            self._attr_native_unit_of_measurement = "L/min"
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-            self._attr_icon = "mdi:water-pump"
-        elif unit == "bar":
-            self._attr_native_unit_of_measurement = "bar"
-            self._attr_device_class = SensorDeviceClass.PRESSURE
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif unit == "rpm":
-            self._attr_native_unit_of_measurement = "rpm"
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-            self._attr_icon = "mdi:fan"
-        elif unit == "%":
-            self._attr_native_unit_of_measurement = PERCENTAGE
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif unit == "min":
-            self._attr_native_unit_of_measurement = "min"
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-            self._attr_icon = "mdi:timer-outline"
-        elif unit == "steps":
-            self._attr_native_unit_of_measurement = "steps"
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-            self._attr_icon = "mdi:stairs"
-        else:
-            # Default for unknown units
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-            if category == "temperatures":
-                self._attr_icon = "mdi:thermometer"
-            elif category == "compressor":
-                self._attr_icon = "mdi:engine"
-            elif category == "fan":
-                self._attr_icon = "mdi:fan"
-            elif category == "pump":
-                self._attr_icon = "mdi:water-pump"
-            elif category == "defrost":
-                self._attr_icon = "mdi:snowflake"
-            elif category == "zones":
-                self._attr_icon = "mdi:home-thermometer"
-
-    def _get_parsed_data(self) -> dict[str, Any]:
-        """Get parsed data from coordinator."""
-        device = self.coordinator.data.get(self._device_code, {})
-        return device.get("_parsed_data", {})
+        self._attr_unique_id = f"{DOMAIN}_{device_code}_{description.key}"
 
     @property
     def native_value(self) -> float | str | None:
         """Return the sensor value."""
         data = self._get_parsed_data()
-        value = data.get(self._param_code)
+        value = data.get(self.entity_description.key)
         
         if value is None:
             return None
@@ -773,12 +975,302 @@ class WarmLinkDynamicSensor(CoordinatorEntity[WarmLinkCoordinator], SensorEntity
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.data.get(self._device_code, {})
-        
-        # Check if device is online
-        if not is_device_online(device):
-            return False
-        
-        # Check if we have data for this sensor
-        data = device.get("_parsed_data", {})
-        return self._param_code in data and super().available
+        # Online check is done by the base class
+        return self.entity_description.key in self._get_parsed_data() and super().available
+
+
+class WarmLinkDerivedSensor(WarmLinkEntity, SensorEntity):
+    """Metric derived locally from other parameters (see derived.py)."""
+
+    entity_description: WarmLinkSensorEntityDescription
+    # Snapshot entry holding the values
+    _source = "_derived"
+
+    def __init__(
+        self,
+        coordinator: WarmLinkCoordinator,
+        device_code: str,
+        description: WarmLinkSensorEntityDescription,
+    ) -> None:
+        """Initialize the derived sensor."""
+        super().__init__(coordinator)
+
+        self.entity_description = description
+
+        self._attr_unique_id = f"{DOMAIN}_{device_code}_derived_{description.key}"
+        self._attr_translation_key = description.translation_key
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the derived value."""
+        return self._device.get(self._source, {}).get(self.entity_description.key)
+
+
+class WarmLinkEnergySensor(WarmLinkDerivedSensor):
+    """Energy total integrated from a power value (see energy.py).
+
+    Totals grow on every poll while the unit runs, so they are not part of
+    the snapshot; the coordinator signals their changes to these sensors.
+    """
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to total updates of the device."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_TOTALS_UPDATED.format(self.coordinator.device_code),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the energy total."""
+        return self.coordinator.energy.values.get(self.entity_description.key)
+
+
+class WarmLinkCycleSensor(WarmLinkDerivedSensor):
+    """Defrost or compressor cycle counter (see cycles.py)."""
+
+    _source = "_cycles"
+
+
+class WarmLinkConnectionSensor(WarmLinkDerivedSensor):
+    """Offline duration or reconnect count (see offline.py)."""
+
+    _source = "_offline"
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last update succeeded, also while offline."""
+        return self.coordinator.last_update_success
+
+
+FAULT_LOG_NAMES = {
+    "en": "(Fault) Last Fault",
+    "pl": "(Fault) Ostatnia awaria",
+}
+
+# Records listed in the attributes of the fault log sensor
+FAULT_LOG_ATTRIBUTE_RECORDS = 10
+
+
+class WarmLinkFaultLogSensor(WarmLinkEntity, SensorEntity):
+    """Code of the newest fault history record, recent records as attributes."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:alert-octagon-outline"
+    # The record list is only useful live, not in the recorder
+    _unrecorded_attributes = frozenset({"faults"})
+
+    def __init__(
+        self,
+        coordinator: WarmLinkCoordinator,
+        device_code: str,
+        language: str = "en",
+    ) -> None:
+        """Initialize the fault log sensor."""
+        super().__init__(coordinator)
+
+        self._attr_unique_id = f"{DOMAIN}_{device_code}_fault_log"
+        self._attr_name = FAULT_LOG_NAMES.get(language, FAULT_LOG_NAMES["en"])
+
+    def _records(self) -> tuple[Mapping[str, Any], ...]:
+        """Return the fault records, newest first."""
+        return self._device.get("_faults", ())
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the code of the newest fault."""
+        records = self._records()
+        return records[0]["code"] if records else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the newest fault and the recent records."""
+        records = self._records()
+        if not records:
+            return {"faults": []}
+        return {
+            "time": records[0]["time"],
+            "description": records[0]["description"],
+            "recovered": records[0]["recovered"],
+            "faults": [dict(record) for record in records[:FAULT_LOG_ATTRIBUTE_RECORDS]],
+        }
+
+
+WRITE_LATENCY_NAMES = {
+    "en": "(API) Write Latency",
+    "pl": "(API) Opóźnienie zapisu",
+}
+
+
+class WarmLinkWriteLatencySensor(WarmLinkEntity, SensorEntity):
+    """End-to-end latency of the last control command (call to cloud ack)."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(
+        self,
+        coordinator: WarmLinkCoordinator,
+        device_code: str,
+        language: str = "en",
+    ) -> None:
+        """Initialize the latency sensor."""
+        super().__init__(coordinator)
+
+        self._attr_unique_id = f"{DOMAIN}_{device_code}_write_latency"
+        self._attr_name = WRITE_LATENCY_NAMES.get(language, WRITE_LATENCY_NAMES["en"])
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the last write latency in milliseconds."""
+        stats = self.coordinator.api.get_write_latency(self._device_code)
+        if stats is None or stats.last is None:
+            return None
+        return round(stats.last * 1000)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return aggregate latency statistics."""
+        stats = self.coordinator.api.get_write_latency(self._device_code)
+        if stats is None or not stats.count:
+            return {"writes": 0}
+        return {
+            "writes": stats.count,
+            "average_ms": round(stats.average * 1000),
+            "max_ms": round(stats.maximum * 1000),
+            "queued_requests": self.coordinator.api.scheduler.pending,
+        }
+
+
+POLL_CACHE_NAMES = {
+    "en": "(API) Unchanged Poll Chunks",
+    "pl": "(API) Niezmienione paczki odczytu",
+}
+
+
+class WarmLinkPollCacheSensor(WarmLinkEntity, SensorEntity):
+    """Share of getDataByCode chunks skipped because their body was unchanged."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_icon = "mdi:cached"
+
+    def __init__(
+        self,
+        coordinator: WarmLinkCoordinator,
+        device_code: str,
+        language: str = "en",
+    ) -> None:
+        """Initialize the poll cache sensor."""
+        super().__init__(coordinator)
+
+        self._attr_unique_id = f"{DOMAIN}_{device_code}_poll_cache"
+        self._attr_name = POLL_CACHE_NAMES.get(language, POLL_CACHE_NAMES["en"])
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the chunk hit ratio in percent."""
+        stats = self.coordinator.api.get_chunk_stats(self._device_code)
+        if stats is None or stats.hit_ratio is None:
+            return None
+        return round(stats.hit_ratio * 100, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return raw hit/miss counters and change probe counters."""
+        stats = self.coordinator.api.get_chunk_stats(self._device_code)
+        attributes = (
+            {"hits": 0, "misses": 0}
+            if stats is None
+            else {"hits": stats.hits, "misses": stats.misses}
+        )
+        if (probe := self.coordinator.probe) is not None:
+            attributes["probe_skipped"] = probe.skipped
+            attributes["probe_fetched"] = probe.fetched
+        return attributes
+
+
+ROLLING_NAMES = {
+    "en": "({code}) {name} - Mean {minutes} min",
+    "pl": "({code}) {name} - średnia {minutes} min",
+}
+
+# Units and device classes of the rolling statistics codes
+_DESCRIBED: dict[str, WarmLinkSensorEntityDescription] = {
+    description.key: description for description in SENSOR_DESCRIPTIONS
+}
+
+
+class WarmLinkRollingSensor(WarmLinkEntity, SensorEntity):
+    """Rolling mean of a value, min/max/stddev as attributes (see rolling.py).
+
+    Samples are added on every full fetch without changing the snapshot, so
+    the coordinator signals them; the sensor is refreshed also while its
+    code's value is stable or held by the deadband filter.
+    """
+
+    # Statistics of statistics are not useful; attributes are live only
+    _unrecorded_attributes = frozenset(SUMMARY_KEYS)
+    _attr_icon = "mdi:chart-bell-curve"
+
+    def __init__(
+        self,
+        coordinator: WarmLinkCoordinator,
+        device_code: str,
+        code: str,
+        length: float,
+        language: str = "en",
+    ) -> None:
+        """Initialize the rolling statistics sensor of code and window length."""
+        super().__init__(coordinator)
+
+        self._code = code
+        self._length = length
+        minutes = round(length / 60)
+        self._attr_unique_id = f"{DOMAIN}_{device_code}_rolling_{code}_{minutes}"
+        template = ROLLING_NAMES.get(language, ROLLING_NAMES["en"])
+        self._attr_name = template.format(
+            code=code,
+            name=ALL_SENSOR_PARAMS.get(code, {}).get("name", code),
+            minutes=minutes,
+        )
+        if (description := _DESCRIBED.get(code)) is not None:
+            self._attr_native_unit_of_measurement = (
+                description.native_unit_of_measurement
+            )
+            self._attr_device_class = description.device_class
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to new samples of the device."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_ROLLING_UPDATED.format(self._device_code),
+                self.async_write_ha_state,
+            )
+        )
+
+    def _summary(self) -> dict[str, float] | None:
+        """Return the statistics of the window."""
+        rolling = self.coordinator.rolling
+        return None if rolling is None else rolling.summary(self._code, self._length)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean of the window."""
+        summary = self._summary()
+        return None if summary is None else summary["mean"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float] | None:
+        """Return min, max, mean, standard deviation and sample count."""
+        return self._summary()
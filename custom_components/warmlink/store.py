@@ -0,0 +1,359 @@
+"""Compact per-device value store for Warmlink data points.
+
+A full poll returns up to 550 protocol codes per device. Instead of keeping a
+dict of small dicts per code, every device owns one DeviceValueStore: a fixed
+code -> index table shared by all stores (built from ALL_PROTOCOL_CODES),
+a float array for values and a validity bitmap marking which slots hold
+data. Non-numeric values and codes outside the table go to a small overflow
+dict.
+
+Entities only see read-only Mapping views, so they can keep using
+``data.get("T01")`` / ``"T01" in data`` as before. Snapshots carry a
+frozen() copy, so later polls and local overrides never change values a
+published snapshot already shows.
+
+Raw getDataByCode bodies are loaded per chunk. Each loaded chunk is
+fingerprinted (blake2b of the raw body); a poll starts from a copy of the
+previous store, so a chunk whose body did not change is skipped without
+decoding it. Loading misses can run in an executor on a store that is not
+yet visible to entities (load_data_responses).
+
+The rangeStart/rangeEnd limits reported with every data point rarely
+change, so they are only parsed on range refresh polls (for writable
+parameters only) and kept in an immutable per-device RangeCache.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from array import array
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Final
+
+from .const import ALL_PROTOCOL_CODES, ALL_WRITABLE_PARAMS, DATA_CHUNK_SIZE
+
+try:
+    # Several times faster than json on large bodies; shipped with Home Assistant
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+# Slot of each known protocol code in the value arrays
+CODE_INDEX: Final[dict[str, int]] = {
+    code: index for index, code in enumerate(ALL_PROTOCOL_CODES)
+}
+CODES: Final[tuple[str, ...]] = tuple(ALL_PROTOCOL_CODES)
+# Only limits of writable parameters are used (number entities, validation)
+RANGE_CODES: Final[frozenset[str]] = frozenset(ALL_WRITABLE_PARAMS)
+
+_SLOTS = len(CODES)
+_BITMAP_SIZE = (_SLOTS + 7) // 8
+
+# Sentinel for lookups where None is a valid value
+_MISSING: Final = object()
+
+
+def _fingerprint(body: bytes) -> bytes:
+    """Return fingerprint of a raw response body."""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+def _to_float(value: Any) -> float | None:
+    """Return value as float or None if it is not numeric."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _add_range(
+    ranges: dict[str, tuple[float, float]], code: str, range_start: Any, range_end: Any
+) -> None:
+    """Add a range given as cloud strings, ignoring empty or invalid ones."""
+    if not (range_start and range_end) or code not in RANGE_CODES:
+        return
+    range_min = _to_float(range_start)
+    range_max = _to_float(range_end)
+    if range_min is not None and range_max is not None and range_min < range_max:
+        ranges[code] = (range_min, range_max)
+
+
+class DeviceValueStore:
+    """Values of one device, indexed by protocol code."""
+
+    __slots__ = ("_values", "_valid", "_extra", "_fingerprints", "_values_view")
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._values = array("d", bytes(8 * _SLOTS))
+        self._valid = bytearray(_BITMAP_SIZE)
+        # Non-numeric values and codes missing from CODE_INDEX
+        self._extra: dict[str, Any] = {}
+        # Chunk key -> (body fingerprint, values stored from it)
+        self._fingerprints: dict[int, tuple[bytes, int]] = {}
+        # View is reused so unchanged snapshots compare by identity
+        self._values_view = StoreValues(self)
+
+    @property
+    def values(self) -> StoreValues:
+        """Return read-only mapping of code -> value."""
+        return self._values_view
+
+    def clear(self) -> None:
+        """Mark all slots as empty."""
+        self._valid[:] = bytes(_BITMAP_SIZE)
+        self._extra.clear()
+        self._fingerprints.clear()
+
+    def copy_from(self, other: DeviceValueStore) -> None:
+        """Replace content (including chunk fingerprints) with another store's."""
+        self._values[:] = other._values
+        self._valid[:] = other._valid
+        self._extra = dict(other._extra)
+        self._fingerprints = dict(other._fingerprints)
+
+    def frozen(self) -> StoreValues:
+        """Return a view of a copy that later changes of this store miss."""
+        copy = DeviceValueStore()
+        copy.copy_from(self)
+        return copy.values
+
+    def discard(self, codes: list[str]) -> None:
+        """Remove values of the given codes."""
+        for code in codes:
+            self._extra.pop(code, None)
+            index = CODE_INDEX.get(code)
+            if index is not None:
+                self._valid[index >> 3] &= ~(1 << (index & 7))
+
+    def get(self, code: str, default: Any = None) -> Any:
+        """Return value of a code."""
+        index = CODE_INDEX.get(code)
+        if index is not None and self._valid[index >> 3] & (1 << (index & 7)):
+            return self._values[index]
+        return self._extra.get(code, default)
+
+    def set(self, code: str, value: Any) -> None:
+        """Store a value, as float when it is numeric."""
+        index = CODE_INDEX.get(code)
+        float_value = _to_float(value)
+        if index is None or float_value is None:
+            self._extra[code] = value if float_value is None else float_value
+            if index is not None:
+                self._valid[index >> 3] &= ~(1 << (index & 7))
+            return
+        self._values[index] = float_value
+        self._valid[index >> 3] |= 1 << (index & 7)
+        self._extra.pop(code, None)
+
+    def override(self, code: str, value: Any) -> None:
+        """Set a value locally (e.g. optimistic update after a write).
+
+        Drops the chunk fingerprints, so the next poll parses every chunk
+        again instead of keeping the local value for an unchanged body.
+        """
+        self.set(code, value)
+        self._fingerprints.clear()
+
+    def hold(self, code: str, value: Any) -> None:
+        """Keep a previously reported value in place of the polled one.
+
+        Drops the fingerprint of the code's chunk (chunk keys are offsets
+        into ALL_PROTOCOL_CODES), so the next poll parses that chunk again
+        and the held value is checked again even if the body is unchanged.
+        """
+        self.set(code, value)
+        index = CODE_INDEX.get(code)
+        if index is None:
+            self._fingerprints.clear()
+        else:
+            self._fingerprints.pop(index // DATA_CHUNK_SIZE * DATA_CHUNK_SIZE, None)
+
+    def match_chunk(self, key: int, body: bytes) -> int | None:
+        """Return values stored from a chunk if its body is unchanged."""
+        previous = self._fingerprints.get(key)
+        if previous is not None and previous[0] == _fingerprint(body):
+            return previous[1]
+        return None
+
+    def load_chunk(
+        self,
+        key: int,
+        codes: list[str],
+        body: bytes,
+        device_code: str,
+        ranges: dict[str, tuple[float, float]] | None = None,
+    ) -> int:
+        """Replace the values of a chunk with a raw getDataByCode body.
+
+        Ranges are collected into the given dict, if any. Returns the number
+        of values stored.
+        """
+        self.discard(codes)
+        self._fingerprints.pop(key, None)
+        response = json_loads(body)
+        if response.get("error_msg") != "Success":
+            _LOGGER.warning(
+                "getDataByCode chunk %d for %s returned: %s",
+                key, device_code, response.get("error_msg"),
+            )
+            return 0
+        stored = self.update_from_items(response.get("objectResult") or [], ranges)
+        self._fingerprints[key] = (_fingerprint(body), stored)
+        return stored
+
+    def update_from_data(
+        self,
+        data: Mapping[str, Mapping[str, Any]],
+        ranges: dict[str, tuple[float, float]] | None = None,
+    ) -> None:
+        """Load a getDataByCode result, replacing previous content.
+
+        Expects ``{code: {"value": ..., "range_start": ..., "range_end": ...}}``.
+        Ranges are collected into the given dict, if any.
+        """
+        self.clear()
+        for code, code_data in data.items():
+            value = code_data.get("value")
+            if value is not None:
+                self.set(code, value)
+            if ranges is not None:
+                _add_range(ranges, code, code_data.get("range_start"), code_data.get("range_end"))
+
+    def update_from_items(
+        self,
+        items: list[dict[str, Any]],
+        ranges: dict[str, tuple[float, float]] | None = None,
+    ) -> int:
+        """Add raw getDataByCode items to the store.
+
+        Expects ``[{"code": ..., "value": ..., "rangeStart": ..., "rangeEnd": ...}]``
+        and returns the number of values stored. Ranges are collected into
+        the given dict, if any.
+        """
+        stored = 0
+        for item in items:
+            code = item.get("code")
+            value = item.get("value")
+            if not code or value is None:
+                continue
+            self.set(code, value)
+            stored += 1
+            if ranges is not None:
+                _add_range(ranges, code, item.get("rangeStart"), item.get("rangeEnd"))
+        return stored
+
+    def codes(self) -> Iterator[str]:
+        """Iterate codes that hold a value."""
+        valid = self._valid
+        for index, code in enumerate(CODES):
+            if valid[index >> 3] & (1 << (index & 7)):
+                yield code
+        yield from self._extra
+
+    def __len__(self) -> int:
+        """Return number of codes holding a value."""
+        return sum(bin(byte).count("1") for byte in self._valid) + len(self._extra)
+
+
+def load_data_responses(
+    store: DeviceValueStore,
+    chunks: list[tuple[int, list[str], bytes]],
+    device_code: str,
+    ranges: dict[str, tuple[float, float]] | None = None,
+) -> int:
+    """Load raw getDataByCode bodies given as (key, codes, body) into a store.
+
+    Runs without touching the event loop, so it can be used with
+    run_in_executor for large polls. Returns the number of values stored.
+    """
+    return sum(
+        store.load_chunk(key, codes, body, device_code, ranges)
+        for key, codes, body in chunks
+    )
+
+
+class RangeCache:
+    """Immutable snapshot of the cloud-reported limits of one device.
+
+    Maps code -> (min, max). The mapping is replaced as a whole (never
+    mutated), and only when a refresh returns different ranges.
+    """
+
+    def __init__(self, max_age: float) -> None:
+        """Initialize the cache; ranges older than max_age need a refresh."""
+        self._max_age = max_age
+        self._ranges: Mapping[str, tuple[float, float]] = MappingProxyType({})
+        self._updated: float | None = None
+
+    @property
+    def ranges(self) -> Mapping[str, tuple[float, float]]:
+        """Return read-only mapping of code -> (min, max)."""
+        return self._ranges
+
+    @property
+    def needs_refresh(self) -> bool:
+        """Return True if the ranges are missing, too old or invalidated."""
+        return (
+            self._updated is None
+            or time.monotonic() - self._updated >= self._max_age
+        )
+
+    def invalidate(self) -> None:
+        """Request a refresh on the next poll (e.g. after a limit was written)."""
+        self._updated = None
+
+    def update(self, ranges: dict[str, tuple[float, float]]) -> bool:
+        """Store refreshed ranges and return True if they changed."""
+        self._updated = time.monotonic()
+        if ranges == self._ranges:
+            return False
+        self._ranges = MappingProxyType(ranges)
+        return True
+
+
+@dataclass
+class ChunkCacheStats:
+    """Fingerprint hits/misses of getDataByCode chunks."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Return share of chunks skipped as unchanged."""
+        total = self.hits + self.misses
+        if not total:
+            return None
+        return self.hits / total
+
+
+class StoreValues(Mapping[str, Any]):
+    """Read-only code -> value view of a DeviceValueStore."""
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: DeviceValueStore) -> None:
+        """Initialize the view."""
+        self._store = store
+
+    def __getitem__(self, code: str) -> Any:
+        value = self._store.get(code, _MISSING)
+        if value is _MISSING:
+            raise KeyError(code)
+        return value
+
+    def __contains__(self, code: object) -> bool:
+        return isinstance(code, str) and self._store.get(code, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        return self._store.codes()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
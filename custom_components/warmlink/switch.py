@@ -6,16 +6,23 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import is_device_online
-from .const import DOMAIN, CONF_LANGUAGE, ALL_SWITCH_PARAMS
+from .const import (
+    DOMAIN,
+    CONF_CATEGORY_CLASSES,
+    CONF_LANGUAGE,
+    ALL_SWITCH_PARAMS,
+    SIGNAL_DEVICES_ADDED,
+)
 
 # Use ALL_SWITCH_PARAMS from modbus_params.py (46+ parameters)
 SWITCH_PARAMS = ALL_SWITCH_PARAMS
+from .classification import EntityClassification, classify
 from .coordinator import WarmLinkCoordinator
+from .entity import WarmLinkEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -178,66 +185,72 @@ async def async_setup_entry(
 ) -> None:
     """Set up Warmlink switch entities."""
     data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: WarmLinkCoordinator = data["coordinator"]
-    api = data["api"]
+    coordinators: dict[str, WarmLinkCoordinator] = data["coordinators"]
     language = entry.data.get(CONF_LANGUAGE, "en")
-
-    entities = []
-    for device_code, device_data in coordinator.data.items():
-        parsed_data = device_data.get("_parsed_data", {})
+    category_classes = entry.options.get(CONF_CATEGORY_CLASSES, {})
+
+    @callback
+    def _async_add_devices(device_codes: list[str]) -> None:
+        """Create entities for the given devices."""
+        entities = []
+        for device_code in device_codes:
+            coordinator = coordinators[device_code]
+            device_data = coordinator.data
+            parsed_data = device_data.get("_parsed_data", {})
         
-        for param_code, param_info in SWITCH_PARAMS.items():
-            # Power switch is always available
-            # Others only if device has this parameter
-            if param_code == "Power" or param_code in parsed_data:
-                entities.append(
-                    WarmLinkSwitch(
-                        coordinator=coordinator,
-                        api=api,
-                        device_code=device_code,
-                        device_data=device_data,
-                        param_code=param_code,
-                        param_info=param_info,
-                        language=language,
+            for param_code, param_info in SWITCH_PARAMS.items():
+                # Power switch is always available
+                # Others only if device has this parameter
+                if param_code == "Power" or param_code in parsed_data:
+                    entities.append(
+                        WarmLinkSwitch(
+                            coordinator=coordinator,
+                            device_code=device_code,
+                            param_code=param_code,
+                            param_info=param_info,
+                            language=language,
+                            classification=classify(
+                                param_code,
+                                param_info.get("category", "other"),
+                                True,
+                                category_classes,
+                            ),
+                        )
                     )
-                )
 
-    _LOGGER.info("Setting up %d switch entities for Warmlink", len(entities))
-    async_add_entities(entities)
+        _LOGGER.info("Setting up %d switch entities for Warmlink", len(entities))
+        async_add_entities(entities)
+
+    _async_add_devices(list(coordinators))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), _async_add_devices
+        )
+    )
 
 
-class WarmLinkSwitch(CoordinatorEntity[WarmLinkCoordinator], SwitchEntity):
+class WarmLinkSwitch(WarmLinkEntity, SwitchEntity):
     """Representation of a Warmlink switch entity."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: WarmLinkCoordinator,
-        api,
         device_code: str,
-        device_data: dict[str, Any],
         param_code: str,
         param_info: dict[str, Any],
         language: str = "en",
+        classification: EntityClassification | None = None,
     ) -> None:
         """Initialize the switch entity."""
         super().__init__(coordinator)
 
-        self._api = api
-        self._device_code = device_code
         self._param_code = param_code
         self._param_info = param_info
         self._language = language
 
-        device_name = (
-            device_data.get("device_nick_name")
-            or device_data.get("deviceNickName")
-            or device_code
-        )
-        model = device_data.get("custModel") or device_data.get("productId") or "Heat Pump"
-
         self._attr_unique_id = f"{DOMAIN}_{device_code}_{param_code}_switch"
+        if classification is not None:
+            self._apply_classification(classification)
 
         # Get translated name
         translations = SWITCH_TRANSLATIONS.get(language, SWITCH_TRANSLATIONS["en"])
@@ -249,17 +262,10 @@ class WarmLinkSwitch(CoordinatorEntity[WarmLinkCoordinator], SwitchEntity):
         if param_code == "Power":
             self._attr_device_class = SwitchDeviceClass.SWITCH
 
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_code)},
-            "name": device_name,
-            "manufacturer": "Phinx/Warmlink",
-            "model": model,
-        }
-
     @property
     def is_on(self) -> bool | None:
         """Return true if switch is on."""
-        device = self.coordinator.data.get(self._device_code, {})
+        device = self._device
         parsed_data = device.get("_parsed_data", {})
         value = parsed_data.get(self._param_code)
 
@@ -273,11 +279,10 @@ class WarmLinkSwitch(CoordinatorEntity[WarmLinkCoordinator], SwitchEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device = self.coordinator.data.get(self._device_code, {})
         # Power switch available even when offline (to turn on)
         if self._param_code == "Power":
-            return super().available
-        return is_device_online(device) and super().available
+            return super(WarmLinkEntity, self).available
+        return super().available
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -287,23 +292,7 @@ class WarmLinkSwitch(CoordinatorEntity[WarmLinkCoordinator], SwitchEntity):
             self._device_code,
         )
 
-        if self._param_code == "Power":
-            success = await self._api.set_power(self._device_code, True)
-        else:
-            success = await self._api._control_device(
-                self._device_code, self._param_code, "1"
-            )
-
-        if success:
-            # Optimistically update the value
-            device = self.coordinator.data.get(self._device_code, {})
-            parsed_data = device.get("_parsed_data", {})
-            parsed_data[self._param_code] = 1
-            self.async_write_ha_state()
-
-            # Request a refresh
-            await self.coordinator.async_request_refresh()
-        else:
+        if not await self._async_write(self._param_code, 1):
             _LOGGER.error("Failed to turn on %s", self._param_code)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -314,21 +303,5 @@ class WarmLinkSwitch(CoordinatorEntity[WarmLinkCoordinator], SwitchEntity):
             self._device_code,
         )
 
-        if self._param_code == "Power":
-            success = await self._api.set_power(self._device_code, False)
-        else:
-            success = await self._api._control_device(
-                self._device_code, self._param_code, "0"
-            )
-
-        if success:
-            # Optimistically update the value
-            device = self.coordinator.data.get(self._device_code, {})
-            parsed_data = device.get("_parsed_data", {})
-            parsed_data[self._param_code] = 0
-            self.async_write_ha_state()
-
-            # Request a refresh
-            await self.coordinator.async_request_refresh()
-        else:
+        if not await self._async_write(self._param_code, 0):
             _LOGGER.error("Failed to turn off %s", self._param_code)
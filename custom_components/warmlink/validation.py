@@ -0,0 +1,126 @@
+"""Local validation of writes to Warmlink parameters.
+
+app/device/control accepts any value and the cloud only rejects invalid
+ones after a full round trip. Writes are checked here first, against the
+parameter tables (data type, step, select options) and the current limits
+of the device, and rejected with WarmLinkValidationError.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Final
+
+from .api import WarmLinkValidationError
+from .const import (
+    ALL_PARAMS,
+    ALL_SELECT_PARAMS,
+    ALL_SWITCH_PARAMS,
+    ALL_WRITABLE_PARAMS,
+    SELECT_PARAMS,
+)
+
+WRITABLE_CODES: Final[frozenset[str]] = frozenset(
+    {*ALL_WRITABLE_PARAMS, *ALL_SWITCH_PARAMS, *ALL_SELECT_PARAMS}
+)
+
+# Accepted values of select parameters with known options
+ENUM_OPTIONS: Final[dict[str, frozenset[int]]] = {
+    code: frozenset(int(option) for option in info["options"])
+    for code, info in SELECT_PARAMS.items()
+    if info.get("options")
+}
+
+# Limits of number parameters the Modbus table gives none for; the number
+# entity offers this range, so service calls get the same
+NUMBER_FALLBACK_LIMITS: Final = (0.0, 100.0)
+
+# Data types that only take whole numbers
+_DISCRETE_TYPES = ("ENUM", "BINARY")
+
+# Float parameters have no fixed resolution
+_FREE_TYPES = ("Float",)
+
+_TOLERANCE = 1e-6
+
+
+def static_limits(code: str) -> tuple[float | None, float | None]:
+    """Return the (min, max) of a parameter from the Modbus table.
+
+    Missing limits of number parameters are NUMBER_FALLBACK_LIMITS.
+    """
+    info = ALL_PARAMS.get(code, {})
+    low, high = info.get("min"), info.get("max")
+    if code in ALL_WRITABLE_PARAMS:
+        fallback_low, fallback_high = NUMBER_FALLBACK_LIMITS
+        low = fallback_low if low is None else low
+        high = fallback_high if high is None else high
+    return low, high
+
+
+def _check_range(
+    code: str, value: float, limits: tuple[float | None, float | None]
+) -> None:
+    """Raise WarmLinkValidationError if value is outside the limits."""
+    low, high = limits
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise WarmLinkValidationError(
+            f"{code}={value} is outside the allowed range "
+            f"{'-inf' if low is None else low}..{'inf' if high is None else high}"
+        )
+
+
+def validate_value(
+    code: str, value: Any, limits: tuple[float | None, float | None]
+) -> str:
+    """Check a value to be written and return it as sent to the cloud.
+
+    Raises WarmLinkValidationError if the parameter is not writable or the
+    value does not fit its data type, step, options or (min, max) limits.
+    """
+    info = ALL_PARAMS.get(code)
+    if info is None or code not in WRITABLE_CODES:
+        raise WarmLinkValidationError(f"{code} is not a writable parameter")
+
+    if isinstance(value, bool):
+        value = int(value)
+    try:
+        number = float(value)
+    except (TypeError, ValueError) as ex:
+        raise WarmLinkValidationError(f"{code}={value!r} is not a number") from ex
+    if not math.isfinite(number):
+        raise WarmLinkValidationError(f"{code}={value!r} is not a finite number")
+
+    if (
+        code in ALL_SWITCH_PARAMS
+        or code in ALL_SELECT_PARAMS
+        or info.get("data_type") in _DISCRETE_TYPES
+    ):
+        if not number.is_integer():
+            raise WarmLinkValidationError(f"{code}={value} is not a whole number")
+        whole = int(number)
+        if code in ALL_SWITCH_PARAMS and whole not in (0, 1):
+            raise WarmLinkValidationError(f"{code}={whole} is not 0 or 1")
+        options = ENUM_OPTIONS.get(code)
+        if options is not None and whole not in options:
+            raise WarmLinkValidationError(
+                f"{code}={whole} is not one of {sorted(options)}"
+            )
+        _check_range(code, whole, limits)
+        return str(whole)
+
+    if info.get("data_type") not in _FREE_TYPES:
+        # Steps above 1 are UI increments, the device takes any whole value
+        step = min(float(info.get("step") or 1), 1.0)
+        ratio = number / step
+        if abs(ratio - round(ratio)) > _TOLERANCE:
+            raise WarmLinkValidationError(f"{code}={value} is not a multiple of {step}")
+    _check_range(code, number, limits)
+    return str(number)
+
+
+def is_current_value(current: Any, value: str) -> bool:
+    """Return True if a validated value equals the current value of its code."""
+    try:
+        return abs(float(current) - float(value)) <= _TOLERANCE
+    except (TypeError, ValueError):
+        return False
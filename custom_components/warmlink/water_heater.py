@@ -10,13 +10,13 @@ from homeassistant.components.water_heater import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import is_device_online
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_DEVICES_ADDED
 from .coordinator import WarmLinkCoordinator
+from .entity import WarmLinkEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,31 +31,41 @@ async def async_setup_entry(
 ) -> None:
     """Set up Warmlink water heater entities."""
     data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: WarmLinkCoordinator = data["coordinator"]
+    coordinators: dict[str, WarmLinkCoordinator] = data["coordinators"]
     
-    entities = []
-    for device_code, device_data in coordinator.data.items():
-        # Only add water heater if device has T04 (tank temperature)
-        parsed_data = device_data.get("_parsed_data", {})
-        if "T04" in parsed_data or "R01" in parsed_data:
-            entities.append(
-                WarmLinkWaterHeater(
-                    coordinator=coordinator,
-                    device_code=device_code,
-                    device_data=device_data,
+    @callback
+    def _async_add_devices(device_codes: list[str]) -> None:
+        """Create entities for the given devices."""
+        entities = []
+        for device_code in device_codes:
+            coordinator = coordinators[device_code]
+            device_data = coordinator.data
+            # Only add water heater if device has T04 (tank temperature)
+            parsed_data = device_data.get("_parsed_data", {})
+            if "T04" in parsed_data or "R01" in parsed_data:
+                entities.append(
+                    WarmLinkWaterHeater(
+                        coordinator=coordinator,
+                        device_code=device_code,
+                    )
                 )
-            )
     
-    async_add_entities(entities)
+        async_add_entities(entities)
+
+    _async_add_devices(list(coordinators))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICES_ADDED.format(entry.entry_id), _async_add_devices
+        )
+    )
 
 
-class WarmLinkWaterHeater(CoordinatorEntity[WarmLinkCoordinator], WaterHeaterEntity):
+class WarmLinkWaterHeater(WarmLinkEntity, WaterHeaterEntity):
     """Representation of a Warmlink water heater (hot water tank).
     
     VERIFIED: Uses _parsed_data for temperatures.
     """
 
-    _attr_has_entity_name = True
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_operation_list = OPERATION_MODES
     _attr_supported_features = (
@@ -69,36 +79,12 @@ class WarmLinkWaterHeater(CoordinatorEntity[WarmLinkCoordinator], WaterHeaterEnt
         self,
         coordinator: WarmLinkCoordinator,
         device_code: str,
-        device_data: dict[str, Any],
     ) -> None:
         """Initialize the water heater entity."""
         super().__init__(coordinator)
-        
-        self._device_code = device_code
-        
-        device_name = device_data.get("device_nick_name") or device_data.get("deviceNickName") or device_code
-        model = device_data.get("custModel") or device_data.get("productId") or "Heat Pump"
-        
+
         self._attr_unique_id = f"{DOMAIN}_{device_code}_water_heater"
         self._attr_name = "Zasobnik CWU"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_code)},
-            "name": device_name,
-            "manufacturer": "Phinx/Warmlink",
-            "model": model,
-        }
-
-    def _get_parsed_data(self) -> dict[str, Any]:
-        """Get parsed data from coordinator."""
-        device = self.coordinator.data.get(self._device_code, {})
-        return device.get("_parsed_data", {})
-
-    @property
-    def available(self) -> bool:
-        """Return True if device is online."""
-        device = self.coordinator.data.get(self._device_code, {})
-        return is_device_online(device) and super().available
 
     @property
     def current_temperature(self) -> float | None:
@@ -156,24 +142,19 @@ class WarmLinkWaterHeater(CoordinatorEntity[WarmLinkCoordinator], WaterHeaterEnt
         """Set target hot water temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
             # Set R01 - water setpoint
-            await self.coordinator.api.set_temperature(
-                self._device_code, "R01", temperature
-            )
-            await self.coordinator.async_request_refresh()
+            await self._async_write("R01", temperature)
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set operation mode."""
         if operation_mode == "off":
             # Turn off device
-            await self.coordinator.api.set_power(self._device_code, False)
+            await self._async_write("Power", 0)
         elif operation_mode == "eco":
             # Enable hot water mode (mode 3)
-            await self.coordinator.api.set_power(self._device_code, True)
-            await self.coordinator.api.set_mode(self._device_code, "3")
+            await self._async_write("Power", 1)
+            await self._async_write("Mode", "3")
         elif operation_mode == "boost":
             # Enable high temp disinfection - mode 3 + high setpoint
-            await self.coordinator.api.set_power(self._device_code, True)
-            await self.coordinator.api.set_mode(self._device_code, "3")
+            await self._async_write("Power", 1)
+            await self._async_write("Mode", "3")
             # TODO: Set high temperature for disinfection if needed
-        
-        await self.coordinator.async_request_refresh()
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """
-Generate parameters dictionary from Modbus CSV file.
-Exports WRITABLE_PARAMS, SENSOR_PARAMS with proper data types and ranges.
+Generate the parameter table from Modbus CSV file.
+Exports WRITABLE_PARAMS, SENSOR_PARAMS, SWITCH_PARAMS and SELECT_PARAMS
+(precompiled record tuples wrapped in ParamTable) with proper data types
+and ranges.
 """
 
 import csv
@@ -34,14 +36,42 @@ DATA_TYPE_DIVISOR = {
     "BINARY": 1,
 }
 
-def parse_range(range_str: str, data_type: str) -> tuple:
-    """Parse range string like '0~100' or '-30~60' into (min, max)."""
+# Register reference in a range, e.g. $1053$ (closing $ is missing in places)
+REF_PATTERN = re.compile(r"\$(\d+)\$?")
+
+def parse_ref_range(range_str: str, address_codes: dict) -> tuple:
+    """Parse range with register references like '$1053$~10'.
+    
+    Returns (min, max, min_ref, max_ref) where a *_ref is the code of the
+    parameter whose current value is the limit.
+    """
+    sides = range_str.split("~")
+    if len(sides) != 2:
+        return None, None, None, None
+    
+    result = []
+    for side in sides:
+        side = side.strip()
+        match = REF_PATTERN.fullmatch(side)
+        if match:
+            result.append((None, address_codes.get(int(match.group(1)))))
+            continue
+        try:
+            result.append((float(side), None))
+        except ValueError:
+            result.append((None, None))
+    
+    (min_val, min_ref), (max_val, max_ref) = result
+    return min_val, max_val, min_ref, max_ref
+
+def parse_range(range_str: str, data_type: str, address_codes: dict | None = None) -> tuple:
+    """Parse range string like '0~100' or '-30~60' into (min, max, min_ref, max_ref)."""
     if not range_str or range_str == "--" or range_str == "-":
-        return None, None
+        return None, None, None, None
     
     # Handle reference ranges like $1053$~10
     if "$" in range_str:
-        return None, None
+        return parse_ref_range(range_str, address_codes or {})
     
     # Clean up the string
     range_str = range_str.replace("℃", "").replace("°C", "").replace("r", "")
@@ -57,11 +87,11 @@ def parse_range(range_str: str, data_type: str) -> tuple:
         try:
             min_val = float(match.group(1))
             max_val = float(match.group(2))
-            return min_val, max_val
+            return min_val, max_val, None, None
         except ValueError:
-            return None, None
+            return None, None, None, None
     
-    return None, None
+    return None, None, None, None
 
 def get_category(code: str) -> str:
     """Determine category from parameter code."""
@@ -133,8 +163,12 @@ def parse_csv(filename: str):
     # Parse CSV
     reader = csv.reader(lines)
     header = next(reader, None)  # Skip header row
+    rows = [row for row in reader if len(row) >= 8 and row[0].strip().isdigit()]
+    
+    # Register address -> code, for ranges referencing other registers
+    address_codes = {int(row[0].strip()): row[2].strip() for row in rows}
     
-    for row in reader:
+    for row in rows:
         if len(row) < 8:
             continue
         
@@ -156,7 +190,7 @@ def parse_csv(filename: str):
         if code.isdigit():  # Skip unnamed parameters like "1014"
             continue
         
-        min_val, max_val = parse_range(range_str, data_type)
+        min_val, max_val, min_ref, max_ref = parse_range(range_str, data_type, address_codes)
         category = get_category(code)
         unit = get_unit(name, data_type, range_str)
         
@@ -173,6 +207,10 @@ def parse_csv(filename: str):
             param_info["min"] = min_val
         if max_val is not None:
             param_info["max"] = max_val
+        if min_ref:
+            param_info["min_ref"] = min_ref
+        if max_ref:
+            param_info["max_ref"] = max_ref
         
         # Determine step based on data type
         if data_type == "TEMP":
@@ -212,39 +250,38 @@ def parse_csv(filename: str):
     
     return writable_params, sensor_params, switch_params, select_params
 
-def print_dict(name: str, params: dict, indent: str = "    "):
-    """Print dictionary in Python format."""
-    print(f"{name} = {{")
+def format_field(value) -> str:
+    """Format a record field as a Python literal."""
+    if value is None:
+        return "None"
+    if isinstance(value, str):
+        return f'"{value}"'
+    return str(value)
+
+def print_records(name: str, params: dict, indent: str = "    "):
+    """Print parameters as a tuple of record tuples.
+    
+    Record layout: (code, name, address, data_type, category, min, max,
+    min_ref, max_ref, step, unit) - see FIELDS in params.py.
+    """
+    print(f"{name} = (")
     for code, info in sorted(params.items(), key=lambda x: (x[1].get("category", ""), x[0])):
-        # Format with code in name
-        category = info.get("category", "other")
-        data_type = info.get("data_type", "DIGI1")
-        unit = info.get("unit", "")
-        min_val = info.get("min")
-        max_val = info.get("max")
-        step = info.get("step", 1)
-        address = info.get("address", 0)
-        name_str = info.get("name", code)
-        
-        parts = [
-            f'"name": "{name_str}"',
-            f'"address": {address}',
-            f'"data_type": "{data_type}"',
-            f'"category": "{category}"',
+        fields = [
+            code,
+            info.get("name", code),
+            info.get("address", 0),
+            info.get("data_type", "DIGI1"),
+            info.get("category", "other"),
+            info.get("min"),
+            info.get("max"),
+            info.get("min_ref"),
+            info.get("max_ref"),
+            info.get("step", 1),
+            info.get("unit", ""),
         ]
-        
-        if min_val is not None:
-            parts.append(f'"min": {min_val}')
-        if max_val is not None:
-            parts.append(f'"max": {max_val}')
-        if step:
-            parts.append(f'"step": {step}')
-        if unit:
-            parts.append(f'"unit": "{unit}"')
-        
-        print(f'{indent}"{code}": {{{", ".join(parts)}}},')
+        print(f"{indent}({', '.join(format_field(field) for field in fields)}),")
     
-    print("}")
+    print(")")
 
 if __name__ == "__main__":
     csv_file = "modbus_kaisai_phnix.csv"
@@ -253,19 +290,23 @@ if __name__ == "__main__":
     
     print(f"# Generated from {csv_file}")
     print(f"# Total: {len(writable)} writable, {len(sensors)} sensors, {len(switches)} switches, {len(selects)} selects")
+    print("#")
+    print("# Records: (code, name, address, data_type, category, min, max, min_ref, max_ref, step, unit)")
+    print("# Tuples of constants load as one constant from the compiled module;")
+    print("# ParamTable builds its code -> record lookup on first use.")
+    print("from .params import ParamTable")
     print()
     
-    print("# WRITABLE PARAMETERS (Number entities)")
-    print_dict("WRITABLE_PARAMS", writable)
-    print()
-    
-    print("# SENSOR PARAMETERS (Read-only)")
-    print_dict("SENSOR_PARAMS", sensors)
-    print()
-    
-    print("# SWITCH PARAMETERS (Binary on/off)")
-    print_dict("SWITCH_PARAMS", switches)
-    print()
+    tables = (
+        ("WRITABLE", "WRITABLE PARAMETERS (Number entities)", writable),
+        ("SENSOR", "SENSOR PARAMETERS (Read-only)", sensors),
+        ("SWITCH", "SWITCH PARAMETERS (Binary on/off)", switches),
+        ("SELECT", "SELECT PARAMETERS (Multi-option)", selects),
+    )
+    for name, title, params in tables:
+        print(f"# {title}")
+        print_records(f"{name}_RECORDS", params)
+        print()
     
-    print("# SELECT PARAMETERS (Multi-option)")
-    print_dict("SELECT_PARAMS", selects)
+    for name, _, _ in tables:
+        print(f"{name}_PARAMS = ParamTable({name}_RECORDS)")